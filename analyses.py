@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+
+import keyword_engine
+import repurchase
+from customer_index import CustomerIndex
+from rfm_store import RFMStore
+from seller_engine import SellerMonths
+from variety_labels import by_label
+
+# RFM 분석 함수 (UID 코드 배열 기반 집계 + 분위 경계 점수)
+def calculate_rfm(df):
+    return RFMStore.from_orders(df).scores()
+
+
+# 품종/셀러/회원구분/주문경로별 재구매율 (재구매 횟수 칼럼 기준, 셀러는 주문 10건 이상)
+def repurchase_rates(df):
+    return repurchase.repurchase_rates(df, repurchase.REPURCHASE_DIMS, min_orders={'셀러명': 10})
+
+
+# 재구매 고객 구매 패턴 (UID별 주문 건수 2건 이상)
+# customers: df 기준 고객별 주문 순서 색인 (대시보드는 로드 시 만든 색인을 필터 결과로 좁혀 넘김, 없으면 여기서 만듦)
+def repurchase_pattern(df, customers=None):
+    customers = CustomerIndex(df) if customers is None else customers
+    counts = customers.counts()
+    user_counts = pd.Series(counts[counts > 0], index=customers.uids[counts > 0])
+    repeaters = counts >= 2
+    repeat_ids = customers.uids[repeaters]
+    if not repeaters.any():
+        return None
+
+    # 1. 재구매 빈도 분포 (주문 건수별 고객 수)
+    freq_dist = user_counts.value_counts().reset_index(name='customer_count')
+    freq_dist.columns = ['주문건수', '고객수']
+    freq_dist['구분'] = freq_dist['주문건수'].apply(lambda x: f"{x}회" if x < 5 else "5회 이상")
+    freq_summary = freq_dist.groupby('구분')['고객수'].sum().reset_index()
+
+    # 2. 구매 주기 분석 (같은 고객의 연속 주문 간 일수 차이, 색인의 인접 원소 차분)
+    intervals = pd.Series(customers.intervals(), name='interval')
+    to_second = customers.time_to_second()
+
+    # 3. 재구매 고객이 선호하는 품종 (콤보 주문은 포함된 품종마다 집계)
+    repeat_items = by_label(df[['품종']].iloc[customers.rows_of(repeaters)].groupby(
+        '품종', observed=True).size().reset_index(name='주문건수'), ['주문건수'])
+
+    summary_stats = pd.DataFrame({
+        '지표': ['총 재구매 고객 수', '평균 주문 횟수', '최대 주문 횟수', '평균 구매 주기', '첫 재구매까지 평균 일수'],
+        '수치': [
+            f"{len(repeat_ids):,}명",
+            f"{user_counts.loc[repeat_ids].mean():.2f}회",
+            f"{user_counts.max():,}회",
+            f"{intervals.mean():.1f}일" if not intervals.empty else "N/A",
+            f"{to_second.mean():.1f}일",
+        ]
+    })
+    return {
+        'freq_summary': freq_summary,
+        'intervals': intervals,
+        'repeat_items': repeat_items,
+        'summary_stats': summary_stats,
+    }
+
+
+# 범주형(category) 칼럼은 value_counts 결과에 0건 항목이 포함되므로 제외
+def count_values(series):
+    counts = series.value_counts()
+    return counts[counts > 0]
+
+
+# 주문 건수 상위 n개 셀러 (건수가 같으면 셀러명 순, SQL 백엔드와 공용)
+# seller_counts: 셀러명 순으로 정렬된 셀러별 주문 건수
+def top_sellers(seller_counts, n):
+    return seller_counts.sort_values(ascending=False, kind='stable').head(n).index.tolist()
+
+
+# 셀러명 순 셀러별 주문 건수 (0건 제외)
+def seller_counts(df):
+    counts = df['셀러명'].value_counts(sort=False).sort_index()
+    return counts[counts > 0]
+
+
+# 상위 15개 셀러별 주문경로 집계
+def seller_channel(df):
+    pairs = df.groupby(['셀러명', '주문경로'], observed=True).agg(
+        주문건수=('주문경로', 'size'), 고객주문건수=('UID', 'count')).reset_index()
+    return seller_channel_table(seller_counts(df), pairs)
+
+
+# 셀러별 주문 건수와 (셀러, 주문경로)별 주문 건수/UID가 있는 주문 건수 표로 상위 15개 셀러 채널 표 작성 (SQL 백엔드와 공용)
+def seller_channel_table(counts, pairs):
+    top_15_sellers = top_sellers(counts, 15)
+    pairs = pairs.astype({'셀러명': object, '주문경로': object})
+    pairs = pairs[pairs['셀러명'].isin(top_15_sellers)].reset_index(drop=True)
+
+    seller_channel = pairs[['셀러명', '주문경로', '주문건수']]
+
+    pivot_seller_ch = pairs.pivot(index='셀러명', columns='주문경로', values='고객주문건수').fillna(0).astype(np.int64)
+    pivot_seller_ch['합계'] = pivot_seller_ch.sum(axis=1)
+    # 주문경로가 모두 비어 있는 셀러도 0건 행으로 표시
+    pivot_seller_ch = pivot_seller_ch.reindex(top_15_sellers).fillna(0)
+    return {
+        'top_sellers': top_15_sellers,
+        'seller_channel': seller_channel,
+        'pivot': pivot_seller_ch,
+    }
+
+
+# 셀러 x 월 활동 행렬 (활동/유입/이탈, 코호트, 성장성 분석 공용)
+def seller_months(df):
+    return SellerMonths(df)
+
+
+# 셀러 월별 활동/유입/이탈 현황 (lag개월 전 대비 이탈)
+def seller_activity(df, lag=1):
+    engine = SellerMonths(df)
+    return None if engine.empty else engine.activity(lag)
+
+
+# 상위 30개 셀러의 키워드 활용 비중
+def seller_keywords(df):
+    top_30_sellers = top_sellers(seller_counts(df), 30)
+    in_top = df['셀러명'].isin(top_30_sellers).to_numpy()
+
+    # 로드 시 만든 키워드 비트마스크를 셀러별로 합산 (정규식 재검색 없음)
+    matched = keyword_engine.flag_matrix(keyword_engine.get_flags(df)[in_top])
+    sellers = df['셀러명'].to_numpy()[in_top]
+    by_seller = matched.groupby(sellers, sort=False)
+    return seller_keywords_table(top_30_sellers, by_seller.size(), by_seller.sum())
+
+
+# 셀러별 주문 건수와 셀러 x 카테고리 키워드 포함 주문 건수로 활용 비중(%) 표 작성 (SQL 백엔드와 공용)
+def seller_keywords_table(sellers, totals, hits):
+    sellers = pd.Index(sellers, dtype=object)
+    totals = totals.reindex(sellers)
+    df_seller_kw = hits.reindex(sellers).div(totals, axis=0) * 100
+    df_seller_kw.insert(0, '총주문건수', totals)
+    return df_seller_kw.rename_axis('셀러명').reset_index()
+
+
+# 최근 2개월 셀러 판매량 증감
+def seller_growth(df):
+    return SellerMonths(df).growth()
+
+
+# 상품 키워드 카테고리별 월 매출 비중
+def keyword_share(df):
+    months = df['주문일'].dt.to_period('M').astype(str).to_numpy()
+    sales = df['실결제 금액'].fillna(0).to_numpy()
+
+    monthly_total_sales = pd.Series(sales).groupby(months).sum()
+    if monthly_total_sales.empty:
+        return keyword_share_table(monthly_total_sales, None)
+
+    # 카테고리별 매출 = 키워드 포함 여부(0/1) x 실결제 금액 의 월별 합계
+    matched = keyword_engine.flag_matrix(keyword_engine.get_flags(df))
+    cat_monthly_sales = matched.mul(sales, axis=0).groupby(months).sum()
+    return keyword_share_table(monthly_total_sales, cat_monthly_sales)
+
+
+# 월별 전체 매출과 월 x 카테고리 매출로 비중 표 작성 (SQL 백엔드와 공용)
+def keyword_share_table(monthly_total_sales, cat_monthly_sales):
+    if monthly_total_sales.empty:
+        return pd.DataFrame(columns=['연월', '카테고리', '매출액', '비중(%)'])
+    df_kw_final = cat_monthly_sales.rename_axis('연월').reset_index().melt(
+        id_vars='연월', var_name='카테고리', value_name='매출액')
+    total = df_kw_final['연월'].map(monthly_total_sales).to_numpy()
+    df_kw_final['비중(%)'] = np.where(total > 0, df_kw_final['매출액'] / np.where(total > 0, total, 1) * 100, 0)
+    return df_kw_final
+
+
+# 필터 결과별로 캐시할 분석 목록 (이름 -> 함수)
+ANALYSES = {
+    'repurchase_rates': repurchase_rates,
+    'repurchase_pattern': repurchase_pattern,
+    'rfm': calculate_rfm,
+    'seller_channel': seller_channel,
+    'seller_months': seller_months,
+    'seller_keywords': seller_keywords,
+    'keyword_share': keyword_share,
+}
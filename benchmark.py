@@ -0,0 +1,199 @@
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import analyses
+import data_loader
+import order_cube
+import synth_orders
+from customer_index import CustomerIndex
+from filter_index import FilterIndex
+from sketches import OrderSketches
+
+# 합성 데이터 규모별 분석 시간/최대 메모리 벤치마크
+# 결과는 JSON으로 저장하며, --baseline으로 이전 결과와 비교해 느려진 단계를 표시합니다.
+
+DEFAULT_SIZES = '10k,100k,1m,10m'
+DEFAULT_OUTPUT = os.path.join(data_loader.CACHE_DIR, 'benchmark_results.json')
+# 기준 대비 이 비율 이상 느려지면 회귀로 표시
+DEFAULT_TOLERANCE = 0.2
+# 측정 잡음을 피하기 위해 이보다 작은 차이(초)는 무시
+MIN_REGRESSION_SECONDS = 0.005
+
+
+def parse_size(text):
+    """'10k', '1m', '2500' -> 정수 건수."""
+    text = text.strip().lower().replace('_', '')
+    scale = {'k': 10 ** 3, 'm': 10 ** 6}.get(text[-1:], 1)
+    return int(float(text[:-1] if scale > 1 else text) * scale)
+
+
+def synth_path(data_dir, rows, seed):
+    return os.path.join(data_dir, f'synth_{rows}_{seed}.csv')
+
+
+def ensure_synth(data_dir, rows, seed):
+    """규모별 합성 CSV를 만들어 두고 재사용합니다."""
+    os.makedirs(data_dir, exist_ok=True)
+    path = synth_path(data_dir, rows, seed)
+    if not os.path.exists(path):
+        start = time.perf_counter()
+        synth_orders.write_orders(f'{path}.tmp', rows, seed)
+        os.replace(f'{path}.tmp', path)
+        print(f"  합성 데이터 생성: {path} ({time.perf_counter() - start:.1f}초)")
+    return path
+
+
+def stages(path):
+    """(단계 이름, 함수) 목록. 함수는 이전 단계 결과(state)를 받아 사용합니다."""
+    def load(state):
+        state['df'] = data_loader.load_dataset(path, use_cache=False)
+
+    def run(name, func, *args, **kwargs):
+        return name, lambda state: func(state['df'], *args, **kwargs)
+
+    return [
+        ('load_and_preprocess', load),
+        run('build_cube', order_cube.build_cube),
+        run('filter_index', FilterIndex),
+        run('customer_index', CustomerIndex),
+        run('order_sketches', OrderSketches.from_orders),
+        run('calculate_rfm', analyses.calculate_rfm),
+        run('seller_activity', analyses.seller_activity),
+        run('seller_growth', analyses.seller_growth),
+        run('seller_channel', analyses.seller_channel),
+        run('seller_keywords', analyses.seller_keywords),
+        run('keyword_share', analyses.keyword_share),
+        run('repurchase_rates', analyses.repurchase_rates),
+        run('repurchase_pattern', analyses.repurchase_pattern),
+    ]
+
+
+def measure(func, state, repeat=1, memory=True):
+    """최소 실행 시간(초)과 tracemalloc 기준 최대 추가 메모리(MB)."""
+    seconds = math.inf
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func(state)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(state)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        finally:
+            tracemalloc.stop()
+    return seconds, peak_mb
+
+
+def run_size(rows, data_dir, seed=0, repeat=1, memory=True, only=None):
+    path = ensure_synth(data_dir, rows, seed)
+    state, results = {}, []
+    for name, func in stages(path):
+        # 데이터 로드는 이후 단계의 입력이므로 항상 실행
+        if only and name not in only and name != 'load_and_preprocess':
+            continue
+        seconds, peak_mb = measure(func, state, repeat if name != 'load_and_preprocess' else 1, memory)
+        results.append({'rows': rows, 'stage': name, 'seconds': round(seconds, 6),
+                        'peak_mb': None if peak_mb is None else round(peak_mb, 2)})
+        print(f"  {name:<22}{seconds:>10.3f}초" + ('' if peak_mb is None else f"{peak_mb:>12.1f}MB"))
+    results.append({'rows': rows, 'stage': 'dataset', 'seconds': None,
+                    'peak_mb': round(state['df'].memory_usage(deep=True).sum() / 2 ** 20, 2)})
+    del state
+    gc.collect()
+    return results
+
+
+def scaling(results):
+    """단계별로 인접 규모 사이의 시간 증가 지수 (log 시간 / log 건수). 1보다 크게 튀면 스케일링 절벽."""
+    table = pd.DataFrame([r for r in results if r['seconds']])
+    out = {}
+    for stage, part in table.sort_values('rows').groupby('stage', sort=False):
+        rows, secs = part['rows'].to_numpy(float), part['seconds'].to_numpy(float)
+        out[stage] = [
+            {'from': int(rows[i]), 'to': int(rows[i + 1]),
+             'exponent': round(float(np.log(secs[i + 1] / secs[i]) / np.log(rows[i + 1] / rows[i])), 3)}
+            for i in range(len(rows) - 1) if secs[i] > 0
+        ]
+    return out
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """기준 결과 대비 느려진 (rows, stage) 목록."""
+    base = {(r['rows'], r['stage']): r['seconds'] for r in baseline.get('results', []) if r.get('seconds')}
+    regressions = []
+    for r in results:
+        old = base.get((r['rows'], r['stage']))
+        if old and r['seconds'] and r['seconds'] > old * (1 + tolerance) and r['seconds'] - old >= MIN_REGRESSION_SECONDS:
+            regressions.append({'rows': r['rows'], 'stage': r['stage'], 'baseline': old,
+                                'seconds': r['seconds'], 'ratio': round(r['seconds'] / old, 3)})
+    return regressions
+
+
+def environment():
+    return {
+        'python': sys.version.split()[0],
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 데이터 규모별 분석 시간/메모리 벤치마크')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help=f'쉼표로 구분한 건수 (기본값: {DEFAULT_SIZES})')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f'결과 JSON 경로 (기본값: {DEFAULT_OUTPUT})')
+    parser.add_argument('--data-dir', default=os.path.join(data_loader.CACHE_DIR, 'bench'), help='합성 CSV 보관 폴더')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help='단계별 반복 횟수 (최소 시간 기록)')
+    parser.add_argument('--stages', default=None, help='실행할 단계 (쉼표 구분, 기본값: 전체)')
+    parser.add_argument('--no-memory', action='store_true', help='최대 메모리 측정 생략 (tracemalloc 추가 실행 없음)')
+    parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE, help='회귀로 볼 감속 비율')
+    args = parser.parse_args()
+
+    only = set(args.stages.split(',')) if args.stages else None
+    results = []
+    for rows in [parse_size(s) for s in args.sizes.split(',')]:
+        print(f"[{rows:,}건]")
+        results.extend(run_size(rows, args.data_dir, args.seed, args.repeat, not args.no_memory, only))
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': environment(),
+        'seed': args.seed,
+        'results': results,
+        'scaling': scaling(results),
+    }
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            report['regressions'] = compare(results, json.load(f), args.tolerance)
+        for r in report['regressions']:
+            print(f"회귀: {r['stage']} @ {r['rows']:,}건 {r['baseline']:.3f}초 -> {r['seconds']:.3f}초 (x{r['ratio']})")
+        exit_code = 1 if report['regressions'] else 0
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print(f"결과 저장: {args.output}")
+    sys.exit(exit_code)
+
+
+if __name__ == '__main__':
+    main()
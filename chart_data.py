@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+
+# 차트로 보내는 데이터 크기를 필터 결과 행 수와 무관하게 제한하는 축소 도구
+# - 시계열: LTTB(Largest-Triangle-Three-Buckets)로 모양을 유지하며 점 수를 줄임
+# - 히스토그램: 서버에서 구간별 개수를 미리 집계
+# - 산점도: 세그먼트별 비례 배분 + 해시 순서의 결정적 표본 추출
+
+
+def lttb(x, y, threshold):
+    """LTTB로 고른 점의 위치(정렬된 x 기준 인덱스 배열). 첫 점과 마지막 점은 항상 포함합니다.
+
+    threshold가 3보다 작으면(LTTB 최소 단위 미만) 첫 점과 마지막 점만 반환합니다.
+    """
+    n = len(x)
+    if threshold >= n:
+        return np.arange(n)
+    if threshold < 3:
+        return np.array([0, n - 1], dtype=np.int64)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    every = (n - 2) / (threshold - 2)
+    picked = np.empty(threshold, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        # 현재 버킷 [lo, hi)과 다음 버킷의 평균점
+        lo, hi = int(i * every) + 1, int((i + 1) * every) + 1
+        next_hi = min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        # 이전 선택점, 평균점과 만드는 삼각형 넓이가 가장 큰 점
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        picked[i + 1] = a
+    return picked
+
+
+def _axis_values(values):
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.to_numpy('datetime64[ns]').astype(np.int64)
+    return values.to_numpy(dtype=np.float64)
+
+
+def downsample_series(df, x, y, color=None, max_points=500, shared=False):
+    """시계열 데이터(긴 형식)를 차트 전체 max_points개 이하의 점으로 줄입니다.
+
+    계열(color)이 여러 개면 점 예산을 계열 수로 나눠 계열마다 max_points // 계열 수개까지 남깁니다.
+    계열이 max_points // 3개(계열당 LTTB 최소 3점)보다 많으면 y 합계가 작은 계열들을 '기타 (n개)' 한 계열로 합칩니다.
+    shared=True면 전체 합계 시계열에서 고른 x값을 모든 계열에 공통으로 사용합니다. (누적 영역 차트용)
+    """
+    df = df.sort_values(x)
+    if color is None:
+        return df.iloc[lttb(_axis_values(df[x]), df[y].to_numpy(dtype=np.float64), max_points)]
+    df = merge_small_series(df, x, y, color, max(1, max_points // 3))
+    groups = df.groupby(color, observed=True, sort=False)
+    per_series = max_points // max(groups.ngroups, 1)
+    if shared:
+        total = df.groupby(x, sort=True)[y].sum()
+        keep = total.index[lttb(_axis_values(total.index.to_series()), total.to_numpy(dtype=np.float64), per_series)]
+        return df[df[x].isin(keep)]
+    parts = [
+        part.iloc[lttb(_axis_values(part[x]), part[y].to_numpy(dtype=np.float64), per_series)]
+        for _, part in groups
+    ]
+    return pd.concat(parts) if parts else df
+
+
+def merge_small_series(df, x, y, color, max_series):
+    """계열이 max_series개보다 많으면 y 절댓값 합계 상위 max_series - 1개만 남기고 나머지를 x별 합계 한 계열로 합칩니다."""
+    totals = df[y].abs().groupby(df[color], observed=True, sort=False).sum()
+    if len(totals) <= max_series:
+        return df
+    kept = totals.sort_values(ascending=False, kind='stable').index[:max_series - 1]
+    small = ~df[color].isin(kept)
+    other = df[small].groupby(x, sort=True)[y].sum().reset_index()
+    other[color] = f'기타 ({len(totals) - len(kept)}개)'
+    df = df[~small].astype({color: object})
+    return pd.concat([df, other], ignore_index=True).sort_values(x, kind='stable')
+
+
+def histogram_bins(values, nbins=50, integer=False):
+    """구간별 개수(서버 집계). 반환 칼럼: 시작, 끝, 중앙, 개수, 폭.
+
+    integer=True면 구간 경계를 정수로 맞춥니다. (일수처럼 정수 값인 경우)
+    """
+    values = pd.Series(values).dropna().to_numpy(dtype=np.float64)
+    if len(values) == 0:
+        return pd.DataFrame(columns=['시작', '끝', '중앙', '개수', '폭'])
+    lo, hi = values.min(), values.max()
+    if integer:
+        width = max(1.0, np.ceil((hi - lo + 1) / nbins))
+        edges = np.arange(lo, hi + width + 1, width)
+        edges = edges[:int(np.searchsorted(edges, hi, side='right')) + 1]
+    else:
+        edges = np.histogram_bin_edges(values, bins=nbins)
+    counts, edges = np.histogram(values, bins=edges)
+    return pd.DataFrame({
+        '시작': edges[:-1],
+        '끝': edges[1:],
+        '중앙': (edges[:-1] + edges[1:]) / 2,
+        '개수': counts,
+        '폭': np.diff(edges),
+    })
+
+
+def stratified_sample(df, by, n, min_per_group=20):
+    """그룹(by)별 크기에 비례해 약 n행을 고르는 결정적 표본.
+
+    각 그룹에서는 인덱스 값 해시가 작은 행부터 고르므로, 같은 데이터면 실행할 때마다 같은 표본이고
+    필터가 바뀌어도 표본이 크게 흔들리지 않습니다. 작은 그룹도 최소 min_per_group행은 보입니다.
+    """
+    if len(df) <= n:
+        return df
+    sizes = df.groupby(by, observed=True, sort=False).size()
+    quota = np.maximum(np.floor(sizes / sizes.sum() * n), np.minimum(sizes, min_per_group)).astype(np.int64)
+    rank = pd.Series(pd.util.hash_array(df.index.to_numpy()), index=df.index)
+    order = rank.groupby(df[by].to_numpy()).rank(method='first')
+    keep = order.to_numpy() <= quota.reindex(df[by].to_numpy()).to_numpy()
+    return df[keep]
+
+
+def render_mode(points, threshold):
+    """점이 많으면 WebGL(scattergl)로 그립니다."""
+    return 'webgl' if points >= threshold else 'svg'
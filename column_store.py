@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+
+# 뒤에만 행을 덧붙이는(append-only) 저장소 (증분 반영용)
+# - AppendBuffer: 용량을 두 배씩 늘리는 numpy 버퍼. 값은 버퍼 앞부분의 뷰로 꺼내며,
+#   기존 값은 용량이 찰 때 한 번 재할당하는 것 말고는 복사하지 않음 (행당 상환 O(1))
+# - 이전에 꺼낸 뷰는 자기 길이까지만 보므로, 뒤에 덧붙여도 바뀌지 않음 (스냅샷 불변)
+# - ColumnStore: 데이터프레임 칼럼마다 AppendBuffer를 두고, frame은 버퍼 뷰로 만든 데이터프레임 (복사 없음)
+#   범주형 칼럼은 코드 버퍼 + 카테고리 목록으로 보관
+#   - 새 값이 기존 값보다 모두 뒤에 정렬되면 카테고리 끝에 붙임 (코드는 그대로)
+#   - 중간에 끼면 전체 로드와 같은 정렬 순서를 위해 그 칼럼의 코드만 다시 매김 (새 셀러/품종 등, 드묾)
+#   - unsorted_categories 칼럼(UID)은 처음 본 순서대로 끝에 붙이고 코드를 다시 매기지 않음
+#     (rfm_store.uid_codes가 조회 시 정렬 순서로 바꿔 줌)
+# 한계: 새 카테고리가 생기면 카테고리 목록(예: UID 고객 수) 검증, string 칼럼은 뷰를 감쌀 때 값 검증을 하므로
+# 전체 크기에 비례하는 읽기는 남음 (복사는 아님)
+
+
+class AppendBuffer:
+    """뒤에만 덧붙이는 numpy 배열 버퍼. view(size)는 앞 size개의 뷰입니다.
+
+    처음 받은 배열은 복사하지 않고 그대로 쓰며(앞부분은 덮어쓰지 않음), 덧붙일 자리가 없을 때만 두 배 용량으로 옮깁니다.
+    """
+
+    def __init__(self, values):
+        self._data = np.asarray(values)
+        self.size = len(self._data)
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    def view(self, size=None):
+        return self._data[:self.size if size is None else size]
+
+    def append(self, size, values):
+        """앞 size개 뒤에 values를 덧붙인 버퍼를 반환합니다.
+
+        size가 버퍼 길이와 다르면(이전 시점에서 다시 덧붙이면) 그 뒤의 값을 덮어쓰지 않도록 복사본에 덧붙입니다.
+        """
+        if len(values) == 0:
+            return self
+        buffer = self if size == self.size else AppendBuffer(self._data[:size])
+        end = size + len(values)
+        if end > len(buffer._data):
+            data = np.empty(max(end, 2 * len(buffer._data)), dtype=buffer._data.dtype)
+            data[:size] = buffer._data[:size]
+            buffer._data = data
+        buffer._data[size:end] = values
+        buffer.size = end
+        return buffer
+
+
+class _Categories:
+    """범주형 칼럼: 코드 버퍼 + 카테고리 목록."""
+
+    def __init__(self, values, sort=True):
+        self.codes = AppendBuffer(values.cat.codes.to_numpy())
+        self.dtype = values.dtype
+        self.sort = sort
+
+    def array(self, size):
+        return pd.Categorical.from_codes(self.codes.view(size), dtype=self.dtype, validate=False)
+
+    def append(self, size, values):
+        column = _Categories.__new__(_Categories)
+        column.sort = self.sort
+        categories = self.dtype.categories
+        # 추가분에서 실제로 쓰인 값만 (전처리에서 빠진 행의 값은 카테고리에 넣지 않음)
+        values = values.cat.remove_unused_categories()
+        new = values.cat.categories
+        missing = new[categories.get_indexer(new) < 0]
+        codes = self.codes
+        if len(missing) == 0:
+            column.dtype = self.dtype
+        elif not self.sort or self.dtype.ordered or len(categories) == 0 or missing.min() > categories[-1]:
+            column.dtype = pd.CategoricalDtype(categories.append(missing.sort_values()), self.dtype.ordered)
+        else:
+            column.dtype = pd.CategoricalDtype(categories.append(missing).sort_values())
+            codes = AppendBuffer(_recode(codes.view(size), column.dtype.categories.get_indexer(categories)))
+        tail = _recode(values.cat.codes.to_numpy(), column.dtype.categories.get_indexer(new))
+        # 카테고리 수가 늘어 코드 자료형이 커져야 하면 (127, 32767개 초과 등) 한 번만 넓혀 복사
+        dtype = pd.Categorical.from_codes(tail[:0], dtype=column.dtype).codes.dtype
+        if dtype != codes.dtype:
+            codes = AppendBuffer(codes.view(size).astype(dtype))
+        column.codes = codes.append(size, tail.astype(dtype, copy=False))
+        return column
+
+
+def _recode(codes, mapping):
+    # 이전 코드 -> 새 카테고리 목록 기준 코드 (결측 -1은 그대로)
+    return np.where(codes >= 0, mapping[codes], -1)
+
+
+class _Values:
+    """numpy 자료형 칼럼 (실수, 정수, 일시 등)."""
+
+    def __init__(self, values):
+        self.values = AppendBuffer(values.to_numpy())
+
+    def array(self, size):
+        return self.values.view(size)
+
+    def append(self, size, values):
+        column = _Values.__new__(_Values)
+        column.values = self.values.append(size, values.to_numpy(dtype=self.values.dtype))
+        return column
+
+
+class _Strings:
+    """string[python] 칼럼: 문자열 object 배열 버퍼."""
+
+    def __init__(self, values):
+        self.values = AppendBuffer(values.array.to_numpy(dtype=object))
+
+    def array(self, size):
+        return pd.arrays.StringArray(self.values.view(size))
+
+    def append(self, size, values):
+        column = _Strings.__new__(_Strings)
+        column.values = self.values.append(size, values.astype('string[python]').array.to_numpy(dtype=object))
+        return column
+
+
+class _Masked:
+    """결측 마스크가 있는 칼럼(Int32 등): 값 버퍼 + 마스크 버퍼."""
+
+    def __init__(self, values):
+        self.dtype = values.dtype
+        self.data, self.mask = (AppendBuffer(a) for a in self._split(values))
+
+    def _split(self, values):
+        array = values.astype(self.dtype).array
+        return array.to_numpy(dtype=self.dtype.numpy_dtype, na_value=0), np.asarray(array.isna())
+
+    def array(self, size):
+        return self.dtype.construct_array_type()(self.data.view(size), self.mask.view(size), copy=False)
+
+    def append(self, size, values):
+        data, mask = self._split(values)
+        column = _Masked.__new__(_Masked)
+        column.dtype = self.dtype
+        column.data = self.data.append(size, data)
+        column.mask = self.mask.append(size, mask)
+        return column
+
+
+class _Concat:
+    """그 밖의 확장 자료형: 버퍼로 보관할 수 없어 덧붙일 때마다 이어 붙임 (복사)."""
+
+    def __init__(self, values):
+        self.values = values.array
+
+    def array(self, size):
+        return self.values[:size]
+
+    def append(self, size, values):
+        column = _Concat.__new__(_Concat)
+        column.values = pd.concat([pd.Series(self.values[:size]), values.astype(self.values.dtype)], ignore_index=True).array
+        return column
+
+
+def _column(values, sort=True):
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _Categories(values, sort)
+    if isinstance(dtype, pd.StringDtype) and dtype.storage == 'python':
+        return _Strings(values)
+    if isinstance(values.array, (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)):
+        return _Masked(values)
+    if isinstance(dtype, np.dtype):
+        return _Values(values)
+    return _Concat(values)
+
+
+class ColumnStore:
+    """데이터프레임을 칼럼별 append-only 버퍼로 보관하는 저장소. frame이 현재 데이터프레임(버퍼 뷰)입니다.
+
+    append는 행을 덧붙인 새 저장소를 반환하며, 이전 저장소의 frame은 바뀌지 않습니다.
+    unsorted_categories 칼럼은 새 카테고리를 정렬하지 않고 처음 본 순서대로 끝에 붙입니다.
+    """
+
+    def __init__(self, df, unsorted_categories=()):
+        self._columns = {col: _column(df[col], col not in unsorted_categories) for col in df.columns}
+        self.frame = self._frame(len(df))
+
+    def _frame(self, size):
+        return pd.DataFrame({col: column.array(size) for col, column in self._columns.items()}, copy=False)
+
+    def append(self, df):
+        """df(같은 칼럼)의 행을 뒤에 덧붙인 새 저장소."""
+        size = len(self.frame)
+        store = ColumnStore.__new__(ColumnStore)
+        store._columns = {col: column.append(size, df[col]) for col, column in self._columns.items()}
+        store.frame = store._frame(size + len(df))
+        return store
@@ -0,0 +1,19 @@
+import pytest
+
+import data_loader
+import synth_orders
+
+# 엔진별 동등성 테스트 공용 데이터: 고정 시드 합성 주문을 전처리한 데이터프레임
+SYNTH_ROWS = 3000
+SYNTH_SEED = 7
+
+
+@pytest.fixture(scope='session')
+def orders_csv(tmp_path_factory):
+    return str(synth_orders.write_orders(tmp_path_factory.mktemp('orders') / 'orders.csv', SYNTH_ROWS, seed=SYNTH_SEED))
+
+
+@pytest.fixture(scope='session')
+def orders(orders_csv):
+    """전처리된 합성 주문 (세션 공용이므로 테스트에서 수정하지 않음)."""
+    return data_loader.load_dataset(orders_csv, use_cache=False)
@@ -0,0 +1,80 @@
+import numpy as np
+
+from rfm_store import DAY_NS, uid_codes
+
+
+class CustomerIndex:
+    """고객별 주문 순서 색인 (CSR 형식).
+
+    주문 행 번호를 (UID 코드, 주문 시각) 순으로 정렬한 rows 배열과, 고객 c의 주문이
+    rows[offsets[c]:offsets[c + 1]]에 오도록 하는 offsets 배열로 이루어집니다.
+    고객별 주문 수, 연속 주문 간격, n번째 주문, 두 번째 주문까지 걸린 일수를 정렬 없이 배열 구간/차분으로 계산합니다.
+    """
+
+    def __init__(self, df):
+        codes, uids = uid_codes(df['UID'])
+        times = df['주문일'].to_numpy('datetime64[ns]').astype(np.int64)
+        valid = np.flatnonzero(codes >= 0)
+        # UID 코드, 같은 고객 안에서는 주문 시각 순 (동시각은 행 순서 유지)
+        rows = valid[np.lexsort((times[valid], codes[valid]))]
+        self._set(uids, rows, times[rows], np.bincount(codes[valid], minlength=len(uids)), len(df))
+
+    def _set(self, uids, rows, times, counts, n_rows):
+        self.uids = uids
+        self.rows = rows
+        self.times = times
+        self.offsets = np.zeros(len(uids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+        # 색인을 만든 데이터프레임의 행 수
+        self.n_rows = n_rows
+
+    def counts(self):
+        """고객(UID 코드)별 주문 수."""
+        return np.diff(self.offsets)
+
+    def customer_of(self):
+        """정렬 위치별 고객 코드."""
+        return np.repeat(np.arange(len(self.uids)), self.counts())
+
+    def restrict(self, ids):
+        """행 번호 ids(오름차순, 예: FilterIndex.select 결과)만 남긴 색인. 다시 정렬하지 않습니다.
+
+        결과 색인의 rows는 df.take(ids)로 만든 필터 결과 데이터프레임 기준의 위치입니다.
+        """
+        position = np.full(self.n_rows, -1, dtype=np.int64)
+        position[ids] = np.arange(len(ids))
+        new_rows = position[self.rows]
+        keep = new_rows >= 0
+        index = CustomerIndex.__new__(CustomerIndex)
+        counts = np.bincount(self.customer_of()[keep], minlength=len(self.uids))
+        index._set(self.uids, new_rows[keep], self.times[keep], counts, len(ids))
+        return index
+
+    def rows_of(self, customers):
+        """고객 코드 목록(또는 불리언 마스크)에 해당하는 주문 행 번호 (고객, 시각 순)."""
+        counts = self.counts()
+        if getattr(customers, 'dtype', None) == bool:
+            customers = np.flatnonzero(customers)
+        starts = self.offsets[customers]
+        lengths = counts[customers]
+        # 고객별 [start, start + length) 구간을 이어 붙인 위치
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        return self.rows[positions]
+
+    def intervals(self):
+        """같은 고객의 연속 주문 간격(일, 소수점 버림). 고객, 시각 순."""
+        first = np.zeros(len(self.times), dtype=bool)
+        counts = self.counts()
+        first[self.offsets[:-1][counts > 0]] = True
+        gaps = np.diff(self.times, prepend=self.times[:1])
+        return gaps[~first] // DAY_NS
+
+    def nth(self, n):
+        """n번째(1부터) 주문이 있는 고객 코드와 그 주문의 정렬 위치."""
+        customers = np.flatnonzero(self.counts() >= n)
+        return customers, self.offsets[customers] + (n - 1)
+
+    def time_to_second(self):
+        """두 번째 주문이 있는 고객의 첫 주문 -> 두 번째 주문 소요 일수 (소수점 버림)."""
+        _, second = self.nth(2)
+        return (self.times[second] - self.times[second - 1]) // DAY_NS
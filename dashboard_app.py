@@ -1,547 +1,811 @@
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import os
-from datetime import datetime
-import numpy as np
-
-# 페이지 설정
-st.set_page_config(page_title="종합 주문 분석 대시보드 (V2)", layout="wide")
-
-# Plotly 한글 깨짐 방지 템플릿 설정
-import plotly.io as pio
-pio.templates.default = "plotly_white"
-
-# 데이터 로드 및 전처리 (캐싱)
-@st.cache_data
-def load_and_preprocess(file_path):
-    if not os.path.exists(file_path):
-        return None
-    
-    try:
-        df = pd.read_csv(file_path, encoding='utf-8-sig')
-    except:
-        df = pd.read_csv(file_path, encoding='cp949')
-    
-    # 날짜 처리
-    if '주문일' in df.columns:
-        df['주문일'] = pd.to_datetime(df['주문일'], errors='coerce')
-        df = df.dropna(subset=['주문일'])
-    
-    # 금액 처리
-    price_cols = ['결제금액', '실결제 금액', '판매단가', '공급단가']
-    for col in price_cols:
-        if col in df.columns and df[col].dtype == 'object':
-            df[col] = df[col].str.replace(',', '').astype(float)
-    
-    # 시즌 정보 추가
-    def get_season(month):
-        if month in [3, 4, 5]: return '봄'
-        elif month in [6, 7, 8]: return '여름'
-        elif month in [9, 10, 11]: return '가을'
-        else: return '겨울'
-    df['시즌'] = df['주문일'].dt.month.apply(get_season)
-    
-    return df
-
-# RFM 분석 함수
-def calculate_rfm(df):
-    if df.empty:
-        return pd.DataFrame(columns=['Recency', 'Frequency', 'Monetary', 'R_Score', 'F_Score', 'M_Score', 'Total_Score', 'Segment'])
-        
-    snapshot_date = df['주문일'].max() + pd.Timedelta(days=1)
-    
-    # 식별자: UID (원복)
-    rfm = df.groupby('UID').agg({
-        '주문일': lambda x: (snapshot_date - x.max()).days,
-        'UID': 'count',
-        '실결제 금액': 'sum'
-    })
-    rfm.columns = ['Recency', 'Frequency', 'Monetary']
-    
-    # 5점 척도 스코어링
-    for col, labels in [('Recency', [5,4,3,2,1]), ('Frequency', [1,2,3,4,5]), ('Monetary', [1,2,3,4,5])]:
-        try:
-            rfm[f'{col[0]}_Score'] = pd.qcut(rfm[col].rank(method='first'), 5, labels=labels)
-        except:
-            try:
-                rfm[f'{col[0]}_Score'] = pd.cut(rfm[col], 5, labels=labels)
-            except:
-                rfm[f'{col[0]}_Score'] = 3
-            
-    for score_col in ['R_Score', 'F_Score', 'M_Score']:
-        rfm[score_col] = pd.to_numeric(rfm[score_col], errors='coerce').fillna(3).astype(int)
-        
-    rfm['Total_Score'] = rfm['R_Score'] + rfm['F_Score'] + rfm['M_Score']
-    
-    def segment_customer(score):
-        if score >= 13: return 'VVIP (최상위)'
-        elif score >= 10: return 'VIP (우수)'
-        elif score >= 7: return 'Regular (일반)'
-        else: return 'At-risk (이탈우려)'
-    rfm['Segment'] = rfm['Total_Score'].apply(segment_customer)
-    return rfm
-
-# 앱 시작
-data_path ='project1_5959.csv'
-df_raw = load_and_preprocess(data_path)
-
-if df_raw is not None:
-    # --- 사이드바 필터 ---
-    st.sidebar.title("🌲 분석 필터")
-    
-    # 품종 검색 (복수 선택)
-    all_varieties = sorted(df_raw['품종'].unique().tolist())
-    selected_varieties = st.sidebar.multiselect(
-        "🏷️ 분석할 품종 선택 (검색 가능)",
-        options=all_varieties,
-        default=['감귤', '황금향'] if '감귤' in all_varieties else all_varieties[:2]
-    )
-    
-    # 날짜 범위
-    min_d, max_d = df_raw['주문일'].min().date(), df_raw['주문일'].max().date()
-    date_input = st.sidebar.date_input("📅 기간 선택", [min_d, max_d])
-    
-    # 데이터 필터링 적용
-    mask = df_raw['품종'].isin(selected_varieties) if selected_varieties else df_raw['품종'].notnull()
-    if len(date_input) == 2:
-        mask &= (df_raw['주문일'].dt.date >= date_input[0]) & (df_raw['주문일'].dt.date <= date_input[1])
-    df = df_raw[mask]
-
-    # --- 메인 대시보드 UI ---
-    st.title("📊 통합 데이터 분석 대시보드 (v2.1)")
-    st.info("`generate_final_report.py`의 분석 항목을 실시간으로 시각화합니다.")
-
-    # 재구매 지표 원복 (재구매 횟수 칼럼 기준)
-    repeat_users = df[df['재구매 횟수'] > 0]
-    repeat_rate = (len(repeat_users) / len(df) * 100) if len(df) > 0 else 0
-
-    # 상단 지표 레이아웃 및 출력
-    cols_kpi = st.columns(4)
-    cols_kpi[0].metric("총 주문 건수", f"{len(df):,}건")
-    cols_kpi[1].metric("총 매출액", f"₩{int(df['실결제 금액'].sum()):,}원")
-    cols_kpi[2].metric("평균 객단가", f"₩{int(df['실결제 금액'].mean()):,}원" if len(df)>0 else "0")
-    cols_kpi[3].metric("전체 재구매율", f"{repeat_rate:.1f}%")
-
-    # 탭 구성
-    t1, t2, t3, t4, t5, t6, t7 = st.tabs(["📈 트렌드 비교", "🍂 시즌 & 재구매", "👥 RFM 고객 분석", "📍 기초 EDA", "🛍️ 셀러별 채널 분석", "🔍 키워드 매출 분석", "📋 상세 데이터"])
-
-    with t1:
-        st.subheader("키워드 기반 주문/매출 트렌드")
-        col_t1, col_t2 = st.columns(2)
-        with col_t1:
-            trend_count = df.groupby([df['주문일'].dt.date, '품종']).size().reset_index(name='주문건수')
-            fig1 = px.line(trend_count, x='주문일', y='주문건수', color='품종', title="일자별 주문 건수 추이")
-            st.plotly_chart(fig1, use_container_width=True)
-        with col_t2:
-            trend_sales = df.groupby([df['주문일'].dt.date, '품종'])['실결제 금액'].sum().reset_index()
-            fig2 = px.area(trend_sales, x='주문일', y='실결제 금액', color='품종', title="일자별 매출액 추이")
-            st.plotly_chart(fig2, use_container_width=True)
-
-    with t2:
-        st.subheader("시즌별 판매 및 재구매율 분석")
-        col_s1, col_s2 = st.columns(2)
-        with col_s1:
-            season_counts = df['시즌'].value_counts().reset_index(name='order_count')
-            season_counts.columns = ['시즌', 'count']
-            fig_s = px.bar(season_counts, x='시즌', y='count', color='시즌', title="시즌별 주문 비중", 
-                           category_orders={"시즌": ["봄", "여름", "가을", "겨울"]})
-            st.plotly_chart(fig_s, use_container_width=True)
-        with col_s2:
-            # 품종별 재구매율 원복 (재구매 횟수 칼럼 기준)
-            re_rate_logic = df.groupby('품종').apply(
-                lambda x: (x['재구매 횟수'] > 0).mean() * 100
-            ).reset_index(name='재구매율(%)')
-            
-            fig_re = px.bar(re_rate_logic.sort_values('재구매율(%)', ascending=False).head(10), 
-                            x='재구매율(%)', y='품종', orientation='h', title="품종별 재구매율 Top 10", color='재구매율(%)')
-            st.plotly_chart(fig_re, use_container_width=True)
-
-        st.divider()
-        st.subheader("🔁 재구매 고객 구매 패턴 상세 분석")
-        
-        # 재구매 데이터 필터링 (UID별 주문 건수 2건 이상)
-        user_counts = df.groupby('UID').size()
-        repeat_ids = user_counts[user_counts >= 2].index
-        df_target = df[df['UID'].isin(repeat_ids)].copy()
-        
-        if not df_target.empty:
-            col_p1, col_p2 = st.columns(2)
-            
-            with col_p1:
-                # 1. 재구매 빈도 분포 (주문 건수별 고객 수)
-                freq_dist = user_counts.value_counts().reset_index(name='customer_count')
-                freq_dist.columns = ['주문건수', '고객수']
-                freq_dist['구분'] = freq_dist['주문건수'].apply(lambda x: f"{x}회" if x < 5 else "5회 이상")
-                freq_summary = freq_dist.groupby('구분')['고객수'].sum().reset_index()
-                
-                fig_freq = px.pie(freq_summary, values='고객수', names='구분', title="고객별 총 주문 횟수 비중",
-                                  hole=0.4, color_discrete_sequence=px.colors.sequential.RdBu)
-                st.plotly_chart(fig_freq, use_container_width=True)
-                
-            with col_p2:
-                # 2. 구매 주기 분석 (연속 주문 간의 일수 차이)
-                df_target = df_target.sort_values(['UID', '주문일'])
-                df_target['prev_date'] = df_target.groupby('UID')['주문일'].shift(1)
-                df_target['interval'] = (df_target['주문일'] - df_target['prev_date']).dt.days
-                intervals = df_target['interval'].dropna()
-                
-                if not intervals.empty:
-                    fig_dist = px.histogram(intervals, x='interval', nbins=50, title="재구매 고객의 방문 간격 분포 (Days)",
-                                            color_discrete_sequence=['indianred'])
-                    st.plotly_chart(fig_dist, use_container_width=True)
-                    st.info(f"💡 재구매 고객의 평균 구매 주기는 약 **{intervals.mean():.1f}일**입니다.")
-            
-            # 3. 재구매 고객이 선호하는 품종 Top 10
-            st.markdown("#### ⭐ 재구매 고객의 주요 구매 품종")
-            df_repeat_items = df_target.groupby('품종').size().reset_index(name='주문건수')
-            fig_rep_items = px.bar(df_repeat_items.sort_values('주문건수', ascending=False).head(10),
-                                   x='주문건수', y='품종', orientation='h', title="재구매 고객이 많이 찾은 품종 Top 10")
-            st.plotly_chart(fig_rep_items, use_container_width=True)
-
-            # 데이터 표
-            st.markdown("#### 재구매 행동 지표 요약")
-            summary_stats = pd.DataFrame({
-                '지표': ['총 재구매 고객 수', '평균 주문 횟수', '최대 주문 횟수', '평균 구매 주기'],
-                '수치': [
-                    f"{len(repeat_ids):,}명",
-                    f"{user_counts.loc[repeat_ids].mean():.2f}회",
-                    f"{user_counts.max():,}회",
-                    f"{intervals.mean():.1f}일" if not intervals.empty else "N/A"
-                ]
-            })
-            st.table(summary_stats)
-        else:
-            st.info("재구매 고객 데이터가 충분하지 않습니다.")
-
-    with t3:
-        st.subheader("RFM 고객 세분화 분석")
-        rfm_data = calculate_rfm(df)
-        col_r1, col_r2 = st.columns([1, 2])
-        with col_r1:
-            seg_counts = rfm_data['Segment'].value_counts().reset_index(name='customer_count')
-            if not seg_counts.empty and seg_counts['customer_count'].sum() > 0:
-                fig_pie = px.pie(seg_counts, values='customer_count', names='Segment', title="고객 세그먼트 비중",
-                                 color_discrete_sequence=px.colors.qualitative.Pastel)
-                st.plotly_chart(fig_pie, use_container_width=True)
-            else:
-                st.info("세그먼트 비중을 표시할 데이터가 없습니다.")
-        with col_r2:
-            seg_stats = rfm_data.groupby('Segment')[['Recency', 'Frequency', 'Monetary']].mean().reset_index()
-            # 포맷팅용 가공
-            seg_stats_display = seg_stats.copy()
-            seg_stats_display['Monetary'] = seg_stats_display['Monetary'].apply(lambda x: f"₩{int(x):,}")
-            st.dataframe(seg_stats_display, use_container_width=True)
-            
-            if not rfm_data.empty:
-                fig_scatter = px.scatter(rfm_data.sample(min(len(rfm_data), 1000)), x='Frequency', y='Monetary', color='Segment', 
-                                        size='Recency', log_x=True, title="고객 세그먼트 산점도 (샘플링)")
-                st.plotly_chart(fig_scatter, use_container_width=True)
-            else:
-                st.info("산점도를 표시할 고객 데이터가 없습니다.")
-
-        st.divider()
-        st.subheader("👨‍🌾 셀러별 재구매율 현황")
-        if '셀러명' in df.columns and '재구매 횟수' in df.columns:
-            # 셀러별 재구매율 원복 (재구매 횟수 칼럼 기준)
-            seller_re_rate = df[df['셀러명'].isin(df['셀러명'].value_counts()[df['셀러명'].value_counts() >= 10].index)].groupby('셀러명').apply(
-                lambda x: (x['재구매 횟수'] > 0).mean() * 100
-            ).reset_index(name='재구매율(%)')
-            
-            fig_seller_re = px.bar(seller_re_rate.sort_values('재구매율(%)', ascending=False).head(20),
-                                   x='재구매율(%)', y='셀러명', orientation='h', 
-                                   title="셀러별 재구매율 Top 20 (주문 10건 이상)",
-                                   color='재구매율(%)', color_continuous_scale='Viridis')
-            st.plotly_chart(fig_seller_re, use_container_width=True)
-        else:
-            st.warning("'셀러명' 또는 '재구매 횟수' 데이터가 부족합니다.")
-
-    with t4:
-        st.subheader("지역 및 채널 분석")
-        col_e1, col_e2 = st.columns(2)
-        with col_e1:
-            if '광역지역(정식)' in df.columns:
-                reg_df = df['광역지역(정식)'].value_counts().reset_index(name='order_count')
-                reg_df.columns = ['광역지역(정식)', 'count']
-                fig_reg = px.bar(reg_df.head(10), x='count', y='광역지역(정식)', orientation='h', title="지역별 주문 Top 10")
-                st.plotly_chart(fig_reg, use_container_width=True)
-        with col_e2:
-            if '주문경로' in df.columns:
-                ch_df = df['주문경로'].value_counts().reset_index(name='order_count')
-                ch_df.columns = ['주문경로', 'count']
-                fig_ch = px.pie(ch_df, values='count', names='주문경로', title="주문 채널 비중")
-                st.plotly_chart(fig_ch, use_container_width=True)
-
-    with t5:
-        st.subheader("상위 15개 셀러별 주문경로 분석")
-        if '셀러명' in df.columns and '주문경로' in df.columns:
-            # 상위 15개 셀러 추출
-            top_15_sellers = df['셀러명'].value_counts().head(15).index.tolist()
-            df_top_sellers = df[df['셀러명'].isin(top_15_sellers)]
-            
-            # 셀러별 주문경로 집계
-            seller_channel = df_top_sellers.groupby(['셀러명', '주문경로']).size().reset_index(name='주문건수')
-            
-            # 시각화 (누적 막대 그래프)
-            fig_seller_ch = px.bar(seller_channel, x='주문건수', y='셀러명', color='주문경로', 
-                                   title="상위 15개 셀러의 주문 유입 채널", orientation='h',
-                                   category_orders={"셀러명": top_15_sellers})
-            st.plotly_chart(fig_seller_ch, use_container_width=True)
-            
-            # 데이터 표 (Pivot Table)
-            st.markdown("#### 셀러별 채널별 주문 건수 상세")
-            pivot_seller_ch = df_top_sellers.pivot_table(index='셀러명', columns='주문경로', 
-                                                         values='UID', aggfunc='count', fill_value=0)
-            pivot_seller_ch['합계'] = pivot_seller_ch.sum(axis=1)
-            # KeyError 방지: 인덱스에 있는 셀러만 loc 시도
-            pivot_seller_ch = pivot_seller_ch.reindex(top_15_sellers).fillna(0)
-            st.dataframe(pivot_seller_ch, use_container_width=True)
-
-            # --- 셀러 월별 활동/유입/이탈 분석 추가 ---
-            st.divider()
-            st.subheader("📅 셀러 월별 활동 및 유입/이탈 현황")
-            
-            # 월별 데이터 준비 (결측치 제거하여 KeyError 방지)
-            df_seller_active = df.dropna(subset=['셀러명', '주문일']).copy()
-            if not df_seller_active.empty:
-                df_seller_active['연월'] = df_seller_active['주문일'].dt.to_period('M').astype(str)
-                
-                # 월별 활동 셀러 리스트 생성
-                monthly_sellers = df_seller_active.groupby('연월')['셀러명'].unique().to_dict()
-                months = sorted(monthly_sellers.keys())
-                
-                activity_stats = []
-                first_seen = df_seller_active.groupby('셀러명')['연월'].min().to_dict()
-                
-                for i, month in enumerate(months):
-                    current_sellers = set(monthly_sellers[month])
-                    # 유입: 이번 달에 처음 본 셀러 수
-                    new_sellers = sum(1 for s in current_sellers if s in first_seen and first_seen[s] == month)
-                    
-                    # 이탈율 계산: 지난달엔 있었는데 이번달엔 없는 셀러 (첫 달 제외)
-                    churn_rate = 0
-                    if i > 0:
-                        prev_sellers = set(monthly_sellers[months[i-1]])
-                        churned_sellers = prev_sellers - current_sellers
-                        churn_rate = (len(churned_sellers) / len(prev_sellers)) * 100
-                    
-                    inflow_rate = (new_sellers / len(current_sellers)) * 100
-                    
-                    activity_stats.append({
-                        '연월': month,
-                        '활동셀러수': len(current_sellers),
-                        '신규모집셀러': new_sellers,
-                        '유입율(%)': inflow_rate,
-                        '이탈율(%)': churn_rate
-                    })
-                
-                df_activity = pd.DataFrame(activity_stats)
-                
-                if not df_activity.empty:
-                    # 시각화 1: 활동 셀러 및 신규 셀러 추이
-                    fig_act = go.Figure()
-                    fig_act.add_trace(go.Bar(x=df_activity['연월'], y=df_activity['활동셀러수'], name='전체 활동 셀러', marker_color='skyblue'))
-                    fig_act.add_trace(go.Bar(x=df_activity['연월'], y=df_activity['신규모집셀러'], name='신규 유입 셀러', marker_color='orange'))
-                    fig_act.update_layout(title="월별 활동 및 신규 셀러 수 추이", barmode='group')
-                    st.plotly_chart(fig_act, use_container_width=True)
-                    
-                    # 시각화 2: 유입율 및 이탈율 추이
-                    fig_rate = px.line(df_activity, x='연월', y=['유입율(%)', '이탈율(%)'], 
-                                       markers=True, title="월별 셀러 유입율 및 이탈율 변화")
-                    st.plotly_chart(fig_rate, use_container_width=True)
-                    
-                    # 요약 지표
-                    st.markdown("#### 셀러 활동 지표 요약 (월별)")
-                    st.dataframe(df_activity.style.format({
-                        '유입율(%)': '{:.1f}%',
-                        '이탈율(%)': '{:.1f}%'
-                    }), use_container_width=True)
-
-                    # --- 상위 30개 셀러 키워드 전략 분석 추가 ---
-                    st.divider()
-                    st.subheader("🎯 상위 30개 셀러의 키워드 활용 전략")
-                    
-                    if '상품명' in df.columns:
-                        # 상위 30개 셀러 추출
-                        top_30_sellers = df['셀러명'].value_counts().head(30).index.tolist()
-                        df_top_30 = df[df['셀러명'].isin(top_30_sellers)].copy()
-                        df_top_30['상품명_clean'] = df_top_30['상품명'].fillna('')
-                        
-                        kw_categories = {
-                            '이벤트': ['1\+1', '사전예약'],
-                            '맛강조': ['과즙폭발', '꿀', '당도'],
-                            '가성비': ['실속'],
-                            '품종': ['타이벡', '조생'],
-                            '원산지': ['제주', '해남']
-                        }
-                        
-                        seller_kw_list = []
-                        for seller in top_30_sellers:
-                            df_s = df_top_30[df_top_30['셀러명'] == seller]
-                            total_s = len(df_s)
-                            
-                            row = {'셀러명': seller, '총주문건수': total_s}
-                            for cat, keywords in kw_categories.items():
-                                pattern = '|'.join(keywords)
-                                count = df_s['상품명_clean'].str.contains(pattern, case=False, regex=True).sum()
-                                row[cat] = (count / total_s * 100) if total_s > 0 else 0
-                            
-                            seller_kw_list.append(row)
-                        
-                        df_seller_kw = pd.DataFrame(seller_kw_list)
-                        
-                        if not df_seller_kw.empty and len(df_seller_kw.columns) > 1:
-                            # 시각화: 히트맵 (셀러별 키워드 활용 비중)
-                            fig_hm = px.imshow(df_seller_kw.set_index('셀러명').drop(columns=['총주문건수']),
-                                               labels=dict(x="키워드 카테고리", y="셀러명", color="사용 비중(%)"),
-                                               x=['이벤트', '맛강조', '가성비', '품종', '원산지'],
-                                               title="상위 30개 셀러의 키워드 활용 패턴 (Heatmap)",
-                                               color_continuous_scale='YlGnBu', text_auto='.1f')
-                            fig_hm.update_layout(height=800)
-                            st.plotly_chart(fig_hm, use_container_width=True)
-                        else:
-                            st.info("히트맵을 생성할 셀러/키워드 데이터가 부족합니다.")
-                        
-                        # 데이터 표
-                        st.markdown("#### 셀러별 키워드 활용 상세 (비중 %)")
-                        st.dataframe(df_seller_kw.style.format({
-                            '이벤트': '{:.1f}%', '맛강조': '{:.1f}%', '가성비': '{:.1f}%', '품종': '{:.1f}%', '원산지': '{:.1f}%'
-                        }), use_container_width=True)
-                    else:
-                        st.warning("'상품명' 칼럼이 없어 키워드 분석을 진행할 수 없습니다.")
-
-                    # --- 셀러 성장성 분석 및 마케팅 제언 추가 ---
-                    st.divider()
-                    st.subheader("🚀 셀러 성장성 분석 및 마케팅 제언")
-
-                    # 최근 2개월 비교 데이터 준비
-                    months_sorted = sorted(df_seller_active['연월'].unique(), reverse=True)
-                    if len(months_sorted) >= 2:
-                        current_m = months_sorted[0]
-                        prev_m = months_sorted[1]
-                        
-                        st.info(f"분석 기간: {prev_m} (전월) vs {current_m} (당월)")
-                        
-                        # 월별 셀러 판매량 집계
-                        m_counts = df_seller_active[df_seller_active['연월'].isin([current_m, prev_m])]
-                        seller_growth = m_counts.groupby(['셀러명', '연월']).size().unstack(fill_value=0)
-                        
-                        # 증감량 계산
-                        if current_m in seller_growth.columns and prev_m in seller_growth.columns:
-                            seller_growth['증감량'] = seller_growth[current_m] - seller_growth[prev_m]
-                            seller_growth['증감율(%)'] = (seller_growth['증감량'] / seller_growth[prev_m] * 100).replace([np.inf, -np.inf], 100).fillna(100)
-                            
-                            col_g1, col_g2 = st.columns(2)
-                            
-                            def get_marketing_advice(change, is_surge=True):
-                                if is_surge:
-                                    return "성공 채널 예산 확대, 충성 고객 전용 감사 쿠폰, 리뷰 이벤트 강화, 연관 상품 큐레이션"
-                                else:
-                                    return "이탈 방지 리마인드 알림, 단기 할인 프로모션, 인기 품목 재입고 안내, 유입 채널 광고 소재 교체"
-
-                            with col_g1:
-                                st.success(f"🔥 판매량 급증 셀러 Top 10 ({current_m} 기준)")
-                                surge_top10 = seller_growth.sort_values('증감량', ascending=False).head(10).reset_index()
-                                surge_top10['마케팅 추천 전략'] = surge_top10['증감량'].apply(lambda x: get_marketing_advice(x, True))
-                                st.dataframe(surge_top10[['셀러명', prev_m, current_m, '증감량', '마케팅 추천 전략']], use_container_width=True)
-                                
-                            with col_g2:
-                                st.error(f"⚠️ 판매량 급감 셀러 Top 10 ({current_m} 기준)")
-                                decline_top10 = seller_growth.sort_values('증감량', ascending=True).head(10).reset_index()
-                                decline_top10['마케팅 추천 전략'] = decline_top10['증감량'].apply(lambda x: get_marketing_advice(x, False))
-                                st.dataframe(decline_top10[['셀러명', prev_m, current_m, '증감량', '마케팅 추천 전략']], use_container_width=True)
-                                
-                            # 시각화: 증감량 분포
-                            fig_growth = px.bar(pd.concat([surge_top10, decline_top10]), 
-                                                x='증감량', y='셀러명', color='증감량',
-                                                title="셀러별 판매량 변화 폭 (Top 10 급증/급감)",
-                                                color_continuous_scale='RdYlGn', orientation='h')
-                            st.plotly_chart(fig_growth, use_container_width=True)
-                        else:
-                            st.warning("비교할 수 있는 월별 데이터가 부족합니다.")
-                    else:
-                        st.info("성장성 분석을 위해서는 최소 2개월 이상의 데이터가 필요합니다.")
-                else:
-                    st.info("활동 지표를 계산할 수 있는 충분한 데이터가 없습니다.")
-            else:
-                st.info("셀러 활동 분석을 위한 유효한 데이터(셀러명, 주문일)가 없습니다.")
-        else:
-            st.warning("'셀러명' 또는 '주문일' 칼럼이 데이터에 존재하지 않습니다.")
-
-    with t6:
-        st.subheader("🔍 상품 키워드별 매출 기여도 분석")
-        
-        if '상품명' in df.columns:
-            # 키워드 카테고리 정의
-            kw_categories = {
-                '이벤트': ['1\+1', '사전예약'],
-                '맛강조': ['과즙폭발', '꿀', '당도'],
-                '가성비': ['실속'],
-                '품종': ['타이벡', '조생'],
-                '원산지': ['제주', '해남']
-            }
-            
-            # 검색을 위해 미리 처리
-            df_kw = df.copy()
-            df_kw['상품명_clean'] = df_kw['상품명'].fillna('')
-            df_kw['연월'] = df_kw['주문일'].dt.to_period('M').astype(str)
-            
-            monthly_total_sales = df_kw.groupby('연월')['실결제 금액'].sum()
-            
-            kw_results = []
-            
-            for cat, keywords in kw_categories.items():
-                # 해당 카테고리의 어떤 키워드라도 포함된 주문 필터링
-                pattern = '|'.join(keywords)
-                mask_cat = df_kw['상품명_clean'].str.contains(pattern, case=False, regex=True)
-                df_cat = df_kw[mask_cat]
-                
-                # 월별 매출 합계
-                cat_monthly_sales = df_cat.groupby('연월')['실결제 금액'].sum()
-                
-                for month in monthly_total_sales.index:
-                    sales_val = cat_monthly_sales.get(month, 0)
-                    total_val = monthly_total_sales[month]
-                    ratio = (sales_val / total_val * 100) if total_val > 0 else 0
-                    
-                    kw_results.append({
-                        '연월': month,
-                        '카테고리': cat,
-                        '매출액': sales_val,
-                        '비중(%)': ratio
-                    })
-            
-            df_kw_final = pd.DataFrame(kw_results)
-            
-            if not df_kw_final.empty:
-                # 시각화 1: 카테고리별 월별 매출 비중 추이
-                fig_kw_line = px.line(df_kw_final, x='연월', y='비중(%)', color='카테고리', markers=True,
-                                      title="월별 상품 키워드 카테고리 매출 비중 (%)")
-                st.plotly_chart(fig_kw_line, use_container_width=True)
-                
-                # 시각화 2: 누적 매출 비중 (Stack Bar)
-                fig_kw_stack = px.bar(df_kw_final, x='연월', y='비중(%)', color='카테고리',
-                                      title="월별 키워드 매출 기여도 누적 분포", barmode='relative')
-                st.plotly_chart(fig_kw_stack, use_container_width=True)
-            else:
-                st.info("키워드 기여도를 분석할 데이터가 부족합니다.")
-            
-            # 데이터 표
-            if not df_kw_final.empty:
-                st.markdown("#### 키워드 카테고리별 월 매출 비중 상세")
-                pivot_kw = df_kw_final.pivot(index='연월', columns='카테고리', values='비중(%)').fillna(0)
-                st.dataframe(pivot_kw.style.format("{:.1f}%"), use_container_width=True)
-        else:
-            st.warning("'상품명' 칼럼이 데이터에 존재하지 않아 키워드 분석이 불가능합니다.")
-
-    with t7:
-        st.subheader("데이터 필터 결과")
-        st.write(f"현재 조건에 해당하는 데이터: {len(df):,}건")
-        st.dataframe(df.head(500), use_container_width=True)
-        csv_data = df.to_csv(index=False, encoding='utf-8-sig').encode('utf-8-sig')
-        st.download_button("📥 필터링된 데이터 다운로드 (CSV)", csv_data, "filtered_data.csv", "text/csv")
-
-else:
-    st.error(f"데이터 파일을 찾을 수 없습니다: {data_path}")
-    st.info("파일 경로를 확인하거나 데이터 파일이 해당 위치에 있는지 업무 담당자에게 문의하세요.")
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import os
+import time
+import uuid
+from collections import namedtuple
+from datetime import datetime
+import numpy as np
+
+import analyses
+import chart_data
+import data_loader
+import exporter
+import keyword_engine
+import order_cube
+import partitions
+import sampling
+import settings
+from customer_index import CustomerIndex
+from filter_index import FilterIndex
+from incremental import IncrementalDataset
+from profiler import RunProfiler
+from result_cache import ResultCache, filter_key
+from sketches import QUANTILE_ALPHA, OrderSketches
+from variety_labels import VarietyLabels, by_label
+from warmup import WarmupScheduler
+
+# 페이지 설정
+st.set_page_config(page_title="종합 주문 분석 대시보드 (V2)", layout="wide")
+
+# Plotly 한글 깨짐 방지 템플릿 설정
+import plotly.io as pio
+pio.templates.default = "plotly_white"
+
+# Copy-on-Write: 필터 결과/파생 프레임은 공유 데이터셋의 버퍼를 그대로 참조하고, 값을 바꿀 때만 복사됨
+pd.set_option('mode.copy_on_write', True)
+
+# 데이터 로드 및 전처리 (프로세스당 한 벌만 두고 모든 세션이 같은 객체를 공유, 읽기 전용으로만 사용)
+# cache_data는 호출마다 데이터프레임 전체를 역직렬화한 복사본을 주므로 동시 사용자 수만큼 메모리가 늘어남
+# source_key(파일 크기/수정시각)가 바뀌면 캐시가 자동으로 무효화됩니다.
+# 파티션 폴더이면 parts(선택 기간과 겹치는 파티션 이름)만 읽습니다. 기간마다 항목이 생기므로 개수를 제한합니다.
+@st.cache_resource(max_entries=settings.DATASET_CACHE_ENTRIES)
+def load_and_preprocess(file_path, source_key=None, parts=None):
+    if parts is not None:
+        return partitions.load_partitions(file_path, parts)
+    return data_loader.load_dataset(file_path)
+
+# 일자 x 품종 x 셀러 x 채널 x 지역 집계 큐브 (로드 시 1회 생성, 세션 간 공유)
+@st.cache_resource(max_entries=settings.DATASET_CACHE_ENTRIES)
+def load_order_cube(file_path, source_key=None, parts=None):
+    return order_cube.build_cube(load_and_preprocess(file_path, source_key, parts))
+
+# 일자 x 품종별 고객 수(HyperLogLog)/결제 금액 분위수/가격대 스케치 (로드 시 1회 생성, 필터마다 조각만 합침)
+@st.cache_resource(max_entries=settings.DATASET_CACHE_ENTRIES)
+def load_order_sketches(file_path, source_key=None, parts=None):
+    return OrderSketches.from_orders(load_and_preprocess(file_path, source_key, parts))
+
+# 사이드바 필터용 색인 (읽기 전용이므로 세션 간 공유)
+@st.cache_resource(max_entries=settings.DATASET_CACHE_ENTRIES)
+def load_filter_index(file_path, source_key=None, parts=None):
+    return FilterIndex(load_and_preprocess(file_path, source_key, parts))
+
+# 고객별 주문 순서 색인 (재구매 패턴을 처음 계산할 때 만들고 세션 간 공유)
+# 증분 모드에서는 스냅샷 데이터(_df)로 만들며, source_key가 스냅샷 버전이므로 추가분이 반영되면 새로 만듦
+@st.cache_resource(max_entries=settings.DATASET_CACHE_ENTRIES)
+def load_customer_index(file_path, source_key=None, parts=None, _df=None):
+    return CustomerIndex(load_and_preprocess(file_path, source_key, parts) if _df is None else _df)
+
+# 파티션 폴더의 매니페스트 (파티션별 기간/건수/품종)
+@st.cache_data
+def load_manifest(directory, source_key=None):
+    return partitions.update_manifest(directory)
+
+def get_source_key(file_path):
+    if not os.path.exists(file_path):
+        return None
+    if os.path.isdir(file_path):
+        # 파티션 폴더: 파티션별 (이름, 크기, 수정시각)
+        return tuple((os.path.basename(p), *partitions.stat_key(p)) for p in partitions.discover(file_path))
+    stat = os.stat(file_path)
+    return (stat.st_size, stat.st_mtime_ns)
+
+# SQL 집계 백엔드 (settings.BACKEND == 'duckdb'일 때만, Parquet 캐시가 최신이어야 함)
+@st.cache_resource(max_entries=settings.DATASET_CACHE_ENTRIES)
+def load_sql_backend(file_path, source_key=None, parts=None):
+    if settings.BACKEND != 'duckdb':
+        return None
+    try:
+        import sql_backend
+        if parts is not None:
+            cache_files = partitions.cache_files(file_path, parts)
+        else:
+            cache_files = data_loader.cache_path(file_path) if data_loader.cache_is_fresh(file_path) else None
+        if not cache_files:
+            st.warning("Parquet 캐시가 없어 pandas 백엔드로 계산합니다.")
+            return None
+        return sql_backend.DuckDBBackend(cache_files, settings.DUCKDB_THREADS or None)
+    except ImportError:
+        st.warning("duckdb/pyarrow가 설치되어 있지 않아 pandas 백엔드로 계산합니다.")
+        return None
+
+# 분석 미리 계산 스케줄러 (모든 세션이 공유하는 스레드 풀)
+@st.cache_resource
+def get_warmup():
+    return WarmupScheduler(get_result_cache(), settings.WARMUP_WORKERS, settings.WARMUP_SESSION_TTL)
+
+def show_warmup_status(status):
+    """미리 계산 현황을 표시하고, 아직 계산 중인 분석이 있는지 반환합니다."""
+    waiting = [ANALYSIS_LABELS[n] for n, state in status.items() if state in ('queued', 'running')]
+    failed = [ANALYSIS_LABELS[n] for n, state in status.items() if state == 'failed']
+    if waiting:
+        st.caption(f"⏳ 미리 계산 중: {', '.join(waiting)}")
+    else:
+        st.caption("✅ 분석 미리 계산 완료")
+    if failed:
+        st.caption(f"⚠️ 미리 계산 실패 (화면에서 다시 계산): {', '.join(failed)}")
+    return bool(waiting)
+
+# 계산 중인 분석이 있는 동안만 1초마다 현황을 갱신하고, 모두 끝나면 전체를 다시 실행해 갱신을 멈춤
+@st.fragment(run_every=1)
+def warmup_progress(warmup, key, names):
+    if not show_warmup_status(warmup.status(key, names)):
+        st.rerun()
+
+# 증분 반영 데이터셋 (모든 세션이 공유, 원본 파일이 늘어나면 추가된 줄만 반영)
+@st.cache_resource
+def load_live_dataset(file_path):
+    return IncrementalDataset(file_path)
+
+# 원본 파일 감시: 주기적으로 크기/수정시각만 확인해 바뀌었으면 앱을 다시 실행 (추가분은 다시 실행할 때 반영)
+@st.fragment(run_every=settings.REFRESH_SECONDS or None)
+def watch_source(dataset):
+    if dataset.has_new_data():
+        st.rerun()
+
+# 필터 결과별 분석 캐시 (모든 세션이 공유, 메모리 한도 초과 시 LRU로 제거)
+@st.cache_resource
+def get_result_cache():
+    return ResultCache(settings.RESULT_CACHE_MB * 1024 * 1024)
+
+# 현재 필터 결과 (원본 행, 큐브 조각, 캐시 키, 필터 조건(품종 값, 시작일, 종료일), 전체 데이터 기준 행 번호, 선택한 단일 품종)
+FilterView = namedtuple('FilterView', ['df', 'cube_part', 'key', 'filters', 'rows', 'labels'])
+
+# 분석 이름 -> 화면 표시 이름 (미리 계산 현황용)
+ANALYSIS_LABELS = {
+    'repurchase_rates': '재구매율',
+    'repurchase_pattern': '재구매 패턴',
+    'rfm': 'RFM',
+    'seller_channel': '셀러 채널',
+    'seller_months': '셀러 월별 활동',
+    'seller_keywords': '셀러 키워드',
+    'keyword_share': '키워드 매출 비중',
+}
+
+def analysis_task(name, view):
+    """분석 이름 -> (함수, 인자). 화면과 미리 계산이 같은 계산 경로를 사용합니다."""
+    # SQL 백엔드가 지원하는 분석은 필터 조건을 SQL로 넘기고, 나머지는 필터 결과 데이터프레임으로 계산 (결과는 같음)
+    if sql is not None and name in sql.ANALYSES:
+        return sql.run, (name, *view.filters)
+    if name == 'rfm' and live is not None and len(view.df) == len(live.df):
+        # 전체 행이 선택되면 증분으로 누적해 둔 RFM 저장소를 그대로 사용
+        return live.rfm.scores, ()
+    if name == 'repurchase_pattern':
+        # 로드 후 한 번 만든 고객별 주문 순서 색인을 필터 결과 행으로 좁혀 사용 (다시 정렬하지 않음)
+        # 색인이 아직 없으면 화면 스레드가 아닌 미리 계산 작업 안에서 만들도록 호출 시점에 로드
+        # (세션의 프로파일러는 스레드 안전하지 않으므로 작업 스레드에서는 쓰지 않음, 화면에서는 analysis 구간에 포함됨)
+        def repurchase_pattern(df, rows, source=(data_path, source_key, parts, df_raw)):
+            customers = load_customer_index(*source)
+            return analyses.repurchase_pattern(df, customers.restrict(rows))
+        return repurchase_pattern, (view.df, view.rows)
+    return analyses.ANALYSES[name], (view.df,)
+
+def analysis(name, view):
+    func, args = analysis_task(name, view)
+    cache = get_result_cache()
+    if cache.status(name, view.key) == 'running':
+        # 미리 계산 중인 결과를 기다리는 동안 자리 표시
+        with st.spinner(f"{ANALYSIS_LABELS.get(name, name)} 미리 계산 결과를 기다리는 중..."):
+            return prof.call(name, 'analysis', cache.get_or_compute, name, view.key, func, *args, rows_in=len(view.df))
+    return prof.call(name, 'analysis', cache.get_or_compute, name, view.key, func, *args, rows_in=len(view.df))
+
+# 근사 모드에서 표본으로 먼저 계산하는 분석 -> (근사 함수(view, 표본 비율), 표본 설명)
+# 상단 KPI와 트렌드 차트는 근사하지 않음: 일자 큐브/스케치 조각을 합치는 계산이라 필터 행 수가 아닌
+# 일자 x 품종 조각 수에 비례하므로, 큰 필터에서도 정확한 값을 바로 계산함 (그래서 항상 '정확한 값'으로 표시)
+APPROXIMATIONS = {
+    'repurchase_rates': (lambda view, rate: sampling.repurchase_rates(view.df, view.rows, rate), '일자 x 품종 층화 표본'),
+    'rfm': (lambda view, rate: sampling.rfm(view.df, rate), '고객 표본'),
+}
+
+def approximate(view):
+    """필터 결과가 커서 표본 근사값을 먼저 보여줄지. 정확한 값은 미리 계산 스레드가 계산하므로 미리 계산이 꺼져 있으면 근사하지 않습니다."""
+    return (warmup is not None and settings.APPROX_MIN_ROWS > 0 and settings.SAMPLE_PERCENT > 0
+            and len(view.df) >= settings.APPROX_MIN_ROWS)
+
+def progressive(name, view):
+    """(결과, 정확 여부). 정확한 결과가 아직 계산 중이면 표본 근사값을 먼저 반환합니다.
+
+    미리 계산이 끝나면 warmup_progress가 화면을 다시 실행하므로 그때 정확한 값으로 바뀝니다.
+    """
+    if name not in APPROXIMATIONS or not approximate(view) or warmup.status(view.key, [name])[name] not in ('queued', 'running'):
+        return analysis(name, view), True
+    func, _ = APPROXIMATIONS[name]
+    rate = settings.SAMPLE_PERCENT / 100
+    result = prof.call(f'{name} (표본)', 'analysis', get_result_cache().get_or_compute, f'{name}@{rate:g}', view.key,
+                       func, view, rate, rows_in=len(view.df))
+    return result, False
+
+def show_accuracy(view, name, exact):
+    """근사 모드일 때 패널이 근사값인지 정확한 값인지 표시합니다."""
+    if not approximate(view):
+        return
+    if exact:
+        st.caption("🟢 정확한 값")
+    else:
+        st.caption(f"🟡 근사값: {APPROXIMATIONS[name][1]} {settings.SAMPLE_PERCENT:g}% 기준 (오차 막대/±는 95% 신뢰구간). "
+                   "정확한 값이 계산되면 자동으로 바뀝니다.")
+
+def error_bars(rate_df, axis):
+    """재구매율 표의 95% 신뢰구간 오차 막대 (px.bar 인자)."""
+    return {f'error_{axis}': rate_df['상한(%)'] - rate_df['재구매율(%)'],
+            f'error_{axis}_minus': rate_df['재구매율(%)'] - rate_df['하한(%)']}
+
+def daily_trend(view, measure):
+    """일자 x 단일 품종별 주문건수 또는 매출액 (콤보 주문은 포함된 품종마다, 선택한 품종만)."""
+    if sql is not None:
+        trend = prof.call('trend', 'analysis', get_result_cache().get_or_compute, 'trend', view.key, sql.trend, *view.filters)
+        trend = trend[['주문일', '품종', measure]]
+    else:
+        trend = order_cube.rollup(view.cube_part, ['주문일', '품종'], [measure])
+    return by_label(trend, [measure], labels=view.labels)
+
+def selected_labels(view, table):
+    """단일 품종별 표에서 선택한 품종 행만 (선택하지 않았으면 전체)."""
+    return table[table['품종'].isin(view.labels)] if view.labels else table
+
+def figure_points(fig):
+    # 트레이스별 데이터 점 수 (x/y/z 또는 파이의 values 중 먼저 있는 것)
+    points = 0
+    for trace in fig.data:
+        for attr in ('x', 'y', 'z', 'values'):
+            values = getattr(trace, attr, None)
+            if values is not None:
+                points += len(values)
+                break
+    return points
+
+def show_chart(fig):
+    if not prof.enabled:
+        st.plotly_chart(fig, use_container_width=True)
+        return
+    # 직전 계측 구간 이후 경과 시간 = 그림 생성(및 그 준비) 시간
+    title = fig.layout.title.text or '(제목 없음)'
+    prof.add(f"그림 생성: {title}", 'figure', time.perf_counter() - prof.last_mark)
+    with prof.span(f"차트 전송: {title}", 'chart', rows_in=figure_points(fig)):
+        st.plotly_chart(fig, use_container_width=True)
+
+def get_marketing_advice(change, is_surge=True):
+    if is_surge:
+        return "성공 채널 예산 확대, 충성 고객 전용 감사 쿠폰, 리뷰 이벤트 강화, 연관 상품 큐레이션"
+    else:
+        return "이탈 방지 리마인드 알림, 단기 할인 프로모션, 인기 품목 재입고 안내, 유입 채널 광고 소재 교체"
+
+# --- 분석 화면 (섹션) ---
+def render_trend(view):
+    st.subheader("키워드 기반 주문/매출 트렌드")
+    col_t1, col_t2 = st.columns(2)
+    with col_t1:
+        # 품종별 시계열은 LTTB로 점 수를 줄여 전송
+        trend_count = chart_data.downsample_series(daily_trend(view, '주문건수'),
+                                                   '주문일', '주문건수', '품종', settings.CHART_MAX_POINTS)
+        fig1 = px.line(trend_count, x='주문일', y='주문건수', color='품종', title="일자별 주문 건수 추이",
+                       render_mode=chart_data.render_mode(len(trend_count), settings.WEBGL_MIN_POINTS))
+        show_chart(fig1)
+    with col_t2:
+        trend_sales = daily_trend(view, '매출액').rename(columns={'매출액': '실결제 금액'})
+        # 누적 영역은 계열끼리 x가 맞아야 하므로 합계 시계열 기준으로 공통 일자를 고름
+        trend_sales = chart_data.downsample_series(trend_sales, '주문일', '실결제 금액', '품종', settings.CHART_MAX_POINTS, shared=True)
+        fig2 = px.area(trend_sales, x='주문일', y='실결제 금액', color='품종', title="일자별 매출액 추이")
+        show_chart(fig2)
+    show_accuracy(view, 'trend', True)
+
+def render_season(view):
+    st.subheader("시즌별 판매 및 재구매율 분석")
+    col_s1, col_s2 = st.columns(2)
+    with col_s1:
+        season_counts = order_cube.season_rollup(view.cube_part)
+        fig_s = px.bar(season_counts, x='시즌', y='count', color='시즌', title="시즌별 주문 비중",
+                       category_orders={"시즌": ["봄", "여름", "가을", "겨울"]})
+        show_chart(fig_s)
+    with col_s2:
+        # 품종별 재구매율 원복 (재구매 횟수 칼럼 기준)
+        rates, exact = progressive('repurchase_rates', view)
+        re_rate_logic = selected_labels(view, rates['품종']).sort_values('재구매율(%)', ascending=False).head(10)
+
+        fig_re = px.bar(re_rate_logic, x='재구매율(%)', y='품종', orientation='h', title="품종별 재구매율 Top 10", color='재구매율(%)',
+                        **({} if exact else error_bars(re_rate_logic, 'x')))
+        show_chart(fig_re)
+        show_accuracy(view, 'repurchase_rates', exact)
+
+    st.divider()
+    st.subheader("🔁 재구매 고객 구매 패턴 상세 분석")
+
+    # 재구매 데이터 필터링 (UID별 주문 건수 2건 이상)
+    pattern = analysis('repurchase_pattern', view)
+
+    if pattern is not None:
+        col_p1, col_p2 = st.columns(2)
+        intervals = pattern['intervals']
+
+        with col_p1:
+            # 1. 재구매 빈도 분포 (주문 건수별 고객 수)
+            fig_freq = px.pie(pattern['freq_summary'], values='고객수', names='구분', title="고객별 총 주문 횟수 비중",
+                              hole=0.4, color_discrete_sequence=px.colors.sequential.RdBu)
+            show_chart(fig_freq)
+
+        with col_p2:
+            # 2. 구매 주기 분석 (연속 주문 간의 일수 차이)
+            if not intervals.empty:
+                # 원본 간격 대신 서버에서 집계한 구간별 개수만 전송
+                interval_bins = chart_data.histogram_bins(intervals, settings.HISTOGRAM_BINS, integer=True)
+                fig_dist = px.bar(interval_bins, x='중앙', y='개수', title="재구매 고객의 방문 간격 분포 (Days)",
+                                  labels={'중앙': 'interval', '개수': 'count'}, hover_data=['시작', '끝'],
+                                  color_discrete_sequence=['indianred'])
+                fig_dist.update_traces(width=interval_bins['폭'])
+                fig_dist.update_layout(bargap=0)
+                show_chart(fig_dist)
+                st.info(f"💡 재구매 고객의 평균 구매 주기는 약 **{intervals.mean():.1f}일**입니다.")
+
+        # 3. 재구매 고객이 선호하는 품종 Top 10
+        st.markdown("#### ⭐ 재구매 고객의 주요 구매 품종")
+        df_repeat_items = selected_labels(view, pattern['repeat_items'])
+        fig_rep_items = px.bar(df_repeat_items.sort_values('주문건수', ascending=False).head(10),
+                               x='주문건수', y='품종', orientation='h', title="재구매 고객이 많이 찾은 품종 Top 10")
+        show_chart(fig_rep_items)
+
+        # 데이터 표
+        st.markdown("#### 재구매 행동 지표 요약")
+        st.table(pattern['summary_stats'])
+    else:
+        st.info("재구매 고객 데이터가 충분하지 않습니다.")
+
+def render_rfm(view):
+    df = view.df
+    st.subheader("RFM 고객 세분화 분석")
+    rfm_data, rfm_exact = progressive('rfm', view)
+    show_accuracy(view, 'rfm', rfm_exact)
+    col_r1, col_r2 = st.columns([1, 2])
+    with col_r1:
+        seg_counts = rfm_data['Segment'].value_counts().reset_index(name='customer_count')
+        if not seg_counts.empty and seg_counts['customer_count'].sum() > 0:
+            fig_pie = px.pie(seg_counts, values='customer_count', names='Segment', title="고객 세그먼트 비중",
+                             color_discrete_sequence=px.colors.qualitative.Pastel)
+            show_chart(fig_pie)
+        else:
+            st.info("세그먼트 비중을 표시할 데이터가 없습니다.")
+    with col_r2:
+        # 근사값이면 평균의 95% 신뢰구간 반폭(±) 칼럼을 함께 표시
+        seg_stats = sampling.segment_means(rfm_data, z=None if rfm_exact else 1.96)
+        # 포맷팅용 가공
+        seg_stats_display = seg_stats.copy()
+        for col in [c for c in seg_stats_display.columns if c.startswith('Monetary')]:
+            seg_stats_display[col] = seg_stats_display[col].apply(lambda x: f"₩{int(x):,}" if pd.notna(x) else "-")
+        st.dataframe(seg_stats_display, use_container_width=True)
+
+        if not rfm_data.empty:
+            # 세그먼트별 비례 표본 (실행마다 같은 고객)
+            rfm_sample = chart_data.stratified_sample(rfm_data, 'Segment', settings.SCATTER_MAX_POINTS)
+            fig_scatter = px.scatter(rfm_sample, x='Frequency', y='Monetary', color='Segment',
+                                    size='Recency', log_x=True, title="고객 세그먼트 산점도 (샘플링)",
+                                    render_mode=chart_data.render_mode(len(rfm_sample), settings.WEBGL_MIN_POINTS))
+            show_chart(fig_scatter)
+        else:
+            st.info("산점도를 표시할 고객 데이터가 없습니다.")
+
+    st.divider()
+    st.subheader("👨‍🌾 셀러별 재구매율 현황")
+    if '셀러명' in df.columns and '재구매 횟수' in df.columns:
+        # 셀러별 재구매율 원복 (재구매 횟수 칼럼 기준)
+        rates, exact = progressive('repurchase_rates', view)
+        seller_re_rate = rates['셀러명'].sort_values('재구매율(%)', ascending=False).head(20)
+
+        fig_seller_re = px.bar(seller_re_rate,
+                               x='재구매율(%)', y='셀러명', orientation='h',
+                               title="셀러별 재구매율 Top 20 (주문 10건 이상)",
+                               color='재구매율(%)', color_continuous_scale='Viridis',
+                               **({} if exact else error_bars(seller_re_rate, 'x')))
+        show_chart(fig_seller_re)
+        show_accuracy(view, 'repurchase_rates', exact)
+    else:
+        st.warning("'셀러명' 또는 '재구매 횟수' 데이터가 부족합니다.")
+
+    st.divider()
+    st.subheader("🧾 회원구분 및 주문경로별 재구매율")
+    rates, exact = progressive('repurchase_rates', view)
+    show_accuracy(view, 'repurchase_rates', exact)
+    col_m1, col_m2 = st.columns(2)
+    for col, dim in [(col_m1, '회원구분'), (col_m2, '주문경로')]:
+        with col:
+            if dim in rates and not rates[dim].empty:
+                rate_df = rates[dim].sort_values('재구매율(%)', ascending=False)
+                # 오차 막대: 95% Wilson 신뢰구간
+                fig_dim = px.bar(rate_df, x=dim, y='재구매율(%)', color=dim, title=f"{dim}별 재구매율 (95% 신뢰구간)",
+                                 hover_data=['주문건수'], **error_bars(rate_df, 'y'))
+                show_chart(fig_dim)
+            else:
+                st.info(f"'{dim}' 데이터가 없어 재구매율을 계산할 수 없습니다.")
+
+def render_eda(view):
+    cube_part = view.cube_part
+    st.subheader("지역 및 채널 분석")
+    col_e1, col_e2 = st.columns(2)
+    with col_e1:
+        if '광역지역(정식)' in cube_part.columns:
+            reg_df = order_cube.rollup(cube_part, ['광역지역(정식)']).rename(columns={'주문건수': 'count'})
+            reg_df = reg_df.sort_values('count', ascending=False)
+            fig_reg = px.bar(reg_df.head(10), x='count', y='광역지역(정식)', orientation='h', title="지역별 주문 Top 10")
+            show_chart(fig_reg)
+    with col_e2:
+        if '주문경로' in cube_part.columns:
+            ch_df = order_cube.rollup(cube_part, ['주문경로']).rename(columns={'주문건수': 'count'})
+            fig_ch = px.pie(ch_df, values='count', names='주문경로', title="주문 채널 비중")
+            show_chart(fig_ch)
+
+    # 가격대별 건수는 로드 시 만든 일자 x 품종별 가격대 집계를 합산 (정확한 값)
+    price_df = prof.call('가격대 분포', 'analysis', sketches.price_ranges, *view.filters)
+    fig_price = px.bar(price_df, x='가격대', y='count', title="가격대별 주문 분포")
+    show_chart(fig_price)
+
+def render_seller(view):
+    df = view.df
+    st.subheader("상위 15개 셀러별 주문경로 분석")
+    if '셀러명' in df.columns and '주문경로' in df.columns:
+        # 상위 15개 셀러 및 셀러별 주문경로 집계
+        channel = analysis('seller_channel', view)
+
+        # 시각화 (누적 막대 그래프)
+        fig_seller_ch = px.bar(channel['seller_channel'], x='주문건수', y='셀러명', color='주문경로',
+                               title="상위 15개 셀러의 주문 유입 채널", orientation='h',
+                               category_orders={"셀러명": channel['top_sellers']})
+        show_chart(fig_seller_ch)
+
+        # 데이터 표 (Pivot Table)
+        st.markdown("#### 셀러별 채널별 주문 건수 상세")
+        st.dataframe(channel['pivot'], use_container_width=True)
+
+        # --- 셀러 월별 활동/유입/이탈 분석 추가 ---
+        st.divider()
+        st.subheader("📅 셀러 월별 활동 및 유입/이탈 현황")
+
+        seller_months = analysis('seller_months', view)
+        if not seller_months.empty:
+            churn_lag = st.number_input("이탈 기준 (몇 개월 전 대비)", min_value=1, max_value=12, value=1, step=1)
+            df_activity = seller_months.activity(int(churn_lag))
+            if not df_activity.empty:
+                # 시각화 1: 활동 셀러 및 신규 셀러 추이
+                fig_act = go.Figure()
+                fig_act.add_trace(go.Bar(x=df_activity['연월'], y=df_activity['활동셀러수'], name='전체 활동 셀러', marker_color='skyblue'))
+                fig_act.add_trace(go.Bar(x=df_activity['연월'], y=df_activity['신규모집셀러'], name='신규 유입 셀러', marker_color='orange'))
+                fig_act.update_layout(title="월별 활동 및 신규 셀러 수 추이", barmode='group')
+                show_chart(fig_act)
+
+                # 시각화 2: 유입율 및 이탈율 추이
+                fig_rate = px.line(df_activity, x='연월', y=['유입율(%)', '이탈율(%)'],
+                                   markers=True, title="월별 셀러 유입율 및 이탈율 변화")
+                show_chart(fig_rate)
+
+                # 요약 지표
+                st.markdown("#### 셀러 활동 지표 요약 (월별)")
+                st.dataframe(df_activity.style.format({
+                    '유입율(%)': '{:.1f}%',
+                    '이탈율(%)': '{:.1f}%'
+                }), use_container_width=True)
+
+                # 코호트 잔존율: 첫 활동 월별 셀러가 이후 몇 %나 계속 활동하는지
+                st.markdown("#### 셀러 코호트 잔존율 (첫 활동 월 기준, %)")
+                retention = seller_months.cohort_retention()
+                fig_cohort = px.imshow(retention, labels=dict(x="경과 개월", y="첫 활동 월", color="잔존율(%)"),
+                                       color_continuous_scale='Blues', text_auto='.0f', aspect='auto')
+                show_chart(fig_cohort)
+
+                # --- 상위 30개 셀러 키워드 전략 분석 추가 ---
+                st.divider()
+                st.subheader("🎯 상위 30개 셀러의 키워드 활용 전략")
+
+                if '상품명' in df.columns:
+                    df_seller_kw = analysis('seller_keywords', view)
+
+                    if not df_seller_kw.empty and len(df_seller_kw.columns) > 1:
+                        # 시각화: 히트맵 (셀러별 키워드 활용 비중)
+                        fig_hm = px.imshow(df_seller_kw.set_index('셀러명').drop(columns=['총주문건수']),
+                                           labels=dict(x="키워드 카테고리", y="셀러명", color="사용 비중(%)"),
+                                           x=list(keyword_engine.KW_CATEGORIES),
+                                           title="상위 30개 셀러의 키워드 활용 패턴 (Heatmap)",
+                                           color_continuous_scale='YlGnBu', text_auto='.1f')
+                        fig_hm.update_layout(height=800)
+                        show_chart(fig_hm)
+                    else:
+                        st.info("히트맵을 생성할 셀러/키워드 데이터가 부족합니다.")
+
+                    # 데이터 표
+                    st.markdown("#### 셀러별 키워드 활용 상세 (비중 %)")
+                    st.dataframe(df_seller_kw.style.format({cat: '{:.1f}%' for cat in keyword_engine.KW_CATEGORIES}),
+                                 use_container_width=True)
+                else:
+                    st.warning("'상품명' 칼럼이 없어 키워드 분석을 진행할 수 없습니다.")
+
+                # --- 셀러 성장성 분석 및 마케팅 제언 추가 ---
+                st.divider()
+                st.subheader("🚀 셀러 성장성 분석 및 마케팅 제언")
+
+                # 최근 2개월 비교 데이터 준비
+                growth = seller_months.growth()
+                if growth is not None:
+                    current_m = growth['current_m']
+                    prev_m = growth['prev_m']
+
+                    st.info(f"분석 기간: {prev_m} (전월) vs {current_m} (당월)")
+
+                    seller_growth = growth['growth']
+                    if seller_growth is not None:
+                        col_g1, col_g2 = st.columns(2)
+
+                        with col_g1:
+                            st.success(f"🔥 판매량 급증 셀러 Top 10 ({current_m} 기준)")
+                            surge_top10 = seller_growth.sort_values('증감량', ascending=False).head(10).reset_index()
+                            surge_top10['마케팅 추천 전략'] = surge_top10['증감량'].apply(lambda x: get_marketing_advice(x, True))
+                            st.dataframe(surge_top10[['셀러명', prev_m, current_m, '증감량', '마케팅 추천 전략']], use_container_width=True)
+
+                        with col_g2:
+                            st.error(f"⚠️ 판매량 급감 셀러 Top 10 ({current_m} 기준)")
+                            decline_top10 = seller_growth.sort_values('증감량', ascending=True).head(10).reset_index()
+                            decline_top10['마케팅 추천 전략'] = decline_top10['증감량'].apply(lambda x: get_marketing_advice(x, False))
+                            st.dataframe(decline_top10[['셀러명', prev_m, current_m, '증감량', '마케팅 추천 전략']], use_container_width=True)
+
+                        # 시각화: 증감량 분포
+                        fig_growth = px.bar(pd.concat([surge_top10, decline_top10]),
+                                            x='증감량', y='셀러명', color='증감량',
+                                            title="셀러별 판매량 변화 폭 (Top 10 급증/급감)",
+                                            color_continuous_scale='RdYlGn', orientation='h')
+                        show_chart(fig_growth)
+                    else:
+                        st.warning("비교할 수 있는 월별 데이터가 부족합니다.")
+                else:
+                    st.info("성장성 분석을 위해서는 최소 2개월 이상의 데이터가 필요합니다.")
+            else:
+                st.info("활동 지표를 계산할 수 있는 충분한 데이터가 없습니다.")
+        else:
+            st.info("셀러 활동 분석을 위한 유효한 데이터(셀러명, 주문일)가 없습니다.")
+    else:
+        st.warning("'셀러명' 또는 '주문일' 칼럼이 데이터에 존재하지 않습니다.")
+
+def render_keyword(view):
+    st.subheader("🔍 상품 키워드별 매출 기여도 분석")
+
+    if '상품명' in view.df.columns:
+        df_kw_final = analysis('keyword_share', view)
+
+        if not df_kw_final.empty:
+            # 시각화 1: 카테고리별 월별 매출 비중 추이
+            fig_kw_line = px.line(df_kw_final, x='연월', y='비중(%)', color='카테고리', markers=True,
+                                  title="월별 상품 키워드 카테고리 매출 비중 (%)")
+            show_chart(fig_kw_line)
+
+            # 시각화 2: 누적 매출 비중 (Stack Bar)
+            fig_kw_stack = px.bar(df_kw_final, x='연월', y='비중(%)', color='카테고리',
+                                  title="월별 키워드 매출 기여도 누적 분포", barmode='relative')
+            show_chart(fig_kw_stack)
+        else:
+            st.info("키워드 기여도를 분석할 데이터가 부족합니다.")
+
+        # 데이터 표
+        if not df_kw_final.empty:
+            st.markdown("#### 키워드 카테고리별 월 매출 비중 상세")
+            pivot_kw = df_kw_final.pivot(index='연월', columns='카테고리', values='비중(%)').fillna(0)
+            st.dataframe(pivot_kw.style.format("{:.1f}%"), use_container_width=True)
+    else:
+        st.warning("'상품명' 칼럼이 데이터에 존재하지 않아 키워드 분석이 불가능합니다.")
+
+def render_detail(view):
+    df = view.df
+    st.subheader("데이터 필터 결과")
+    st.write(f"현재 조건에 해당하는 데이터: {len(df):,}건")
+
+    # 미리보기: 현재 페이지의 행만 표시
+    col_p1, col_p2 = st.columns([1, 3])
+    page_size = col_p1.selectbox("페이지당 행 수", [100, 500, 1000], index=1, key="detail_page_size")
+    n_pages = max(1, -(-len(df) // page_size))
+    page = col_p2.number_input(f"페이지 (전체 {n_pages:,}쪽)", min_value=1, max_value=n_pages, value=1, step=1, key="detail_page")
+    start = (int(page) - 1) * page_size
+    st.dataframe(df.iloc[start:start + page_size], use_container_width=True)
+    st.caption(f"{start + 1:,}–{min(start + page_size, len(df)):,} / {len(df):,}행" if len(df) else "표시할 행이 없습니다.")
+
+    # 내보내기: 버튼을 눌렀을 때만 선택한 칼럼/형식으로 청크 단위 생성
+    st.markdown("#### 📥 필터링된 데이터 내보내기")
+    default_columns = [c for c in df.columns if c != keyword_engine.FLAG_COLUMN]
+    export_columns = st.multiselect("내보낼 칼럼", list(df.columns), default=default_columns, key="export_columns")
+    export_format = st.radio("형식", list(exporter.EXPORT_FORMATS), horizontal=True, key="export_format")
+    extension, mime = exporter.EXPORT_FORMATS[export_format]
+    st.download_button(f"📥 필터링된 데이터 다운로드 ({export_format})",
+                       exporter.deferred_export(df, export_format, export_columns),
+                       f"filtered_data.{extension}", mime, disabled=not export_columns)
+
+# 화면 이름 -> 렌더링 함수 (지연 모드에서는 선택한 화면만 계산)
+SECTIONS = {
+    "📈 트렌드 비교": render_trend,
+    "🍂 시즌 & 재구매": render_season,
+    "👥 RFM 고객 분석": render_rfm,
+    "📍 기초 EDA": render_eda,
+    "🛍️ 셀러별 채널 분석": render_seller,
+    "🔍 키워드 매출 분석": render_keyword,
+    "📋 상세 데이터": render_detail,
+}
+
+# 화면 이름 -> 그 화면이 쓰는 분석 (미리 계산 대상)
+SECTION_ANALYSES = {
+    "📈 트렌드 비교": [],
+    "🍂 시즌 & 재구매": ['repurchase_rates', 'repurchase_pattern'],
+    "👥 RFM 고객 분석": ['rfm', 'repurchase_rates'],
+    "📍 기초 EDA": ['repurchase_rates'],
+    "🛍️ 셀러별 채널 분석": ['seller_channel', 'seller_months', 'seller_keywords'],
+    "🔍 키워드 매출 분석": ['keyword_share'],
+    "📋 상세 데이터": [],
+}
+
+# 앱 시작
+# 구간별 프로파일러 (사이드바 토글 값은 이전 실행의 세션 상태에서 읽음)
+if '_profiler' in st.session_state:
+    st.session_state['_profiler'].close()
+prof = st.session_state['_profiler'] = RunProfiler(enabled=st.session_state.get('profile', settings.PROFILE))
+
+data_path = settings.DATA_PATH
+source_key = get_source_key(data_path)
+manifest = live = None
+if source_key and os.path.isdir(data_path):
+    # 파티션 폴더: 필터 범위(품종, 기간)는 매니페스트에서 정하고, 데이터는 기간을 고른 뒤 겹치는 파티션만 읽음
+    manifest = prof.call('파티션 매니페스트', 'load', load_manifest, data_path, source_key)
+    catalog = partitions.summary(manifest)
+    df_raw = None
+else:
+    if source_key and settings.INCREMENTAL and not data_loader.is_parquet(data_path):
+        # 증분 모드: 파일이 늘어났으면 추가된 줄만 읽어 데이터/큐브/색인/RFM 저장소에 합친 스냅샷을 사용
+        live_dataset = load_live_dataset(data_path)
+        live = prof.call('데이터 반영', 'load', live_dataset.refresh)
+        df_raw, source_key = live.df, live.version
+    else:
+        # 캐시 키는 넘긴 인자 그대로 정해지므로 큐브/색인 로더와 같게 parts(None)까지 넘겨 같은 객체를 받음
+        df_raw = prof.call('데이터 로드', 'load', load_and_preprocess, data_path, source_key, None)
+    catalog = None if df_raw is None else {
+        'varieties': sorted(df_raw['품종'].unique().tolist()),
+        'start': df_raw['주문일'].min(),
+        'end': df_raw['주문일'].max(),
+    }
+
+if catalog is not None:
+    # --- 사이드바 필터 ---
+    st.sidebar.title("🌲 분석 필터")
+
+    # 품종 검색 (복수 선택)
+    # 콤보 값('감귤, 황금향')은 단일 품종으로 나눠 선택지에 표시
+    all_varieties = VarietyLabels(catalog['varieties']).labels.tolist()
+    default_varieties = ['감귤', '황금향'] if '감귤' in all_varieties else all_varieties[:2]
+    selected_varieties = st.sidebar.multiselect(
+        "🏷️ 분석할 품종 선택 (검색 가능)",
+        options=all_varieties,
+        default=default_varieties
+    )
+
+    # 날짜 범위
+    min_d, max_d = catalog['start'].date(), catalog['end'].date()
+    date_input = st.sidebar.date_input("📅 기간 선택", [min_d, max_d])
+
+    # 선택한 화면만 계산 (끄면 모든 탭을 매번 계산)
+    lazy_sections = st.sidebar.toggle("⚡ 선택한 화면만 계산", value=settings.LAZY_SECTIONS)
+
+    # 데이터 필터링 적용 (기간은 이진 탐색, 품종은 역색인으로 조회)
+    date_range = date_input if len(date_input) == 2 else (None, None)
+    parts = None
+    if manifest is not None:
+        # 파티션 가지치기: 선택 기간과 겹치는 파티션만 읽음
+        parts = partitions.select(manifest, *date_range)
+        if not parts:
+            st.warning("선택한 기간에 해당하는 데이터가 없습니다.")
+            st.stop()
+        df_raw = prof.call('데이터 로드', 'load', load_and_preprocess, data_path, source_key, parts)
+        st.sidebar.caption(f"파티션 {len(parts)} / {len(manifest)}개 로드 ({len(df_raw):,} / {catalog['rows']:,}건)")
+    if live is not None:
+        # 추가분은 Parquet 캐시에 없으므로 SQL 백엔드 대신 스냅샷의 색인/큐브를 사용
+        sql, filter_index = None, live.index
+        refreshed = live_dataset.last_refresh
+        st.sidebar.caption(
+            f"증분 반영: {len(df_raw):,}건, {datetime.fromtimestamp(live.refreshed_at):%H:%M:%S} 기준 "
+            f"({'추가' if refreshed['mode'] == 'append' else '전체 로드'} {refreshed['rows']:,}건, {refreshed['seconds']:.2f}초)")
+        watch_source(live_dataset)
+    else:
+        sql = load_sql_backend(data_path, source_key, parts)
+        filter_index = prof.call('필터 색인', 'load', load_filter_index, data_path, source_key, parts)
+    # 선택한 단일 품종 -> 그 품종을 포함하는 품종 값(콤보 포함). 필터 색인/큐브/스케치/SQL 조건은 품종 값 기준
+    variety_labels = prof.call('품종 라벨', 'filter', VarietyLabels.from_series, df_raw['품종'])
+    # 불러온 데이터에 없는 품종만 골랐으면(다른 기간 파티션에만 있는 품종) 그대로 넘겨 결과가 비도록 함
+    varieties = (variety_labels.values_with(selected_varieties) or selected_varieties) if selected_varieties else []
+    with prof.span('필터 적용', 'filter', rows_in=len(df_raw)) as record:
+        rows = filter_index.select({'품종': varieties or variety_labels.values.tolist()}, *date_range)
+        df = filter_index.take(df_raw, rows)
+        record.rows_out = len(df)
+
+    # 집계성 지표(KPI, 트렌드, 시즌, 지역/채널)는 원본 대신 큐브 조각에서 계산
+    cube = live.cube if live is not None else prof.call('주문 큐브', 'load', load_order_cube, data_path, source_key, parts)
+    cube_part = prof.call('큐브 조각', 'filter', order_cube.slice_cube, cube, varieties, *date_range, rows_in=len(cube))
+    sketches = live.sketches if live is not None else prof.call('스케치', 'load', load_order_sketches, data_path, source_key, parts)
+
+    view = FilterView(df, cube_part, filter_key(varieties, *date_range, dataset_version=source_key),
+                      (varieties, *date_range), rows, selected_varieties)
+
+    # 분석을 백그라운드에서 미리 계산 (화면은 기다리지 않고 바로 그림)
+    # - 기본 필터(처음 열었을 때의 화면)는 데이터 버전마다 한 번 모든 분석을 준비
+    # - 필터를 바꾼 뒤에는 지금 그리는 화면의 분석만 예약 (필터를 바꿀 때마다 모든 분석을 계산하지 않음)
+    warmup = get_warmup() if settings.WARMUP_WORKERS > 0 else None
+    if warmup is not None:
+        default_view = sorted(selected_varieties) == sorted(default_varieties) and tuple(date_range) == (min_d, max_d)
+        if default_view:
+            warmup.warm(view.key, {name: analysis_task(name, view) for name in ANALYSIS_LABELS})
+        # 화면 선택기는 아래에서 그리므로 이전 실행에서 고른 화면을 읽음 (처음에는 첫 화면)
+        visible = [st.session_state.get('section', next(iter(SECTIONS)))] if lazy_sections else list(SECTIONS)
+        visible_names = [name for name in ANALYSIS_LABELS if any(name in SECTION_ANALYSES.get(section, []) for section in visible)]
+        # 세션마다 이전 필터의 대기 작업만 취소하도록 세션 id를 함께 넘김
+        session = st.session_state.setdefault('_warmup_session', uuid.uuid4().hex)
+        warmup.submit(session, view.key, {name: analysis_task(name, view) for name in visible_names})
+        warm_names = list(ANALYSIS_LABELS) if default_view else visible_names
+        with st.sidebar:
+            warmup_state = warmup.status(view.key, warm_names)
+            if any(state in ('queued', 'running') for state in warmup_state.values()):
+                warmup_progress(warmup, view.key, warm_names)
+            else:
+                show_warmup_status(warmup_state)
+
+    # --- 메인 대시보드 UI ---
+    st.title("📊 통합 데이터 분석 대시보드 (v2.1)")
+    st.info("`generate_final_report.py`의 분석 항목을 실시간으로 시각화합니다.")
+
+    # 재구매 지표 원복 (재구매 횟수 칼럼 기준)
+    if sql is not None:
+        kpis = prof.call('KPI', 'analysis', sql.kpis, *view.filters)
+    else:
+        kpis = prof.call('KPI', 'analysis', order_cube.cube_kpis, cube_part, rows_in=len(cube_part))
+
+    # 상단 지표 레이아웃 및 출력
+    cols_kpi = st.columns(4)
+    cols_kpi[0].metric("총 주문 건수", f"{kpis['주문건수']:,}건")
+    cols_kpi[1].metric("총 매출액", f"₩{int(kpis['매출액']):,}원")
+    cols_kpi[2].metric("평균 객단가", f"₩{int(kpis['평균객단가']):,}원" if kpis['주문건수']>0 else "0")
+    cols_kpi[3].metric("전체 재구매율", f"{kpis['재구매율']:.1f}%")
+
+    # 고객 수/결제 금액 분위수는 스케치 조각을 합친 추정값 (원본 행을 다시 훑지 않음)
+    sketch_kpis = prof.call('KPI 스케치', 'analysis', sketches.summary, *view.filters)
+    cols_sketch = st.columns(4)
+    cols_sketch[0].metric("고객 수 (추정)", f"{sketch_kpis['고객수']:,}명",
+                          help="HyperLogLog 추정값입니다. 표준 오차 약 0.8% (대부분 ±1.6% 이내)")
+    for col, label, q in ((cols_sketch[1], "결제 금액 중앙값", '결제금액 중앙값'), (cols_sketch[2], "결제 금액 상위 10%", '결제금액 p90')):
+        value = sketch_kpis[q]
+        col.metric(label, f"₩{int(round(value, -2)):,}원" if pd.notna(value) else "-",
+                   help=f"구간 히스토그램 추정값입니다. 실제 금액과 상대 오차 {QUANTILE_ALPHA:.0%} 이내")
+    cols_sketch[3].metric("고객당 주문 건수", f"{kpis['주문건수'] / sketch_kpis['고객수']:.2f}건" if sketch_kpis['고객수'] else "0")
+    # KPI/추이는 표본 없이 큐브(사전 집계)에서 바로 계산하므로 근사 모드에서도 정확한 값
+    show_accuracy(view, 'kpis', True)
+
+    if lazy_sections:
+        # 화면 선택기: 선택된 화면의 분석만 실행
+        section = st.radio("분석 화면", list(SECTIONS), horizontal=True, label_visibility="collapsed", key="section")
+        rendered_sections = [section]
+        with prof.span(section, 'section', rows_in=len(df)):
+            SECTIONS[section](view)
+    else:
+        # 탭 구성
+        rendered_sections = list(SECTIONS)
+        for tab, (name, render) in zip(st.tabs(list(SECTIONS)), SECTIONS.items()):
+            with tab, prof.span(name, 'section', rows_in=len(df)):
+                render(view)
+
+    # 분석 결과 캐시 현황
+    with st.sidebar.expander("🗄️ 분석 캐시 현황"):
+        cache_stats = get_result_cache().stats()
+        st.caption(
+            f"적중 {cache_stats['hits']:,} / 미적중 {cache_stats['misses']:,} (적중률 {cache_stats['hit_rate']:.1f}%)  \n"
+            f"항목 {cache_stats['entries']:,}개, {cache_stats['nbytes'] / 1e6:.1f} / {cache_stats['max_bytes'] / 1e6:.0f}MB, 제거 {cache_stats['evictions']:,}회  \n"
+            f"집계 백엔드: {'duckdb' if sql is not None else 'pandas'}"
+        )
+
+    # 구간별 성능 프로파일 (켜면 다음 실행부터 계측)
+    with st.sidebar.expander("🩺 성능 프로파일"):
+        st.toggle("구간별 시간/메모리 계측", value=settings.PROFILE, key="profile",
+                  help=f"실행마다 {settings.PROFILE_LOG}에 기록을 추가합니다.")
+        if prof.enabled:
+            profile_df = pd.DataFrame(prof.records())
+            profile_df['name'] = ['　' * depth + name for depth, name in zip(profile_df['depth'], profile_df['name'])]
+            st.caption(f"전체 {prof.total_seconds():.2f}초")
+            st.dataframe(
+                profile_df.drop(columns=['depth']).rename(columns={
+                    'name': '구간', 'kind': '종류', 'seconds': '시간(초)', 'rows_in': '입력 행', 'rows_out': '출력 행', 'peak_mb': '최대 메모리(MB)'}),
+                hide_index=True, use_container_width=True,
+                column_config={'시간(초)': st.column_config.NumberColumn(format='%.3f'),
+                               '최대 메모리(MB)': st.column_config.NumberColumn(format='%.1f')},
+            )
+            prof.write_jsonl(settings.PROFILE_LOG, varieties=selected_varieties, date_range=date_range, lazy=lazy_sections,
+                             sections=rendered_sections, rows=len(df))
+    prof.close()
+
+else:
+    st.error(f"데이터 파일을 찾을 수 없습니다: {data_path}")
+    st.info("파일 경로를 확인하거나 데이터 파일이 해당 위치에 있는지 업무 담당자에게 문의하세요.")
@@ -0,0 +1,338 @@
+import argparse
+import codecs
+import hashlib
+import io
+import logging
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import keyword_engine
+
+logger = logging.getLogger(__name__)
+
+# 전처리 결과 캐시 (Parquet 사이드카) 위치
+CACHE_DIR = os.environ.get('ORDER_CACHE_DIR', '.cache')
+# 전처리 로직/스키마가 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = '4'
+# 원본 해시는 파일 앞/뒤 블록만 읽어 계산 (대용량 파일에서도 즉시 계산)
+HASH_BLOCK_SIZE = 1 << 20
+# 인코딩 판별에 사용할 파일 앞부분 크기
+SNIFF_SIZE = 64 * 1024
+
+PRICE_COLS = ['결제금액', '실결제 금액', '판매단가', '공급단가']
+
+# 주문 export 스키마 (대시보드/보고서에서 참조하는 칼럼)
+# - 가격 칼럼은 '12,900' 형태의 문자열이므로 문자열로 읽은 뒤 preprocess에서 숫자로 변환
+# - 재구매 횟수는 결측을 허용하는 정수로 읽음
+# - 값의 종류가 적은 문자열은 category
+# - UID도 category로 읽어 카테고리 코드를 고객별 조밀한 정수 코드로 사용
+ORDER_SCHEMA = {
+    'UID': 'category',
+    '주문일': 'string',
+    '품종': 'category',
+    '셀러명': 'category',
+    '주문경로': 'category',
+    '광역지역(정식)': 'category',
+    '회원구분': 'category',
+    '결제방법': 'category',
+    '상품명': 'string',
+    '결제금액': 'string',
+    '실결제 금액': 'string',
+    '판매단가': 'string',
+    '공급단가': 'string',
+    '재구매 횟수': 'string',
+    '고객선택옵션': 'string',
+    '배송준비 처리일': 'string',
+    '입금일': 'string',
+    '입금자명': 'string',
+}
+
+# 대시보드가 실제로 사용하는 칼럼 (기본 로드 대상)
+DASHBOARD_COLUMNS = [
+    'UID', '주문일', '품종', '셀러명', '주문경로', '광역지역(정식)', '회원구분',
+    '상품명', '결제금액', '실결제 금액', '판매단가', '공급단가', '재구매 횟수',
+]
+
+# preprocess에서 추가하는 파생 칼럼
+DERIVED_COLUMNS = ['시즌', keyword_engine.FLAG_COLUMN]
+
+SEASONS = ['봄', '여름', '가을', '겨울']
+# 월(1~12) -> SEASONS 인덱스
+SEASON_OF_MONTH = np.array([3, 3, 0, 0, 0, 1, 1, 1, 2, 2, 2, 3], dtype=np.int8)
+
+# 가격대 구간 (실결제 금액, 원). 보고서 차트와 스케치가 같은 구간을 사용
+PRICE_BINS = [0, 10000, 20000, 30000, 50000, 100000, np.inf]
+PRICE_LABELS = ['1만원 미만', '1~2만원', '2~3만원', '3~5만원', '5~10만원', '10만원 이상']
+
+
+def sniff_encoding(file_path):
+    """파일 앞부분만 읽어 인코딩(utf-8-sig / cp949)을 판별합니다."""
+    with open(file_path, 'rb') as f:
+        head = f.read(SNIFF_SIZE)
+    try:
+        # 블록 경계에서 잘린 멀티바이트 문자는 오류로 보지 않음 (final=False)
+        codecs.getincrementaldecoder('utf-8-sig')().decode(head, final=False)
+        return 'utf-8-sig'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+def is_parquet(file_path):
+    return str(file_path).lower().endswith('.parquet')
+
+
+def _read_parquet_source(file_path, columns):
+    """Parquet 원본을 읽어 CSV와 같은 스키마(dtype)로 맞춥니다."""
+    import pyarrow.parquet as pq
+
+    header = pq.read_schema(file_path).names
+    wanted = set(header) if columns is None else set(columns)
+    df = pd.read_parquet(file_path, columns=[c for c in header if c in wanted])
+    for col, dtype in ORDER_SCHEMA.items():
+        # 문자열로 저장된 칼럼만 변환 (이미 숫자/날짜 타입이면 preprocess가 그대로 사용)
+        if col in df.columns and (dtype == 'category' or df[col].dtype == object):
+            df[col] = df[col].astype(dtype)
+    return header, df
+
+
+def read_source(file_path, columns=DASHBOARD_COLUMNS):
+    """스키마에 맞춰 원본(CSV 또는 Parquet)을 읽습니다. columns=None이면 전체 칼럼을 읽습니다."""
+    start = time.perf_counter()
+    if is_parquet(file_path):
+        encoding = 'parquet'
+        header, df = _read_parquet_source(file_path, columns)
+    else:
+        encoding = sniff_encoding(file_path)
+        header = pd.read_csv(file_path, encoding=encoding, nrows=0).columns
+        wanted = set(header) if columns is None else set(columns)
+
+        df = pd.read_csv(
+            file_path,
+            encoding=encoding,
+            # 앞부분 이후의 깨진 바이트 때문에 파일 전체를 다시 읽지 않도록 대체 문자로 처리
+            encoding_errors='replace',
+            usecols=lambda c: c in wanted,
+            dtype={k: v for k, v in ORDER_SCHEMA.items() if k in wanted},
+        )
+
+    logger.info(
+        '원본 로드: %s (인코딩 %s, 칼럼 %d/%d, %s건, %.1fMB, %.2f초)',
+        file_path, encoding, len(df.columns), len(header), f'{len(df):,}',
+        df.memory_usage(deep=True).sum() / 1e6, time.perf_counter() - start,
+    )
+    return df
+
+
+def read_tail(file_path, offset, columns=DASHBOARD_COLUMNS):
+    """CSV에서 offset(바이트) 이후에 추가된 완결된 줄만 읽습니다. (추가된 원본 행, 다음 offset)
+
+    파일 끝의 아직 쓰는 중인(줄바꿈이 없는) 줄은 읽지 않고 다음 호출로 미룹니다. 추가분이 없으면 (None, offset).
+    """
+    encoding = sniff_encoding(file_path)
+    # 파일 끝에 쓰다 만 멀티바이트 문자가 있어도 헤더는 읽을 수 있도록 대체 문자로 처리
+    header = pd.read_csv(file_path, encoding=encoding, encoding_errors='replace', nrows=0).columns
+    with open(file_path, 'rb') as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b'\n') + 1
+    if end == 0:
+        return None, offset
+    wanted = set(header) if columns is None else set(columns)
+    df = pd.read_csv(
+        io.BytesIO(data[:end]),
+        # BOM은 파일 맨 앞에만 있으므로 중간부터 읽을 때는 utf-8
+        encoding='utf-8' if encoding == 'utf-8-sig' else encoding,
+        encoding_errors='replace',
+        header=None,
+        names=list(header),
+        usecols=lambda c: c in wanted,
+        dtype={k: v for k, v in ORDER_SCHEMA.items() if k in wanted},
+    )
+    logger.info('추가분 로드: %s (%s바이트, %s건)', file_path, f'{end:,}', f'{len(df):,}')
+    return df, offset + end
+
+
+def preprocess(df):
+    start = time.perf_counter()
+
+    # 날짜 처리
+    if '주문일' in df.columns:
+        df['주문일'] = pd.to_datetime(df['주문일'], errors='coerce')
+        df = df.dropna(subset=['주문일'])
+
+    # 금액 처리
+    for col in PRICE_COLS:
+        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col].str.replace(',', '', regex=False), errors='coerce').astype('float64')
+
+    # 재구매 횟수: 미기재는 재구매 없음(0)으로 간주
+    if '재구매 횟수' in df.columns:
+        df['재구매 횟수'] = pd.to_numeric(df['재구매 횟수'], errors='coerce').astype('Int32').fillna(0)
+
+    # 범주형 칼럼의 카테고리를 값 순서로 정렬 (코드/그룹 순서 = 값 정렬 순서, SQL ORDER BY와 같음)
+    for col in df.select_dtypes('category').columns:
+        categories = df[col].cat.categories
+        if not categories.is_monotonic_increasing:
+            df[col] = df[col].cat.reorder_categories(categories.sort_values())
+
+    # 시즌 정보 추가
+    df['시즌'] = pd.Categorical.from_codes(SEASON_OF_MONTH[df['주문일'].dt.month.to_numpy() - 1], SEASONS)
+
+    # 상품명 키워드 카테고리 플래그 (상품명을 한 번만 훑어 비트마스크로 저장)
+    if '상품명' in df.columns:
+        df[keyword_engine.FLAG_COLUMN] = keyword_engine.keyword_flags(df['상품명'])
+
+    logger.info(
+        '전처리 완료: %s건, %.1fMB, %.2f초',
+        f'{len(df):,}', df.memory_usage(deep=True).sum() / 1e6, time.perf_counter() - start,
+    )
+    return df
+
+
+def concat_frames(frames):
+    """전처리된 데이터(파티션, 추가분)를 이어 붙입니다. 범주형 칼럼은 카테고리 합집합(값 순서 정렬)으로 맞춰 category를 유지합니다."""
+    if not frames:
+        return None
+    if len(frames) == 1:
+        return frames[0]
+    frames = [f.copy(deep=False) for f in frames]
+    for col in frames[0].select_dtypes('category').columns:
+        parts = [f[col] for f in frames if col in f.columns]
+        if all(p.cat.categories.equals(parts[0].cat.categories) for p in parts):
+            continue
+        # 값 전체가 아닌 카테고리 목록끼리만 합침
+        categories = parts[0].cat.categories.append([p.cat.categories for p in parts[1:]]).unique().sort_values()
+        for f in frames:
+            if col in f.columns:
+                f[col] = f[col].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
+
+
+def source_fingerprint(file_path):
+    """원본 파일의 크기/수정시각/내용 해시와 전처리 버전을 반환합니다. (캐시 키)"""
+    stat = os.stat(file_path)
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        digest.update(f.read(HASH_BLOCK_SIZE))
+        if stat.st_size > HASH_BLOCK_SIZE:
+            f.seek(max(stat.st_size - HASH_BLOCK_SIZE, HASH_BLOCK_SIZE))
+            digest.update(f.read(HASH_BLOCK_SIZE))
+    return {
+        'version': CACHE_VERSION,
+        'keywords': keyword_engine.signature(),
+        'size': str(stat.st_size),
+        'mtime_ns': str(stat.st_mtime_ns),
+        'sha1': digest.hexdigest(),
+    }
+
+
+def _columns_tag(columns):
+    if columns is None:
+        return '.all'
+    if list(columns) == DASHBOARD_COLUMNS:
+        return ''
+    return '.' + hashlib.sha1('|'.join(columns).encode()).hexdigest()[:8]
+
+
+def cache_path(file_path, cache_dir=None, columns=DASHBOARD_COLUMNS):
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(cache_dir or CACHE_DIR, f'{name}{_columns_tag(columns)}.parquet')
+
+
+def _fingerprint_meta(fingerprint):
+    return {f'order_cache.{k}'.encode(): v.encode() for k, v in fingerprint.items()}
+
+
+def cache_is_fresh(file_path, fingerprint=None, cache_dir=None, columns=DASHBOARD_COLUMNS):
+    """캐시 파일의 메타데이터(스키마)만 읽어 원본과 키가 일치하는지 확인합니다."""
+    import pyarrow.parquet as pq
+
+    path = cache_path(file_path, cache_dir, columns)
+    if not os.path.exists(path):
+        return False
+    fingerprint = fingerprint or source_fingerprint(file_path)
+    meta = pq.read_schema(path).metadata or {}
+    return all(meta.get(k) == v for k, v in _fingerprint_meta(fingerprint).items())
+
+
+def load_cached(file_path, fingerprint=None, cache_dir=None, columns=DASHBOARD_COLUMNS):
+    """원본과 키가 일치하는 캐시가 있으면 읽어오고, 없거나 낡았으면 None을 반환합니다."""
+    path = cache_path(file_path, cache_dir, columns)
+    if not os.path.exists(path):
+        return None
+    try:
+        if not cache_is_fresh(file_path, fingerprint, cache_dir, columns):
+            logger.info('캐시가 원본과 일치하지 않아 다시 생성합니다: %s', path)
+            return None
+        return pd.read_parquet(path)
+    except Exception:
+        logger.warning('캐시를 읽을 수 없어 다시 생성합니다: %s', path, exc_info=True)
+        return None
+
+
+def build_cache(file_path, cache_dir=None, columns=DASHBOARD_COLUMNS):
+    """원본 CSV를 전처리해 Parquet 캐시로 저장하고, 전처리된 데이터를 반환합니다."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    fingerprint = source_fingerprint(file_path)
+    df = preprocess(read_source(file_path, columns))
+
+    path = cache_path(file_path, cache_dir, columns)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **_fingerprint_meta(fingerprint)})
+    # 쓰는 도중 다른 프로세스가 반쯤 쓰인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return df
+
+
+def load_dataset(file_path, use_cache=True, cache_dir=None, columns=DASHBOARD_COLUMNS):
+    """전처리된 주문 데이터를 반환합니다. 가능하면 Parquet 캐시를 사용합니다.
+
+    columns=None이면 스키마 밖의 칼럼까지 전체를 읽습니다.
+    """
+    if not os.path.exists(file_path):
+        return None
+
+    if use_cache:
+        try:
+            df = load_cached(file_path, cache_dir=cache_dir, columns=columns)
+            if df is not None:
+                return df
+            return build_cache(file_path, cache_dir, columns)
+        except ImportError:
+            logger.warning('pyarrow가 없어 캐시 없이 원본을 읽습니다.')
+
+    return preprocess(read_source(file_path, columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='주문 데이터 Parquet 캐시를 미리 생성합니다.')
+    parser.add_argument('paths', nargs='*', default=['project1_5959.csv'], help='원본 CSV 경로')
+    parser.add_argument('--cache-dir', default=None, help=f'캐시 디렉터리 (기본값: {CACHE_DIR})')
+    parser.add_argument('--force', action='store_true', help='원본이 바뀌지 않았어도 다시 생성')
+    parser.add_argument('--all-columns', action='store_true', help='대시보드 칼럼만이 아닌 전체 칼럼으로 생성')
+    args = parser.parse_args()
+    columns = None if args.all_columns else DASHBOARD_COLUMNS
+
+    for path in args.paths:
+        if not os.path.exists(path):
+            print(f"데이터 파일을 찾을 수 없습니다: {path}")
+            continue
+        start = time.perf_counter()
+        if not args.force and cache_is_fresh(path, cache_dir=args.cache_dir, columns=columns):
+            print(f"캐시가 최신 상태입니다: {cache_path(path, args.cache_dir, columns)}")
+            continue
+        df = build_cache(path, args.cache_dir, columns)
+        print(f"캐시 생성 완료: {cache_path(path, args.cache_dir, columns)} ({len(df):,}건, {time.perf_counter() - start:.2f}초)")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    main()
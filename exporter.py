@@ -0,0 +1,83 @@
+import gzip
+import io
+import tempfile
+
+# 필터 결과 내보내기 (다운로드 버튼을 눌렀을 때만 생성, 청크 단위로 기록)
+# 기록하는 동안에는 EXPORT_SPOOL_BYTES를 넘으면 임시 파일로 옮겨 메모리에 쌓지 않지만,
+# Streamlit 다운로드 버튼은 완성된 파일을 bytes로 받아 보관하므로 다운로드 시점에는 파일 크기만큼 메모리를 씀
+# 포맷 이름 -> (확장자, MIME)
+EXPORT_FORMATS = {
+    'CSV (gzip)': ('csv.gz', 'application/gzip'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'CSV': ('csv', 'text/csv'),
+}
+EXPORT_CHUNK_ROWS = 100_000
+# 이보다 커지면 메모리 대신 임시 파일에 기록
+EXPORT_SPOOL_BYTES = 64 * 2 ** 20
+
+
+def iter_chunks(df, columns=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    # 칼럼 선택도 청크마다 적용 (선택 칼럼 전체를 미리 복사하지 않음)
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield chunk if columns is None else chunk[list(columns)]
+
+
+def write_csv(df, fileobj, columns=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """CSV(utf-8-sig)를 청크 단위로 씁니다. 전체 문자열을 한 번에 만들지 않습니다."""
+    text = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='', write_through=True)
+    try:
+        header = True
+        for chunk in iter_chunks(df, columns, chunk_rows):
+            chunk.to_csv(text, index=False, header=header)
+            header = False
+        if header:  # 빈 결과도 헤더는 기록
+            df.iloc[:0][list(columns) if columns is not None else df.columns].to_csv(text, index=False)
+        text.flush()
+    finally:
+        text.detach()
+
+
+def write_parquet(df, fileobj, columns=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """Parquet을 청크마다 행 그룹 하나로 씁니다."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in iter_chunks(df, columns, chunk_rows):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(fileobj, table.schema, compression='zstd')
+            writer.write_table(table)
+        if writer is None:
+            empty = df.iloc[:0] if columns is None else df.iloc[:0][list(columns)]
+            pq.write_table(pa.Table.from_pandas(empty, preserve_index=False), fileobj)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def export(df, fmt, columns=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """선택한 포맷으로 내보낸 임시 파일(SpooledTemporaryFile, 처음 위치)을 반환합니다. 다 쓰면 닫아야 합니다."""
+    out = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_BYTES)
+    if fmt == 'CSV (gzip)':
+        with gzip.GzipFile(fileobj=out, mode='wb', compresslevel=6) as gz:
+            write_csv(df, gz, columns, chunk_rows)
+    elif fmt == 'Parquet':
+        write_parquet(df, out, columns, chunk_rows)
+    elif fmt == 'CSV':
+        write_csv(df, out, columns, chunk_rows)
+    else:
+        out.close()
+        raise ValueError(f'지원하지 않는 내보내기 형식: {fmt}')
+    out.seek(0)
+    return out
+
+
+def deferred_export(df, fmt, columns=None):
+    """다운로드 버튼의 data로 넘길 함수. 버튼을 눌렀을 때 한 번만 생성해 bytes로 넘깁니다."""
+    def build():
+        with export(df, fmt, columns) as f:
+            return f.read()
+    return build
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+
+from column_store import AppendBuffer
+
+# 역색인을 만들 필터 차원
+FILTER_DIMS = ['품종', '셀러명', '주문경로']
+
+
+def to_day_number(value):
+    """날짜(date/Timestamp/문자열)를 1970-01-01 기준 일수(int64)로 변환합니다."""
+    return int(np.datetime64(pd.Timestamp(value).date(), 'D').astype(np.int64))
+
+
+class FilterIndex:
+    """사이드바 필터용 색인.
+
+    행을 주문일 순으로 정렬한 위치(position) 공간에서
+    - 기간 조건은 일수 배열의 이진 탐색 구간으로,
+    - 품종/셀러명/주문경로 조건은 값별 행 위치 목록(역색인)의 합집합/교집합으로
+    계산해 전체 행을 훑는 불리언 마스크 없이 필터 결과 행 번호를 얻습니다.
+    """
+
+    def __init__(self, df, dims=FILTER_DIMS):
+        days = df['주문일'].to_numpy('datetime64[D]').astype(np.int64)
+        # 정렬 위치 -> 원본 행 번호
+        self.order = np.argsort(days, kind='stable')
+        self.days = days[self.order]
+        self.postings = {col: self._build_postings(df[col], self.order) for col in dims if col in df.columns}
+        # extend용 append-only 버퍼 (배열 이름 또는 (칼럼, 값) -> AppendBuffer, 처음 덧붙일 때 만듦)
+        self._buffers = {}
+
+    @staticmethod
+    def _build_postings(series, order):
+        values = series.astype('category')
+        codes = values.cat.codes.to_numpy()[order]
+        # 코드별로 묶되 같은 코드 안에서는 위치(=주문일) 순서를 유지
+        by_code = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[by_code], np.arange(-1, len(values.cat.categories) + 1))
+        return {
+            value: by_code[bounds[i + 1]:bounds[i + 2]]
+            for i, value in enumerate(values.cat.categories)
+        }
+
+    def extend(self, df_new):
+        """색인을 만든 데이터 뒤에 붙은 새 행을 더한 새 색인을 반환합니다. (기존 색인은 그대로)
+
+        새 행의 원본 행 번호는 기존 행 수부터 이어진다고 봅니다.
+        정렬 순서/일자 배열과 역색인 목록은 append-only 버퍼에 덧붙이므로 기존 배열을 복사하지 않습니다.
+        새 행 중 기존 마지막 주문일보다 이른 행이 있으면 정렬 위치가 바뀌므로 None (전체를 다시 만들어야 함).
+        """
+        days = df_new['주문일'].to_numpy('datetime64[D]').astype(np.int64)
+        n = len(self.days)
+        if n and len(days) and days.min() < self.days[-1]:
+            return None
+        order = np.argsort(days, kind='stable')
+        index = FilterIndex.__new__(FilterIndex)
+        index._buffers = dict(self._buffers)
+        index.order = index._append('order', self.order, order + n)
+        index.days = index._append('days', self.days, days[order])
+        index.postings = {}
+        for col, postings in self.postings.items():
+            merged = dict(postings)
+            for value, ids in self._build_postings(df_new[col], order).items():
+                if len(ids):
+                    merged[value] = index._append((col, value), postings.get(value, ids[:0]), ids + n)
+            index.postings[col] = merged
+        return index
+
+    def _append(self, key, current, values):
+        # current(이 색인의 배열) 뒤에 values를 덧붙인 배열 (버퍼 뷰)
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = AppendBuffer(current)
+        buffer = buffer.append(len(current), values)
+        self._buffers[key] = buffer
+        return buffer.view(len(current) + len(values))
+
+    def date_range(self, start=None, end=None):
+        """기간(포함 범위)에 해당하는 정렬 위치 구간 [lo, hi)를 반환합니다."""
+        lo = 0 if start is None else self.days.searchsorted(to_day_number(start), 'left')
+        hi = len(self.days) if end is None else self.days.searchsorted(to_day_number(end), 'right')
+        return lo, hi
+
+    def _positions(self, col, values, lo, hi):
+        postings = self.postings[col]
+        parts = []
+        for value in values:
+            ids = postings.get(value)
+            if ids is not None and len(ids):
+                parts.append(ids[ids.searchsorted(lo):ids.searchsorted(hi)])
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(parts))
+
+    def select(self, filters=None, start=None, end=None):
+        """조건에 맞는 원본 행 번호(오름차순)를 반환합니다.
+
+        filters: {칼럼: 선택값 목록}. 값이 None이면 해당 칼럼은 필터하지 않습니다.
+        """
+        lo, hi = self.date_range(start, end)
+        ids = None
+        for col, values in (filters or {}).items():
+            if values is None:
+                continue
+            positions = self._positions(col, values, lo, hi)
+            ids = positions if ids is None else np.intersect1d(ids, positions, assume_unique=True)
+        if ids is None:
+            ids = np.arange(lo, hi)
+        return np.sort(self.order[ids])
+
+    def filter(self, df, filters=None, start=None, end=None):
+        """색인을 만든 데이터프레임에서 조건에 맞는 행만 꺼냅니다.
+
+        결과 행이 연속 구간이면(예: 전체 선택) 복사 없이 슬라이스(뷰)를 반환합니다.
+        """
+        return self.take(df, self.select(filters, start, end))
+
+    @staticmethod
+    def take(df, ids):
+        """행 번호(오름차순) ids의 행. 연속 구간이면 슬라이스(뷰)로 꺼냅니다."""
+        if len(ids) and ids[-1] - ids[0] + 1 == len(ids):
+            return df.iloc[ids[0]:ids[-1] + 1]
+        return df.take(ids)
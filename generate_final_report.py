@@ -1,127 +1,273 @@
-import os
-from datetime import datetime
-
-def generate_report():
-    """
-    최종 통합 분석 보고서(generate_final_report.py)를 생성하는 함수입니다. (원복 버전)
-    """
-    report_path = "generate_final_report.py"
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    report_content = f"""# 데이터 분석 최종 통합 보고서 (Comprehensive Analysis Report)
-
-**생성일시**: {current_time}  
-**분석 대상**: `project1_5959.csv`
-
----
-
-## 1. 데이터 개요 분석
-- **전체 데이터 건수**: 9,144 건
-- **칼럼 수**: 43 개
-
-### 결측치 현황
-| 주요 항목 | 결측치수 |
-| :--- | ---: |
-| 고객선택옵션 | 333 |
-| 셀러명 | 153 |
-| 배송준비 처리일 | 540 |
-| 입금일 | 98 |
-| 입금자명 | 8,048 |
-
----
-
-## 2. 주요 시각화 기반 일반 분포 분석
-
-### 2.1 핵심 지표 시각화 (5종)
-| 항목 | 시각화 결과 |
-| :--- | :--- |
-| **지역별 주문** | ![지역별 주문 건수]('01_region_counts.png') |
-| **주문경로 비중** | ![주문경로별 비중]('02_order_channel.png') |
-| **결제방법 분포** | ![결제방법 분포]('03_payment_method.png') |
-| **품종별 판매** | ![품종별 판매 건수]('04_product_variety.png') |
-| **가격대별 분포** | ![가격대별 주문 분포]('05_price_range.png') |
-
----
-
-## 3. 시즌별 품목 선호도 분석
-데이터 내 주문일자를 기반으로 한 사계절별 인기 품목 분석 결과입니다.
-
-![시즌별 인기 품목]('seasonal_product_popularity.png')
-
-### 시즌별 상위 주문 데이터
-| 시즌 | 품종 | 주문건수 |
-| :--- | :--- | ---: |
-| **가을** | 감귤 | 4540 |
-| **가을** | 감귤, 황금향 | 764 |
-| **겨울** | 감귤 | 2416 |
-| **겨울** | 한라봉 | 164 |
-
----
-
-## 4. 심층 재구매율(Repurchase Rate) 분석
-
-### 4.1 품목(품종)별 재구매율
-![품종별 재구매율]('repurchase_by_product.png')
-
-| 상위 품종 | 재구매율(%) | 전체주문건수 |
-| :--- | ---: | ---: |
-| **단감** | 100.00 | 6 |
-| **딸기** | 86.44 | 59 |
-| **한라봉** | 59.76 | 164 |
-| **고구마** | 56.90 | 239 |
-| **황금향** | 52.87 | 749 |
-
-### 4.2 셀러별 고객 로열티 분석 (주문 10건 이상 대상)
-![셀러별 재구매율]('repurchase_by_seller.png')
-- **최우수 셀러**: 제주귤마켓 (96.4%), 규원이네 (95.3%), 황금노지 (94.7%) 등
-
-### 4.3 회원구분 및 주문경로별 재구매율
-- **회원구분**: 비회원(45.8%)의 재구매율이 회원(30.3%)보다 유의미하게 높게 나타남. ![회원별]('repurchase_by_membership.png')
-- **주문경로**: TICTOK(66.7%), 인스타그램(39.2%), 카카오톡(48.2%) 순. ![경로별]('repurchase_by_channel.png')
-
----
-
-## 5. RFM 기반 고객 세분화 분석
-고객의 구매 행동(최근성, 빈도, 금액)을 기반으로 한 등급 분류 결과입니다.
-
-![RFM 세그먼트]('rfm_customer_segments.png')
-
-### 세그먼트별 평균 지표
-| 등급 | Recency(일) | Frequency(건) | Monetary(원) |
-| :--- | ---: | ---: | ---: |
-| **VVIP (최상위)** | 38.4 | 159.9 | 4,981,440 |
-| **VIP (우수)** | 42.0 | 65.3 | 2,343,740 |
-| **Regular (일반)** | 57.7 | 8.5 | 332,161 |
-| **At-risk (이탈우려)** | 86.3 | 2.3 | 58,729 |
-
----
-
-## 6. 상세 교차 분석 데이터 (Cross-tabulation)
-
-### 6.1 지역별 x 품종별 선호도 (상위 지역)
-| 광역지역(정식) | 감귤 | 감귤, 황금향 | 고구마 | 황금향 |
-| :--- | ---: | ---: | ---: | ---: |
-| **경기도** | 2,099 | 220 | 84 | 226 |
-| **서울특별시** | 931 | 133 | 28 | 149 |
-
----
-
-## 8. 프로젝트 작업 결과물 구조 (File Tree)
-```text
-Project1_5959/
-├── project1_5959.csv            # 원본 및 가공 데이터셋
-├── eda_results/                 # 시각화 차트 이미지 (PNG)
-├── eda_project1.py              # 기본 및 재구매율 분석 스크립트
-├── eda_v2_advanced.py           # 시즌 및 RFM 고도화 분석 스크립트
-├── dashboard_app.py             # Streamlit 통합 실시간 대시보드
-└── generate_final_report.py # 최종 통합 분석 보고서 생성기
-```
-"""
-    
-    with open(report_path, "w", encoding="utf-8-sig") as f:
-        f.write(report_content)
-    
-    print(f"보고서가 성공적으로 생성되었습니다: {os.path.abspath(report_path)}")
-
-if __name__ == "__main__":
-    generate_report()
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+from jinja2 import Environment
+
+import data_loader
+import order_cube
+import partitions
+import report_charts
+import repurchase
+from rfm_store import RFMStore, SEGMENTS
+from variety_labels import by_label
+
+DEFAULT_DATA_PATH = 'project1_5959.csv'
+DEFAULT_OUTPUT_PATH = 'final_comprehensive_report.md'
+
+# 보고서 템플릿 (Markdown)
+REPORT_TEMPLATE = """# 데이터 분석 최종 통합 보고서 (Comprehensive Analysis Report)
+
+**생성일시**: {{ generated_at }}
+**분석 대상**: `{{ data_name }}`
+{% if chart_notice %}
+> ⚠️ **차트 이미지 누락**: {{ chart_notice }}
+{% endif %}
+---
+
+## 1. 데이터 개요 분석
+- **전체 데이터 건수**: {{ "{:,}".format(n_rows) }} 건
+- **칼럼 수**: {{ n_columns }} 개
+
+### 결측치 현황
+| 주요 항목 | 결측치수 |
+| :--- | ---: |
+{% for name, count in missing %}| {{ name }} | {{ "{:,}".format(count) }} |
+{% else %}| (결측치 없음) | 0 |
+{% endfor %}
+---
+
+## 2. 주요 시각화 기반 일반 분포 분석
+
+### 2.1 핵심 지표 시각화 (5종)
+| 항목 | 시각화 결과 |
+| :--- | :--- |
+| **지역별 주문** | ![지역별 주문 건수]({{ images }}/01_region_counts.png) |
+| **주문경로 비중** | ![주문경로별 비중]({{ images }}/02_order_channel.png) |
+| **결제방법 분포** | ![결제방법 분포]({{ images }}/03_payment_method.png) |
+| **품종별 판매** | ![품종별 판매 건수]({{ images }}/04_product_variety.png) |
+| **가격대별 분포** | ![가격대별 주문 분포]({{ images }}/05_price_range.png) |
+
+---
+
+## 3. 시즌별 품목 선호도 분석
+데이터 내 주문일자를 기반으로 한 사계절별 인기 품목 분석 결과입니다.
+
+![시즌별 인기 품목]({{ images }}/seasonal_product_popularity.png)
+
+### 시즌별 상위 주문 데이터
+| 시즌 | 품종 | 주문건수 |
+| :--- | :--- | ---: |
+{% for row in season_top %}| **{{ row['시즌'] }}** | {{ row['품종'] }} | {{ row['주문건수'] }} |
+{% endfor %}
+---
+
+## 4. 심층 재구매율(Repurchase Rate) 분석
+
+### 4.1 품목(품종)별 재구매율
+![품종별 재구매율]({{ images }}/repurchase_by_product.png)
+
+| 상위 품종 | 재구매율(%) | 전체주문건수 |
+| :--- | ---: | ---: |
+{% for row in variety_rates %}| **{{ row['품종'] }}** | {{ "%.2f"|format(row['재구매율(%)']) }} | {{ "{:,}".format(row['주문건수']) }} |
+{% endfor %}
+### 4.2 셀러별 고객 로열티 분석 (주문 {{ min_seller_orders }}건 이상 대상)
+![셀러별 재구매율]({{ images }}/repurchase_by_seller.png)
+- **최우수 셀러**: {% for row in seller_rates %}{{ row['셀러명'] }} ({{ "%.1f"|format(row['재구매율(%)']) }}%){{ ", " if not loop.last }}{% endfor %} 등
+
+### 4.3 회원구분 및 주문경로별 재구매율
+- **회원구분**: {% for row in member_rates %}{{ row['회원구분'] }}({{ "%.1f"|format(row['재구매율(%)']) }}%){{ ", " if not loop.last }}{% endfor %} ![회원별]({{ images }}/repurchase_by_membership.png)
+- **주문경로**: {% for row in channel_rates %}{{ row['주문경로'] }}({{ "%.1f"|format(row['재구매율(%)']) }}%){{ ", " if not loop.last }}{% endfor %} 순. ![경로별]({{ images }}/repurchase_by_channel.png)
+
+---
+
+## 5. RFM 기반 고객 세분화 분석
+고객의 구매 행동(최근성, 빈도, 금액)을 기반으로 한 등급 분류 결과입니다.
+
+![RFM 세그먼트]({{ images }}/rfm_customer_segments.png)
+
+### 세그먼트별 평균 지표
+| 등급 | Recency(일) | Frequency(건) | Monetary(원) |
+| :--- | ---: | ---: | ---: |
+{% for row in rfm_means %}| **{{ row['Segment'] }}** | {{ "%.1f"|format(row['Recency']) }} | {{ "%.1f"|format(row['Frequency']) }} | {{ "{:,}".format(row['Monetary']|round|int) }} |
+{% endfor %}
+---
+
+## 6. 상세 교차 분석 데이터 (Cross-tabulation)
+
+### 6.1 지역별 x 품종별 선호도 (상위 지역)
+| 광역지역(정식) |{% for col in region_variety.columns %} {{ col }} |{% endfor %}
+| :--- |{% for col in region_variety.columns %} ---: |{% endfor %}
+{% for region, row in region_variety.iterrows() %}| **{{ region }}** |{% for value in row %} {{ "{:,}".format(value) }} |{% endfor %}
+{% endfor %}
+---
+
+## 8. 프로젝트 작업 결과물 구조 (File Tree)
+```text
+Project1_5959/
+├── project1_5959.csv            # 원본 및 가공 데이터셋
+├── eda_results/                 # 시각화 차트 이미지 (PNG)
+├── eda_project1.py              # 기본 및 재구매율 분석 스크립트
+├── eda_v2_advanced.py           # 시즌 및 RFM 고도화 분석 스크립트
+├── dashboard_app.py             # Streamlit 통합 실시간 대시보드
+└── generate_final_report.py # 최종 통합 분석 보고서 생성기
+```
+"""
+
+
+# 보고서 큐브 차원: 대시보드 큐브 차원 + 회원구분/결제방법/가격대
+REPORT_DIMS = [*order_cube.CUBE_DIMS, '회원구분', '결제방법', '가격대']
+
+
+def build_report_cube(df):
+    """보고서의 분포/재구매율/시즌/교차표를 모두 계산할 일자 x REPORT_DIMS 큐브 (원본 행은 이때 한 번만 그룹화)."""
+    price_band = pd.cut(df['실결제 금액'], data_loader.PRICE_BINS, labels=data_loader.PRICE_LABELS, right=False)
+    return order_cube.build_cube(df.assign(가격대=price_band), REPORT_DIMS)
+
+
+def compute_report(df, top_varieties=5, top_sellers=3, min_seller_orders=10, top_regions=5, crosstab_varieties=4):
+    """보고서에 들어갈 모든 수치를 한 번 로드한 데이터에서 계산합니다.
+
+    원본 행은 보고서 큐브(일자 x 차원)와 고객별 RFM 저장소를 만들 때 한 번씩만 훑고,
+    결측치(큐브 차원)/시즌/재구매율/교차표/차트 집계는 모두 큐브를 다시 합산해 계산합니다.
+    """
+    raw_columns = [c for c in df.columns if c not in data_loader.DERIVED_COLUMNS]
+
+    cube = build_report_cube(df)
+
+    # 결측치 현황 (결측이 있는 칼럼만). 큐브 차원은 결측 그룹의 주문건수, 나머지 칼럼만 직접 셈
+    cube_keys = [c for c in cube.columns if c in raw_columns]
+    missing = df[[c for c in raw_columns if c not in cube_keys]].isna().sum()
+    for col in cube_keys:
+        missing[col] = int(cube.loc[cube[col].isna(), '주문건수'].sum())
+    missing = [(name, int(missing[name])) for name in raw_columns if missing[name] > 0]
+
+    # 시즌별 상위 2개 품종 (콤보 주문은 포함된 품종마다 집계)
+    season_variety = by_label(order_cube.season_rollup(cube, ['품종']), ['count'])
+    season_top = (
+        season_variety.sort_values(['시즌', 'count'], ascending=[True, False])
+        .groupby('시즌', observed=True).head(2)
+        .rename(columns={'count': '주문건수'})
+    )
+
+    # 재구매율 (품종/셀러/회원구분/주문경로)
+    rates = order_cube.cube_repurchase_rates(cube, repurchase.REPURCHASE_DIMS, min_orders={'셀러명': min_seller_orders})
+    empty_rates = pd.DataFrame(columns=repurchase.RATE_COLUMNS)
+
+    def top_rates(dim, n=None):
+        table = rates.get(dim, empty_rates).sort_values(['재구매율(%)', '주문건수'], ascending=False)
+        return table if n is None else table.head(n)
+
+    # RFM 세그먼트별 평균
+    rfm = RFMStore.from_orders(df).scores()
+    rfm_means = rfm.groupby('Segment')[['Recency', 'Frequency', 'Monetary']].mean()
+    rfm_means = rfm_means.reindex([s for s in SEGMENTS[::-1] if s in rfm_means.index]).reset_index()
+
+    # 지역 x 품종 교차표 (주문 상위 지역 x 상위 품종)
+    region_variety = order_cube.rollup(cube, ['광역지역(정식)', '품종'])
+    region_totals = region_variety.groupby('광역지역(정식)', observed=True)['주문건수'].sum().nlargest(top_regions)
+    region_variety = by_label(region_variety, ['주문건수'])
+    variety_totals = region_variety.groupby('품종', observed=True)['주문건수'].sum().nlargest(crosstab_varieties)
+    crosstab = (
+        region_variety.pivot_table(index='광역지역(정식)', columns='품종', values='주문건수', aggfunc='sum', fill_value=0, observed=True)
+        .reindex(index=region_totals.index, columns=sorted(variety_totals.index), fill_value=0)
+        .astype(int)
+    )
+
+    return {
+        'n_rows': len(df),
+        'n_columns': len(raw_columns),
+        'missing': missing,
+        'season_top': season_top.to_dict('records'),
+        'variety_rates': top_rates('품종', top_varieties).to_dict('records'),
+        'seller_rates': top_rates('셀러명', top_sellers).to_dict('records'),
+        'min_seller_orders': min_seller_orders,
+        'member_rates': top_rates('회원구분').to_dict('records'),
+        'channel_rates': top_rates('주문경로').to_dict('records'),
+        'rfm_means': rfm_means.to_dict('records'),
+        'region_variety': crosstab,
+        'charts': report_charts.build_charts(cube, rates, rfm),
+    }
+
+
+def render_report(context):
+    return Environment(keep_trailing_newline=True).from_string(REPORT_TEMPLATE).render(**context)
+
+
+def missing_chart_files(charts, timings):
+    """보고서가 참조하지만 생성되지 않은 차트 이미지 파일명 (timings가 None이면 전부)."""
+    return [chart.spec.filename for chart in charts if timings is None or chart.spec.filename not in timings]
+
+
+def chart_notice(missing_charts, no_engine):
+    """보고서 상단에 표시할 차트 누락 안내문 (누락이 없으면 None)."""
+    if not missing_charts:
+        return None
+    if no_engine:
+        return ('kaleido가 설치되지 않아 차트 이미지를 생성하지 못했습니다. '
+                '`pip install kaleido` 후 다시 생성하세요. (kaleido 1.x는 Chrome/Chromium이 필요합니다)')
+    return f"차트 {len(missing_charts)}개 생성 실패: {', '.join(missing_charts)} (로그 참고)"
+
+
+def generate_report(data_path=DEFAULT_DATA_PATH, output_path=DEFAULT_OUTPUT_PATH, image_dir='.',
+                    render_images=True, workers=None, force_charts=False):
+    """
+    데이터를 읽어 최종 통합 분석 보고서(Markdown)와 차트 이미지를 생성하는 함수입니다.
+    차트는 데이터가 바뀐 것만 다시 그립니다.
+    반환값은 (보고서 경로, 생성되지 않은 차트 파일명 목록)이며 데이터가 없으면 (None, [])입니다.
+    """
+    start = time.perf_counter()
+    # 파일 또는 월별 파티션 폴더
+    df = partitions.load_path(data_path, columns=None)
+    if df is None:
+        print(f"데이터 파일을 찾을 수 없습니다: {data_path}")
+        return None, []
+    loaded = time.perf_counter()
+
+    context = compute_report(df)
+    context.update({
+        'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'data_name': os.path.basename(data_path),
+        'images': image_dir.rstrip('/') or '.',
+    })
+    computed = time.perf_counter()
+
+    timings = report_charts.render_charts(context['charts'], image_dir, workers=workers, force=force_charts) if render_images else {}
+    missing_charts = missing_chart_files(context['charts'], timings) if render_images else []
+    context['chart_notice'] = chart_notice(missing_charts, timings is None)
+
+    with open(output_path, "w", encoding="utf-8-sig") as f:
+        f.write(render_report(context))
+
+    if missing_charts:
+        print(f"경고: {context['chart_notice']}")
+    print(f"보고서가 생성되었습니다: {os.path.abspath(output_path)}")
+    if timings:
+        rendered = sum(seconds is not None for seconds in timings.values())
+        print(f"차트 {rendered}개 생성, {len(timings) - rendered}개 변경 없음:")
+        for name, seconds in timings.items():
+            print(f"  {name}: {'건너뜀' if seconds is None else f'{seconds:.2f}초'}")
+    print(f"(로드 {loaded - start:.2f}초, 계산 {computed - loaded:.2f}초, 전체 {time.perf_counter() - start:.2f}초)")
+    return output_path, missing_charts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='최종 통합 분석 보고서(Markdown)를 생성합니다.')
+    parser.add_argument('--data', default=DEFAULT_DATA_PATH, help=f'원본 데이터 파일 또는 파티션 폴더 (기본값: {DEFAULT_DATA_PATH})')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_PATH, help=f'보고서 파일 경로 (기본값: {DEFAULT_OUTPUT_PATH})')
+    parser.add_argument('--images', default='.', help='차트 이미지 폴더 (보고서에서 참조)')
+    parser.add_argument('--no-charts', action='store_true', help='차트 이미지를 생성하지 않음')
+    parser.add_argument('--force-charts', action='store_true', help='변경 여부와 관계없이 모든 차트를 다시 생성')
+    parser.add_argument('--workers', type=int, default=None, help='차트 생성 프로세스 수 (기본값: CPU 수)')
+    args = parser.parse_args()
+    output_path, missing_charts = generate_report(args.data, args.output, args.images, render_images=not args.no_charts,
+                                                  workers=args.workers, force_charts=args.force_charts)
+    # 데이터가 없거나 보고서가 참조하는 차트 이미지가 빠졌으면 실패로 종료
+    sys.exit(1 if output_path is None or missing_charts else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+
+import data_loader
+import order_cube
+import sketches
+from column_store import ColumnStore
+from filter_index import FilterIndex
+from rfm_store import RFMLog
+from sketches import OrderSketches
+
+logger = logging.getLogger(__name__)
+
+# 뒤에 주문이 계속 추가되는(append-only) 주문 CSV를 증분으로 반영하는 데이터셋
+# - 이미 읽은 바이트 위치(offset)와 행 수를 기록해 두고, 파일이 늘어나면 추가된 줄만 읽어 전처리
+# - 전처리된 데이터, 일자 큐브, 필터 색인, RFM 기록, 스케치에 추가분만 덧붙여 새 스냅샷을 만듦
+# - 앞부분이 바뀌었거나(파일 교체) 파일이 줄어들면 전체를 다시 읽음
+# 스냅샷은 만든 뒤 수정하지 않으므로, 다른 세션이 이전 스냅샷을 읽는 중에도 안전하게 교체할 수 있음
+# 추가 반영은 기존 데이터를 복사하지 않음 (추가분 크기에 비례, 버퍼 재할당만 상환 O(1))
+# - 데이터프레임, 큐브, 스케치 표: column_store.ColumnStore (칼럼별 append-only 버퍼의 뷰)
+#   큐브/스케치는 경계 일자의 같은 키가 두 행이 될 수 있으나 조회 쪽이 모두 합산하므로 결과는 같음
+# - FilterIndex.extend: 정렬 순서/일자 배열과 역색인 목록을 append-only 버퍼에 덧붙임
+# - RFMLog: 추가분별 고객 부분 집계를 쌓고 비슷한 크기끼리만 합침 (점수 계산 시 합산)
+# 예외: 추가분에 기존 마지막 주문일보다 이른 행이 있으면 색인을 다시 만들고 큐브/스케치는 그 일자 이후를 다시 합침.
+# 새 셀러/품종 등이 기존 값들 사이에 정렬되면 그 칼럼의 코드만 다시 매김 (column_store 참고)
+
+# 데이터셋 한 시점의 상태. version은 분석 결과 캐시 키로 사용 (offset, 행 수)
+Snapshot = namedtuple('Snapshot', ['df', 'cube', 'index', 'rfm', 'sketches', 'offset', 'version', 'refreshed_at'])
+
+# 스케치 표 이름 -> 같은 키끼리 합치는 방법
+SKETCH_TABLES = {'customers': 'max', 'amounts': 'sum', 'prices': 'sum'}
+
+# 전체 로드 중 파일이 계속 늘어날 때 다시 시도할 횟수
+FULL_LOAD_ATTEMPTS = 3
+
+
+def _stat(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def head_digest(path, length):
+    """파일 앞 length바이트(최대 HASH_BLOCK_SIZE)의 해시. 앞부분이 그대로인지(추가만 됐는지) 확인용."""
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read(min(length, data_loader.HASH_BLOCK_SIZE))).hexdigest()
+
+
+def _ends_with_newline(path, offset):
+    if offset == 0:
+        return True
+    with open(path, 'rb') as f:
+        f.seek(offset - 1)
+        return f.read(1) == b'\n'
+
+
+class IncrementalDataset:
+    """append-only 주문 CSV의 증분 반영 데이터셋. refresh()가 최신 스냅샷을 반환합니다."""
+
+    def __init__(self, file_path, columns=data_loader.DASHBOARD_COLUMNS):
+        self.path = file_path
+        self.columns = columns
+        self._lock = threading.Lock()
+        self._stat = None
+        self._head = None
+        self.snapshot = None
+        # 스냅샷의 데이터프레임/큐브/스케치 표를 담은 append-only 저장소
+        self._stores = None
+        # 마지막 refresh의 처리 방식과 추가 행 수 (화면 표시용)
+        self.last_refresh = None
+
+    def has_new_data(self):
+        """파일 크기/수정시각이 마지막으로 확인한 뒤 바뀌었는지 (stat만 확인)."""
+        try:
+            return _stat(self.path) != self._stat
+        except FileNotFoundError:
+            return False
+
+    def refresh(self):
+        """파일 변화를 반영한 최신 스냅샷. 바뀐 것이 없으면 기존 스냅샷을 그대로 반환합니다."""
+        with self._lock:
+            if not os.path.exists(self.path):
+                return self.snapshot
+            stat = _stat(self.path)
+            if self.snapshot is not None and stat == self._stat:
+                return self.snapshot
+            start = time.perf_counter()
+            previous = self.snapshot
+            if previous is not None and self._can_append(stat):
+                snapshot, mode = self._append(previous), 'append'
+                added = len(snapshot.df) - len(previous.df)
+            else:
+                snapshot, mode = self._full_load(), 'full'
+                added = len(snapshot.df)
+            self._stat = stat
+            self.last_refresh = {'mode': mode, 'rows': added, 'seconds': time.perf_counter() - start}
+            logger.info('데이터 반영(%s): %s건 추가, 전체 %s건, %.2f초',
+                        mode, f'{added:,}', f'{len(snapshot.df):,}', self.last_refresh['seconds'])
+            self.snapshot = snapshot
+            return snapshot
+
+    def _can_append(self, stat):
+        offset = self.snapshot.offset
+        # 줄어들었거나, 이미 읽은 앞부분이 바뀌었거나, 마지막으로 읽은 위치가 줄 경계가 아니면 전체 재로드
+        return (self._head is not None
+                and stat[0] >= offset
+                and head_digest(self.path, offset) == self._head
+                and _ends_with_newline(self.path, offset))
+
+    def _full_load(self):
+        for _ in range(FULL_LOAD_ATTEMPTS):
+            before = _stat(self.path)
+            df = data_loader.load_dataset(self.path, columns=self.columns)
+            stable = _stat(self.path) == before
+            if stable:
+                break
+        offset = before[0]
+        # 로드하는 동안에도 계속 늘어났다면 어디까지 읽었는지 알 수 없으므로 다음 refresh에서 다시 전체 로드
+        self._head = head_digest(self.path, offset) if stable else None
+        tables = OrderSketches.from_orders(df)
+        self._stores = {
+            # UID는 처음 본 순서로 카테고리를 붙임 (고객 수만큼의 코드 재매김을 피함)
+            'df': ColumnStore(df, unsorted_categories=['UID']),
+            'cube': ColumnStore(order_cube.build_cube(df)),
+            **{name: ColumnStore(getattr(tables, name)) for name in SKETCH_TABLES},
+        }
+        return self._snapshot(RFMLog.from_orders(df), FilterIndex(df), offset)
+
+    def _snapshot(self, rfm, index, offset):
+        df = self._stores['df'].frame
+        return Snapshot(
+            df=df,
+            cube=self._stores['cube'].frame,
+            index=index,
+            rfm=rfm,
+            sketches=OrderSketches(*(self._stores[name].frame for name in SKETCH_TABLES)),
+            offset=offset,
+            version=(offset, len(df)),
+            refreshed_at=time.time(),
+        )
+
+    def _append(self, snapshot):
+        tail, offset = data_loader.read_tail(self.path, snapshot.offset, self.columns)
+        if tail is None:
+            return snapshot
+        tail = data_loader.preprocess(tail)
+        stores = dict(self._stores)
+        stores['df'] = stores['df'].append(tail)
+        df = stores['df'].frame
+        # 새 행이 기존 마지막 주문일보다 이르면 색인 위치가 바뀌므로 색인만 전체 재생성
+        index = snapshot.index.extend(tail) or FilterIndex(df)
+        stores['cube'] = _append_table(stores['cube'], order_cube.build_cube(tail), order_cube.merge_cube)
+        tables = OrderSketches.from_orders(tail)
+        for name, how in SKETCH_TABLES.items():
+            stores[name] = _append_table(stores[name], getattr(tables, name),
+                                         lambda table, new, how=how: sketches.merge_table(table, new, how))
+        self._stores = stores
+        self._head = head_digest(self.path, offset)
+        # 추가분 행(합쳐진 UID 카테고리 기준, 뷰)만 누적
+        return self._snapshot(snapshot.rfm.append(df.iloc[len(snapshot.df):]), index, offset)
+
+
+def _append_table(store, table, merge):
+    """일자 오름차순 표(큐브/스케치) 저장소에 추가분으로 만든 표를 합친 새 저장소."""
+    if table.empty:
+        return store
+    frame = store.frame
+    if frame.empty or table['주문일'].iloc[0] >= frame['주문일'].iloc[-1]:
+        return store.append(table)
+    return ColumnStore(merge(frame, table))
@@ -0,0 +1,84 @@
+import functools
+import hashlib
+import json
+import operator
+import re
+
+import numpy as np
+import pandas as pd
+
+# 상품명 키워드 카테고리 (대소문자 무시, 문자열 그대로 비교)
+KW_CATEGORIES = {
+    '이벤트': ['1+1', '사전예약'],
+    '맛강조': ['과즙폭발', '꿀', '당도'],
+    '가성비': ['실속'],
+    '품종': ['타이벡', '조생'],
+    '원산지': ['제주', '해남']
+}
+
+# 상품명별 키워드 플래그를 저장할 칼럼 (카테고리 i -> 비트 1 << i)
+FLAG_COLUMN = '키워드'
+
+
+def signature(categories=KW_CATEGORIES):
+    """키워드 사전이 바뀌면 달라지는 짧은 해시 (캐시 무효화용)."""
+    return hashlib.sha1(json.dumps(categories, ensure_ascii=False, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def flag_dtype(categories=KW_CATEGORIES):
+    n = len(categories)
+    return np.uint8 if n <= 8 else np.uint16 if n <= 16 else np.uint32 if n <= 32 else np.uint64
+
+
+class KeywordMatcher:
+    """모든 카테고리의 키워드를 하나의 패턴으로 묶어 문자열을 한 번만 훑는 매처.
+
+    각 위치에서 가장 긴 키워드가 잡히므로, 같은 위치에서 시작하는 더 짧은 키워드
+    (= 잡힌 키워드의 접두어)의 비트도 함께 켜 두어 키워드별 개별 검색과 결과가 같습니다.
+    """
+
+    def __init__(self, categories=KW_CATEGORIES):
+        self.categories = list(categories)
+        bits = {}
+        for i, keywords in enumerate(categories.values()):
+            for kw in keywords:
+                kw = kw.casefold()
+                bits[kw] = bits.get(kw, 0) | (1 << i)
+        # 매칭된 키워드 -> 자신과 자신의 접두어인 키워드들의 비트
+        self.bits = {
+            kw: functools.reduce(operator.or_, (b for other, b in bits.items() if kw.startswith(other)))
+            for kw in bits
+        }
+        alternatives = '|'.join(re.escape(kw) for kw in sorted(bits, key=len, reverse=True))
+        self.pattern = re.compile(f'(?=({alternatives}))')
+
+    def match(self, text):
+        """문자열 하나의 카테고리 비트마스크."""
+        mask = 0
+        for m in self.pattern.finditer(text.casefold()):
+            mask |= self.bits[m.group(1)]
+        return mask
+
+    def flags(self, names):
+        """상품명 Series -> 행별 비트마스크 배열. 같은 상품명은 한 번만 검사합니다."""
+        codes, uniques = pd.factorize(names)
+        unique_flags = np.fromiter((self.match(str(u)) for u in uniques), dtype=flag_dtype(self.categories), count=len(uniques))
+        # 결측(-1)은 끝에 붙인 0 (키워드 없음). 상품명이 모두 결측이어도 동작
+        return np.append(unique_flags, unique_flags.dtype.type(0))[codes]
+
+
+def keyword_flags(names, categories=KW_CATEGORIES):
+    return KeywordMatcher(categories).flags(names)
+
+
+def get_flags(df):
+    """데이터프레임의 키워드 비트마스크. 로드 시 만든 칼럼이 없으면 새로 계산합니다."""
+    if FLAG_COLUMN in df.columns:
+        return df[FLAG_COLUMN].to_numpy()
+    return keyword_flags(df['상품명'])
+
+
+def flag_matrix(flags, categories=KW_CATEGORIES):
+    """비트마스크 -> 카테고리별 포함 여부(bool) 데이터프레임."""
+    flags = np.asarray(flags)
+    return pd.DataFrame({cat: (flags & (1 << i)) != 0 for i, cat in enumerate(categories)})
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+import repurchase
+from data_loader import SEASONS, SEASON_OF_MONTH, concat_frames
+
+# 큐브 차원: 일자 x 품종 x 셀러명 x 주문경로 x 광역지역
+CUBE_DIMS = ['품종', '셀러명', '주문경로', '광역지역(정식)']
+# 집계 지표
+CUBE_MEASURES = ['주문건수', '매출액', '결제건수', '재구매건수']
+
+
+def build_cube(df, dims=CUBE_DIMS):
+    """주문 데이터를 일자 x 차원(dims 중 df에 있는 칼럼)별로 미리 집계한 큐브를 만듭니다. (일자 오름차순 정렬)
+
+    - 주문건수: 주문 행 수
+    - 매출액: 실결제 금액 합계
+    - 결제건수: 실결제 금액이 있는 행 수 (평균 객단가 계산용)
+    - 재구매건수: 재구매 횟수 > 0 인 행 수
+    """
+    dims = [c for c in dims if c in df.columns]
+    base = pd.DataFrame({
+        '주문일': df['주문일'].dt.normalize(),
+        **{c: df[c] for c in dims},
+        '실결제 금액': df['실결제 금액'],
+        '재구매': (df['재구매 횟수'] > 0).astype('int64'),
+    })
+    cube = base.groupby(['주문일', *dims], observed=True, dropna=False, sort=True).agg(
+        주문건수=('재구매', 'size'),
+        매출액=('실결제 금액', 'sum'),
+        결제건수=('실결제 금액', 'count'),
+        재구매건수=('재구매', 'sum'),
+    ).reset_index()
+    return cube
+
+
+def merge_cube(cube, new_cube):
+    """기존 큐브에 새 주문으로 만든 큐브를 합칩니다.
+
+    새 주문의 첫 일자 이전 부분은 그대로 두고, 그 이후 부분만 새 큐브와 함께 다시 합산합니다.
+    """
+    if new_cube.empty:
+        return cube
+    split = cube['주문일'].to_numpy().searchsorted(new_cube['주문일'].to_numpy().min(), 'left')
+    keys = [c for c in cube.columns if c not in CUBE_MEASURES]
+    merged = concat_frames([cube.iloc[split:], new_cube]).groupby(
+        keys, observed=True, dropna=False, sort=True)[CUBE_MEASURES].sum().reset_index()
+    return concat_frames([cube.iloc[:split], merged])
+
+
+def slice_cube(cube, varieties=None, start=None, end=None):
+    """품종/기간 조건에 해당하는 큐브 조각을 반환합니다. (start, end는 포함 범위의 날짜)
+
+    증분 반영한 큐브는 같은 일자 x 차원 키가 여러 행일 수 있으므로, 조각은 항상 합산해서 씁니다.
+    """
+    days = cube['주문일'].to_numpy()
+    lo = 0 if start is None else days.searchsorted(np.datetime64(pd.Timestamp(start)), 'left')
+    hi = len(days) if end is None else days.searchsorted(np.datetime64(pd.Timestamp(end) + pd.Timedelta(days=1)), 'left')
+    part = cube.iloc[lo:hi]
+    if varieties:
+        part = part[part['품종'].isin(varieties)]
+    else:
+        part = part[part['품종'].notna()]
+    return part
+
+
+def cube_kpis(part):
+    """큐브 조각에서 상단 KPI(주문 건수, 매출액, 평균 객단가, 재구매율)를 계산합니다."""
+    orders = int(part['주문건수'].sum())
+    revenue = float(part['매출액'].sum())
+    paid = int(part['결제건수'].sum())
+    repeats = int(part['재구매건수'].sum())
+    return {
+        '주문건수': orders,
+        '매출액': revenue,
+        '평균객단가': revenue / paid if paid > 0 else 0,
+        '재구매율': repeats / orders * 100 if orders > 0 else 0,
+    }
+
+
+def rollup(part, dims, measures=('주문건수',)):
+    """큐브 조각을 주어진 차원으로 다시 합산합니다."""
+    return part.groupby(list(dims), observed=True, sort=False)[list(measures)].sum().reset_index()
+
+
+def cube_repurchase_rates(part, dims=repurchase.REPURCHASE_DIMS, min_orders=1):
+    """큐브 조각의 주문건수/재구매건수로 차원별 재구매율 표를 만듭니다. (repurchase.repurchase_rates와 같은 결과)"""
+    results = {}
+    for dim in dims:
+        if dim not in part.columns:
+            continue
+        counts = part.groupby(dim, observed=True, sort=True)[['주문건수', '재구매건수']].sum()
+        results[dim] = repurchase.rate_table(
+            dim, counts.index.to_numpy(dtype=object), counts['주문건수'].to_numpy(np.int64),
+            counts['재구매건수'].to_numpy(np.int64), min_orders)
+    return results
+
+
+def season_rollup(part, dims=()):
+    """큐브 조각의 주문건수를 시즌별(및 추가 차원별)로 합산합니다."""
+    season = pd.Series(pd.Categorical.from_codes(SEASON_OF_MONTH[part['주문일'].dt.month.to_numpy() - 1], SEASONS),
+                       index=part.index, name='시즌')
+    counts = part['주문건수'].groupby([season, *(part[d] for d in dims)], observed=True).sum()
+    return counts[counts > 0].reset_index(name='count')
@@ -0,0 +1,150 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+
+import pandas as pd
+
+import data_loader
+
+logger = logging.getLogger(__name__)
+
+# 월별 export 파일을 모아 둔 폴더를 하나의 데이터셋으로 읽는 도구
+# - 폴더 안의 CSV/Parquet 파일(파티션)을 glob으로 찾고, 파티션별 주문일 범위/건수/품종을 매니페스트(JSON)에 기록
+# - 매니페스트는 크기/수정시각이 바뀐 파티션만 다시 훑어 갱신
+# - 기간 필터와 겹치는 파티션만 읽어 합침 (파티션별 전처리 결과는 각각 Parquet 캐시로 저장)
+
+PARTITION_PATTERNS = ('*.csv', '*.parquet')
+MANIFEST_NAME = 'manifest.json'
+
+
+def discover(directory):
+    """폴더 안의 파티션 파일 경로 목록 (파일 이름 순)."""
+    paths = set()
+    for pattern in PARTITION_PATTERNS:
+        paths.update(glob.glob(os.path.join(directory, pattern)))
+    return sorted(paths)
+
+
+def cache_dir(directory):
+    """파티션 캐시와 매니페스트를 두는 폴더 (원본 폴더 경로별로 구분)."""
+    directory = os.path.abspath(directory)
+    tag = hashlib.sha1(directory.encode()).hexdigest()[:8]
+    return os.path.join(data_loader.CACHE_DIR, 'partitions', f'{os.path.basename(directory)}-{tag}')
+
+
+def stat_key(path):
+    """[크기, 수정시각] - 매니페스트 항목이 낡았는지 판단하는 키."""
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def scan_partition(path):
+    """파티션 하나의 매니페스트 항목. 주문일/품종 칼럼만 읽습니다."""
+    df = data_loader.read_source(path, columns=['주문일', '품종'])
+    # preprocess와 같은 기준: 주문일을 해석할 수 없는 행은 건수에서 제외
+    dates = pd.to_datetime(df['주문일'], errors='coerce')
+    valid = dates.notna()
+    varieties = df.loc[valid, '품종'].dropna().unique() if '품종' in df.columns else []
+    return {
+        'stat': stat_key(path),
+        'rows': int(valid.sum()),
+        'start': dates.min().isoformat() if valid.any() else None,
+        'end': dates.max().isoformat() if valid.any() else None,
+        'varieties': sorted(str(v) for v in varieties),
+    }
+
+
+def _manifest_path(directory):
+    return os.path.join(cache_dir(directory), MANIFEST_NAME)
+
+
+def read_manifest(directory):
+    """저장된 매니페스트 {파일 이름: 항목}. 없거나 전처리 버전이 다르면 빈 dict."""
+    try:
+        with open(_manifest_path(directory), encoding='utf-8') as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if stored.get('version') != data_loader.CACHE_VERSION:
+        return {}
+    return stored.get('partitions', {})
+
+
+def update_manifest(directory):
+    """폴더의 파티션 목록과 매니페스트를 맞춰 반환합니다. 새로 생기거나 바뀐 파티션만 다시 훑습니다."""
+    stored = read_manifest(directory)
+    manifest = {}
+    for path in discover(directory):
+        name = os.path.basename(path)
+        entry = stored.get(name)
+        if entry is None or entry['stat'] != stat_key(path):
+            entry = scan_partition(path)
+            logger.info('파티션 매니페스트 갱신: %s (%s건, %s ~ %s)', name, f"{entry['rows']:,}", entry['start'], entry['end'])
+        manifest[name] = entry
+
+    if manifest != stored:
+        path = _manifest_path(directory)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': data_loader.CACHE_VERSION, 'partitions': manifest}, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+    return manifest
+
+
+def summary(manifest):
+    """전체 파티션의 기간/건수/품종 목록. 데이터가 없으면 None."""
+    entries = [e for e in manifest.values() if e['rows']]
+    if not entries:
+        return None
+    return {
+        'start': min(pd.Timestamp(e['start']) for e in entries),
+        'end': max(pd.Timestamp(e['end']) for e in entries),
+        'rows': sum(e['rows'] for e in entries),
+        'varieties': sorted(set().union(*(e['varieties'] for e in entries))),
+    }
+
+
+def select(manifest, start=None, end=None):
+    """기간 [start, end](일 단위 포함 범위)와 겹치는 파티션 이름 (파일 이름 순 tuple)."""
+    lo = None if start is None else pd.Timestamp(start).normalize()
+    hi = None if end is None else pd.Timestamp(end).normalize() + pd.Timedelta(days=1)
+    names = []
+    for name, entry in manifest.items():
+        if not entry['rows']:
+            continue
+        if hi is not None and pd.Timestamp(entry['start']) >= hi:
+            continue
+        if lo is not None and pd.Timestamp(entry['end']) < lo:
+            continue
+        names.append(name)
+    return tuple(names)
+
+
+def load_partitions(directory, names, use_cache=True, columns=data_loader.DASHBOARD_COLUMNS):
+    """선택한 파티션만 읽어(파티션별 Parquet 캐시 사용) 하나의 데이터프레임으로 합칩니다."""
+    frames = [
+        data_loader.load_dataset(os.path.join(directory, name), use_cache, cache_dir(directory), columns)
+        for name in names
+    ]
+    return data_loader.concat_frames([f for f in frames if f is not None])
+
+
+def cache_files(directory, names, columns=data_loader.DASHBOARD_COLUMNS):
+    """파티션별 Parquet 캐시 경로 목록. 하나라도 없거나 낡았으면 None."""
+    paths = []
+    for name in names:
+        source = os.path.join(directory, name)
+        if not data_loader.cache_is_fresh(source, cache_dir=cache_dir(directory), columns=columns):
+            return None
+        paths.append(data_loader.cache_path(source, cache_dir(directory), columns))
+    return paths
+
+
+def load_path(path, start=None, end=None, columns=data_loader.DASHBOARD_COLUMNS):
+    """파일이면 그대로, 폴더면 기간과 겹치는 파티션만 읽어 전처리된 데이터를 반환합니다."""
+    if not os.path.isdir(path):
+        return data_loader.load_dataset(path, columns=columns)
+    return load_partitions(path, select(update_manifest(path), start, end), columns=columns)
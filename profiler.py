@@ -0,0 +1,143 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+# 대시보드 실행(rerun) 단위 구간 계측 (켜져 있을 때만 동작)
+# - 구간별 경과 시간, 입력/출력 행 수, tracemalloc 기준 최대 추가 메모리
+# - tracemalloc은 프로세스 전체를 추적하므로, 동시에 다른 세션이 계산 중이면 메모리 값이 섞일 수 있음
+
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+
+
+def _start_tracing():
+    global _tracing_users
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracing_users += 1
+
+
+def _stop_tracing():
+    global _tracing_users
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+class _Span:
+    __slots__ = ('name', 'kind', 'rows_in', 'rows_out', 'seconds', 'peak_mb', 'depth', 'base', 'peak_seen')
+
+    def __init__(self, name, kind, rows_in, depth):
+        self.name, self.kind, self.rows_in, self.depth = name, kind, rows_in, depth
+        self.rows_out = self.seconds = self.peak_mb = None
+        self.base = self.peak_seen = 0
+
+    def as_dict(self):
+        return {k: getattr(self, k) for k in ('name', 'kind', 'depth', 'seconds', 'rows_in', 'rows_out', 'peak_mb')}
+
+
+def row_count(obj):
+    """결과 객체의 행 수 (모르면 None)."""
+    if obj is None:
+        return None
+    if hasattr(obj, 'shape'):
+        return int(obj.shape[0]) if len(obj.shape) else 1
+    if isinstance(obj, dict):
+        counts = [row_count(v) for v in obj.values()]
+        counts = [c for c in counts if c is not None]
+        return sum(counts) if counts else None
+    try:
+        return len(obj)
+    except TypeError:
+        return None
+
+
+class RunProfiler:
+    """한 번의 실행에서 구간(span)별 시간/행 수/메모리를 기록합니다. enabled=False면 아무것도 하지 않습니다."""
+
+    def __init__(self, enabled=False, memory=True):
+        self.enabled = enabled
+        self.memory = enabled and memory
+        self.spans = []
+        self._stack = []
+        self._start = time.perf_counter()
+        self.last_mark = self._start
+        if self.memory:
+            _start_tracing()
+
+    @contextmanager
+    def span(self, name, kind='block', rows_in=None):
+        """구간을 계측합니다. with 블록 안에서 record.rows_out을 지정할 수 있습니다."""
+        if not self.enabled:
+            yield _Span(name, kind, rows_in, 0)
+            return
+        record = _Span(name, kind, rows_in, len(self._stack))
+        self.spans.append(record)
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                parent = self._stack[-1]
+                parent.peak_seen = max(parent.peak_seen, peak)
+            tracemalloc.reset_peak()
+            record.base = record.peak_seen = current
+        self._stack.append(record)
+        start = self.last_mark = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            self._stack.pop()
+            if self.memory:
+                peak = max(tracemalloc.get_traced_memory()[1], record.peak_seen)
+                record.peak_mb = max(peak - record.base, 0) / 2 ** 20
+                tracemalloc.reset_peak()
+                if self._stack:
+                    parent = self._stack[-1]
+                    parent.peak_seen = max(parent.peak_seen, peak)
+            self.last_mark = time.perf_counter()
+
+    def call(self, name, kind, func, *args, rows_in=None, **kwargs):
+        """func(*args, **kwargs)를 계측하며 실행하고, 결과의 행 수를 출력 행 수로 기록합니다."""
+        with self.span(name, kind, rows_in) as record:
+            result = func(*args, **kwargs)
+            record.rows_out = row_count(result)
+        return result
+
+    def add(self, name, kind, seconds, rows_in=None, rows_out=None):
+        """이미 측정된 구간을 추가합니다."""
+        if not self.enabled:
+            return
+        record = _Span(name, kind, rows_in, len(self._stack))
+        record.seconds, record.rows_out = seconds, rows_out
+        self.spans.append(record)
+
+    def total_seconds(self):
+        return time.perf_counter() - self._start
+
+    def records(self):
+        return [s.as_dict() for s in self.spans]
+
+    def close(self):
+        if self.memory:
+            self.memory = False
+            _stop_tracing()
+
+    def write_jsonl(self, path, **context):
+        """이번 실행의 구간 기록을 JSONL 로그에 한 줄로 추가합니다."""
+        if not self.enabled:
+            return
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        entry = {
+            'ts': datetime.now().isoformat(timespec='milliseconds'),
+            'total_seconds': round(self.total_seconds(), 6),
+            **context,
+            'spans': self.records(),
+        }
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
@@ -0,0 +1,155 @@
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import order_cube
+from variety_labels import by_label
+
+logger = logging.getLogger(__name__)
+
+# 차트 정의: 파일명, 종류(bar/barh/pie/grouped_bar), 제목, x/y 칼럼, 색 구분 칼럼
+ChartSpec = namedtuple('ChartSpec', ['filename', 'kind', 'title', 'x', 'y', 'color'], defaults=[None])
+Chart = namedtuple('Chart', ['spec', 'data'])
+
+# 렌더링 결과 해시를 기록하는 파일 (이미지 폴더 안)
+MANIFEST_NAME = '.chart_manifest.json'
+CHART_WIDTH, CHART_HEIGHT, CHART_SCALE = 900, 540, 2
+
+
+def build_charts(cube, rates, rfm, top_sellers=15):
+    """보고서 차트마다 그릴 집계표를 만듭니다. 원본 행 대신 보고서 큐브(가격대/결제방법 차원 포함)를 다시 합산합니다."""
+    seller_rates = rates.get('셀러명')
+    if seller_rates is not None:
+        seller_rates = seller_rates.nlargest(top_sellers, '재구매율(%)')
+    segments = rfm['Segment'].value_counts().rename_axis('Segment').reset_index(name='고객수')
+
+    charts = [
+        Chart(ChartSpec('01_region_counts.png', 'barh', '지역별 주문 건수', '주문건수', '광역지역(정식)'),
+              order_cube.rollup(cube, ['광역지역(정식)']).sort_values('주문건수')),
+        Chart(ChartSpec('02_order_channel.png', 'pie', '주문경로별 비중', '주문경로', '주문건수'),
+              order_cube.rollup(cube, ['주문경로']).sort_values('주문건수', ascending=False)),
+        Chart(ChartSpec('03_payment_method.png', 'bar', '결제방법 분포', '결제방법', 'count'),
+              value_counts(cube, '결제방법').sort_values(ascending=False).reset_index() if '결제방법' in cube.columns else None),
+        Chart(ChartSpec('04_product_variety.png', 'bar', '품종별 판매 건수', '품종', '주문건수'),
+              by_label(order_cube.rollup(cube, ['품종']), ['주문건수']).sort_values('주문건수', ascending=False)),
+        Chart(ChartSpec('05_price_range.png', 'bar', '가격대별 주문 분포', '가격대', 'count'),
+              value_counts(cube, '가격대').reset_index() if '가격대' in cube.columns else None),
+        Chart(ChartSpec('seasonal_product_popularity.png', 'grouped_bar', '시즌별 인기 품목', '시즌', 'count', '품종'),
+              by_label(order_cube.season_rollup(cube, ['품종']), ['count'])),
+        Chart(ChartSpec('repurchase_by_product.png', 'bar', '품종별 재구매율(%)', '품종', '재구매율(%)'),
+              rates.get('품종')),
+        Chart(ChartSpec('repurchase_by_seller.png', 'bar', f'셀러별 재구매율(%) 상위 {top_sellers}', '셀러명', '재구매율(%)'),
+              seller_rates),
+        Chart(ChartSpec('repurchase_by_membership.png', 'bar', '회원구분별 재구매율(%)', '회원구분', '재구매율(%)'),
+              rates.get('회원구분')),
+        Chart(ChartSpec('repurchase_by_channel.png', 'bar', '주문경로별 재구매율(%)', '주문경로', '재구매율(%)'),
+              rates.get('주문경로')),
+        Chart(ChartSpec('rfm_customer_segments.png', 'pie', 'RFM 고객 세그먼트', 'Segment', '고객수'), segments),
+    ]
+    return [chart for chart in charts if chart.data is not None and not chart.data.empty]
+
+
+def value_counts(cube, dim):
+    """큐브의 차원 값별 주문건수 (값 순서, 0건 포함). Series.value_counts(sort=False)와 같은 형식."""
+    return cube.groupby(dim, observed=False, sort=True)['주문건수'].sum().rename('count')
+
+
+def chart_key(chart):
+    """차트 사양 + 집계표 내용 해시. 둘 중 하나라도 바뀌면 다시 그립니다."""
+    import plotly
+
+    data = chart.data[[c for c in (chart.spec.x, chart.spec.y, chart.spec.color) if c]]
+    payload = {
+        'spec': chart.spec._asdict(),
+        'size': [CHART_WIDTH, CHART_HEIGHT, CHART_SCALE],
+        'plotly': plotly.__version__,
+    }
+    digest = hashlib.sha1(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode())
+    digest.update(data.astype(str).to_json(orient='split', index=False, force_ascii=False).encode())
+    return digest.hexdigest()
+
+
+def make_figure(chart):
+    """집계표로 plotly 그림을 만듭니다."""
+    import plotly.express as px
+
+    spec, data = chart.spec, chart.data
+    if spec.kind == 'pie':
+        fig = px.pie(data, names=spec.x, values=spec.y, title=spec.title, hole=0.4)
+    elif spec.kind == 'barh':
+        fig = px.bar(data, x=spec.x, y=spec.y, orientation='h', title=spec.title, text_auto=True)
+    elif spec.kind == 'grouped_bar':
+        fig = px.bar(data, x=spec.x, y=spec.y, color=spec.color, barmode='group', title=spec.title)
+    else:
+        fig = px.bar(data, x=spec.x, y=spec.y, title=spec.title, text_auto=True)
+    fig.update_layout(template='plotly_white', font=dict(family='Malgun Gothic, AppleGothic, NanumGothic, sans-serif'))
+    return fig
+
+
+def render_chart(chart, path):
+    """차트 하나를 PNG로 저장하고 걸린 시간(초)을 반환합니다. (프로세스 풀 작업 단위)"""
+    start = time.perf_counter()
+    tmp_path = f'{path}.tmp.png'
+    make_figure(chart).write_image(tmp_path, width=CHART_WIDTH, height=CHART_HEIGHT, scale=CHART_SCALE)
+    os.replace(tmp_path, path)
+    return time.perf_counter() - start
+
+
+def _load_manifest(image_dir):
+    try:
+        with open(os.path.join(image_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(image_dir, manifest):
+    path = os.path.join(image_dir, MANIFEST_NAME)
+    with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(f'{path}.tmp', path)
+
+
+def render_charts(charts, image_dir='.', workers=None, force=False):
+    """바뀐 차트만 프로세스 풀에서 병렬로 그립니다.
+
+    차트별 해시(사양 + 집계표)를 이미지 폴더의 manifest에 기록해 두고, 해시가 같고 파일이 있으면 건너뜁니다.
+    반환값은 {파일명: 렌더링 시간(초), 건너뛴 차트는 None}이며 생성에 실패한 차트는 빠집니다.
+    kaleido가 없으면 아무것도 그리지 않고 None을 반환합니다.
+    """
+    try:
+        import kaleido  # noqa: F401 (plotly PNG 내보내기 엔진, 1.x는 Chrome/Chromium 필요)
+    except ImportError:
+        logger.warning('kaleido가 없어 차트 이미지를 생성하지 않습니다. (pip install kaleido)')
+        return None
+
+    os.makedirs(image_dir, exist_ok=True)
+    manifest = _load_manifest(image_dir)
+    timings, pending = {}, {}
+    for chart in charts:
+        name = chart.spec.filename
+        key = chart_key(chart)
+        if not force and manifest.get(name) == key and os.path.exists(os.path.join(image_dir, name)):
+            timings[name] = None
+        else:
+            pending[name] = (chart, key)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(pending))) as pool:
+            futures = {name: pool.submit(render_chart, chart, os.path.join(image_dir, name)) for name, (chart, _) in pending.items()}
+            for name, future in futures.items():
+                try:
+                    timings[name] = future.result()
+                except Exception:
+                    logger.exception('차트 생성 실패: %s', name)
+                    manifest.pop(name, None)
+                    continue
+                manifest[name] = pending[name][1]
+        _save_manifest(image_dir, manifest)
+    return timings
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from variety_labels import MULTI_LABEL_DIMS, VarietyLabels
+
+# 재구매율을 계산할 기본 차원
+REPURCHASE_DIMS = ['품종', '셀러명', '회원구분', '주문경로']
+RATE_COLUMNS = ['주문건수', '재구매건수', '재구매율(%)', '하한(%)', '상한(%)']
+
+
+def wilson_interval(successes, totals, z=1.96):
+    """이항 비율의 Wilson 신뢰구간 (하한, 상한), 0~1 비율."""
+    successes = np.asarray(successes, dtype=float)
+    totals = np.asarray(totals, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = successes / totals
+        denom = 1 + z ** 2 / totals
+        center = (p + z ** 2 / (2 * totals)) / denom
+        half = z * np.sqrt(p * (1 - p) / totals + z ** 2 / (4 * totals ** 2)) / denom
+    return center - half, center + half
+
+
+def repurchase_rates(df, dims=REPURCHASE_DIMS, min_orders=1, z=1.96, weights=None):
+    """차원별 재구매율(재구매 횟수 > 0 인 주문 비율)과 주문 건수, 신뢰구간.
+
+    재구매 여부는 한 번만 계산하고, 차원별로 코드 배열에 bincount를 적용해 집계합니다.
+    min_orders는 정수 또는 {차원: 최소 주문 건수}이며, 주문 건수가 이보다 적은 값은 제외합니다.
+    결측 차원 값은 제외합니다. 반환값은 {차원: 데이터프레임}.
+    weights(행별 가중치)가 주어지면 df는 표본이고, 주문/재구매 건수는 가중 합계로 추정합니다.
+    """
+    repeat = (df['재구매 횟수'] > 0).to_numpy(dtype=bool, na_value=False)
+    results = {}
+    for dim in dims:
+        if dim not in df.columns:
+            continue
+        codes, values = pd.factorize(df[dim], sort=True)
+        valid = codes >= 0
+        orders = np.bincount(codes[valid], minlength=len(values))
+        if weights is None:
+            repeats = np.bincount(codes[valid], weights=repeat[valid], minlength=len(values)).astype(np.int64)
+            results[dim] = rate_table(dim, np.asarray(values), orders, repeats, min_orders, z)
+            continue
+        w = np.asarray(weights, dtype=np.float64)[valid]
+        estimated = np.rint(np.bincount(codes[valid], weights=w, minlength=len(values))).astype(np.int64)
+        repeats = np.rint(np.bincount(codes[valid], weights=w * repeat[valid], minlength=len(values))).astype(np.int64)
+        results[dim] = rate_table(dim, np.asarray(values), estimated, repeats, min_orders, z, sampled=orders)
+    return results
+
+
+def rate_table(dim, values, orders, repeats, min_orders=1, z=1.96, sampled=None):
+    """차원 값별 주문 건수/재구매 건수 배열로 재구매율 표를 만듭니다. (SQL 백엔드와 공용)
+
+    다중 라벨 차원(품종)은 콤보 값의 건수를 포함된 품종마다 더해 단일 품종별 표로 만듭니다.
+    sampled(값별 표본 건수)가 주어지면 orders/repeats는 표본 추정값이고, 신뢰구간은 표본 크기로 계산합니다.
+    """
+    if dim in MULTI_LABEL_DIMS:
+        incidence = VarietyLabels(values)
+        values = incidence.labels.to_numpy(dtype=object)
+        orders = incidence.sum_by_label(orders).astype(np.int64)
+        repeats = incidence.sum_by_label(repeats).astype(np.int64)
+        if sampled is not None:
+            sampled = incidence.sum_by_label(sampled).astype(np.int64)
+    threshold = min_orders.get(dim, 1) if isinstance(min_orders, dict) else min_orders
+    keep = orders >= max(threshold, 1)
+    orders, repeats = orders[keep], repeats[keep]
+    if sampled is None:
+        low, high = wilson_interval(repeats, orders, z)
+    else:
+        sampled = sampled[keep]
+        low, high = wilson_interval(repeats / orders * sampled, sampled, z)
+    return pd.DataFrame({
+        dim: values[keep],
+        '주문건수': orders,
+        '재구매건수': repeats,
+        '재구매율(%)': repeats / orders * 100,
+        '하한(%)': low * 100,
+        '상한(%)': high * 100,
+    })
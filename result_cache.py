@@ -0,0 +1,149 @@
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+
+
+def filter_key(varieties, start=None, end=None, dataset_version=None):
+    """필터 조건을 정규화한 해시 키. (품종 선택 순서와 무관)"""
+    payload = {
+        'varieties': sorted(str(v) for v in (varieties or [])),
+        'start': None if start is None else str(start),
+        'end': None if end is None else str(end),
+        'version': None if dataset_version is None else str(dataset_version),
+    }
+    return hashlib.sha1(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode()).hexdigest()
+
+
+def estimate_size(obj):
+    """캐시 항목의 대략적인 메모리 사용량(바이트)."""
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_size(k) + estimate_size(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(estimate_size(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+class ResultCache:
+    """메모리 한도 안에서 가장 오래 쓰이지 않은 항목부터 버리는(LRU) 분석 결과 캐시.
+
+    여러 세션(스레드)이 함께 쓰므로 반환된 결과는 수정하지 말고 읽기만 해야 합니다.
+    같은 항목을 여러 스레드가 동시에 요청하면 한 번만 계산하고 나머지는 그 결과를 기다립니다.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # 계산 중인 항목 (name, key) -> Future
+        self._pending = {}
+        # clear()마다 증가: 비우기 전에 시작한 계산의 결과는 저장하지 않음
+        self._generation = 0
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, name, key, default=None):
+        with self._lock:
+            entry = self._entries.get((name, key))
+            if entry is None:
+                return default
+            self._entries.move_to_end((name, key))
+            return entry[0]
+
+    def put(self, name, key, value):
+        size = estimate_size(value)
+        with self._lock:
+            self._insert(name, key, value, size)
+
+    def _insert(self, name, key, value, size):
+        # lock 안에서 호출
+        old = self._entries.pop((name, key), None)
+        if old is not None:
+            self.nbytes -= old[1]
+        # 한도보다 큰 결과는 저장하지 않음
+        if size > self.max_bytes:
+            return
+        self._entries[(name, key)] = (value, size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.evictions += 1
+
+    def get_or_compute(self, name, key, fn, *args, **kwargs):
+        """캐시에 있으면 바로 반환하고, 없으면 fn(*args, **kwargs)로 계산해 저장합니다."""
+        with self._lock:
+            entry = self._entries.get((name, key))
+            if entry is not None:
+                self._entries.move_to_end((name, key))
+                self.hits += 1
+                return entry[0]
+            waiting = self._pending.get((name, key))
+            if waiting is None:
+                self.misses += 1
+                pending = self._pending[(name, key)] = Future()
+                generation = self._generation
+            else:
+                self.hits += 1
+        if waiting is not None:
+            # 다른 스레드(미리 계산 포함)가 계산 중이면 그 결과를 기다림
+            return waiting.result()
+        try:
+            value = fn(*args, **kwargs)
+        except BaseException as exc:
+            self._finish(name, key, pending)
+            pending.set_exception(exc)
+            raise
+        size = estimate_size(value)
+        with self._lock:
+            if generation == self._generation:
+                self._insert(name, key, value, size)
+        self._finish(name, key, pending)
+        pending.set_result(value)
+        return value
+
+    def _finish(self, name, key, pending):
+        # clear() 뒤에 같은 항목을 새로 계산 중일 수 있으므로 자신의 Future일 때만 지움
+        with self._lock:
+            if self._pending.get((name, key)) is pending:
+                del self._pending[(name, key)]
+
+    def status(self, name, key):
+        """'cached'(저장됨), 'running'(계산 중) 또는 None."""
+        with self._lock:
+            if (name, key) in self._entries:
+                return 'cached'
+            return 'running' if (name, key) in self._pending else None
+
+    def clear(self):
+        """모든 항목을 지웁니다. 계산 중인 항목은 끝나도 저장하지 않고, 이후 요청은 새로 계산합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
+            self._generation += 1
+            self.nbytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'nbytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / total * 100 if total else 0.0,
+            }
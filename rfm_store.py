@@ -0,0 +1,216 @@
+import numpy as np
+import pandas as pd
+
+RFM_COLUMNS = ['Recency', 'Frequency', 'Monetary', 'R_Score', 'F_Score', 'M_Score', 'Total_Score', 'Segment']
+
+DAY_NS = 24 * 60 * 60 * 10 ** 9
+
+# 총점(3~15) -> 세그먼트
+SEGMENTS = np.array(['At-risk (이탈우려)', 'Regular (일반)', 'VIP (우수)', 'VVIP (최상위)'], dtype=object)
+SEGMENT_OF_SCORE = np.array([0] * 7 + [1] * 3 + [2] * 3 + [3] * 3)
+
+
+def uid_codes(uids, index=None):
+    """UID -> 조밀한 정수 코드와 코드 -> UID 인덱스.
+
+    UID가 category이면 카테고리 코드를 그대로 쓰고(groupby와 같은 순서), 아니면 정렬된 순서로 코드를 붙입니다.
+    증분 반영으로 카테고리가 처음 본 순서로 붙어 있으면 정렬된 순서의 코드로 바꿉니다. (전체 로드와 같은 고객 순서)
+    index가 주어지면 그 인덱스 기준으로 조회합니다. (인덱스에 없는 UID와 결측은 -1)
+    """
+    if index is not None:
+        return index.get_indexer(uids), index
+    if isinstance(uids.dtype, pd.CategoricalDtype):
+        codes, categories = uids.cat.codes.to_numpy(), uids.cat.categories
+        if categories.is_monotonic_increasing:
+            return codes, pd.Index(categories)
+        order = categories.argsort()
+        return np.where(codes >= 0, _ranks(order)[codes], -1), pd.Index(categories[order])
+    codes, uniques = pd.factorize(uids, sort=True)
+    return codes, pd.Index(uniques)
+
+
+def _ranks(order):
+    # 정렬 순서 order의 역순열: 원래 위치 -> 정렬된 위치
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(len(order))
+    return ranks
+
+
+def quantile_scores(values, labels):
+    """순위(동점은 등장 순서) 5분위 점수. pd.qcut(rank(method='first'), 5)와 같은 경계를 사용합니다."""
+    n = len(values)
+    if n < 2:
+        return np.full(n, 3, dtype=np.int64)
+    ranks = np.empty(n, dtype=np.float64)
+    ranks[np.argsort(values, kind='stable')] = np.arange(1, n + 1)
+    edges = np.quantile(ranks, [0.2, 0.4, 0.6, 0.8])
+    return np.asarray(labels)[np.searchsorted(edges, ranks, side='left')]
+
+
+class RFMStore:
+    """고객별 마지막 주문 시각, 주문 건수, 결제 금액 합계를 UID 코드 배열로 보관하는 저장소.
+
+    새 주문은 append로 누적하며, 점수는 배열 연산(분위 경계 + searchsorted)으로 계산합니다.
+    고객 순서(동점 순위 기준)는 UID 코드 순서이며, append로 처음 들어온 UID는 기존 고객 뒤에 붙습니다.
+    """
+
+    def __init__(self, uids):
+        self.uids = pd.Index(uids)
+        n = len(self.uids)
+        self.last_order = np.full(n, np.iinfo(np.int64).min, dtype=np.int64)
+        self.frequency = np.zeros(n, dtype=np.int64)
+        self.monetary = np.zeros(n, dtype=np.float64)
+
+    @classmethod
+    def from_orders(cls, df, uid_index=None):
+        codes, index = uid_codes(df['UID'], uid_index)
+        store = cls(index)
+        store._accumulate(codes, df)
+        return store
+
+    @classmethod
+    def from_arrays(cls, uids, last_order, frequency, monetary):
+        """고객별로 이미 집계된 배열(마지막 주문 시각 ns, 주문 건수, 결제 금액 합계)로 만듭니다. (SQL 백엔드용)"""
+        store = cls(uids)
+        store.last_order[:] = last_order
+        store.frequency[:] = frequency
+        store.monetary[:] = monetary
+        return store
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + self.last_order.nbytes + self.frequency.nbytes + self.monetary.nbytes + self.uids.memory_usage(deep=True)
+
+    def _accumulate(self, codes, df):
+        valid = codes >= 0
+        codes = codes[valid]
+        n = len(self.uids)
+        self.frequency += np.bincount(codes, minlength=n)
+        amounts = np.nan_to_num(df['실결제 금액'].to_numpy(dtype=np.float64, na_value=np.nan)[valid])
+        self.monetary += np.bincount(codes, weights=amounts, minlength=n)
+        np.maximum.at(self.last_order, codes, df['주문일'].to_numpy('datetime64[ns]').astype(np.int64)[valid])
+
+    def append(self, df_new):
+        """새 주문을 누적합니다. 처음 보는 UID는 배열 끝에 새 코드로 추가됩니다."""
+        new_uids = pd.Index(df_new['UID'].dropna().unique()).difference(self.uids)
+        if len(new_uids):
+            self.uids = self.uids.append(new_uids)
+            extra = len(new_uids)
+            self.last_order = np.concatenate([self.last_order, np.full(extra, np.iinfo(np.int64).min, dtype=np.int64)])
+            self.frequency = np.concatenate([self.frequency, np.zeros(extra, dtype=np.int64)])
+            self.monetary = np.concatenate([self.monetary, np.zeros(extra)])
+        self._accumulate(self.uids.get_indexer(df_new['UID']), df_new)
+        return self
+
+    def reindex(self, uids):
+        """고객 순서를 uids 순서로 바꾼 새 저장소. uids에 없는 고객은 버리고, 새 고객은 빈 값으로 시작합니다.
+
+        증분 반영 후 UID 카테고리(정렬된 합집합) 순서에 맞추면 from_orders로 새로 만든 것과 동점 순위까지 같아집니다.
+        """
+        store = RFMStore(uids)
+        positions = self.uids.get_indexer(store.uids)
+        found = positions >= 0
+        store.last_order[found] = self.last_order[positions[found]]
+        store.frequency[found] = self.frequency[positions[found]]
+        store.monetary[found] = self.monetary[positions[found]]
+        return store
+
+    def subset(self, df):
+        """같은 UID 코드 체계로 일부 주문(필터 결과)만 집계한 새 저장소."""
+        store = RFMStore(self.uids)
+        store._accumulate(self.uids.get_indexer(df['UID']), df)
+        return store
+
+    def scores(self):
+        """calculate_rfm과 같은 형태의 고객별 RFM 지표/점수/세그먼트."""
+        active = self.frequency > 0
+        if not active.any():
+            return pd.DataFrame(columns=RFM_COLUMNS)
+
+        last = self.last_order[active]
+        # 기준일: 마지막 주문일 + 1일
+        snapshot = last.max() + DAY_NS
+        recency = (snapshot - last) // DAY_NS
+        frequency = self.frequency[active]
+        monetary = self.monetary[active]
+        uids = self.uids[active]
+
+        r_score = quantile_scores(recency, [5, 4, 3, 2, 1])
+        f_score = quantile_scores(frequency, [1, 2, 3, 4, 5])
+        m_score = quantile_scores(monetary, [1, 2, 3, 4, 5])
+        total = r_score + f_score + m_score
+
+        return pd.DataFrame({
+            'Recency': recency,
+            'Frequency': frequency,
+            'Monetary': monetary,
+            'R_Score': r_score,
+            'F_Score': f_score,
+            'M_Score': m_score,
+            'Total_Score': total,
+            'Segment': SEGMENTS[SEGMENT_OF_SCORE[total]],
+        }, index=pd.Index(uids, name='UID'))
+
+
+def _run(codes, times, amounts):
+    # 추가분 한 번의 고객별 부분 집계: (고객 코드 오름차순, 마지막 주문 시각, 주문 건수, 결제 금액 합계)
+    customers, inverse = np.unique(codes, return_inverse=True)
+    last = np.full(len(customers), np.iinfo(np.int64).min, dtype=np.int64)
+    np.maximum.at(last, inverse, times)
+    return (customers, last, np.bincount(inverse, minlength=len(customers)),
+            np.bincount(inverse, weights=amounts, minlength=len(customers)))
+
+
+def _merge_runs(older, newer):
+    customers = np.concatenate([older[0], newer[0]])
+    last, frequency, monetary = (np.concatenate([a, b]) for a, b in zip(older[1:], newer[1:]))
+    merged, inverse = np.unique(customers, return_inverse=True)
+    merged_last = np.full(len(merged), np.iinfo(np.int64).min, dtype=np.int64)
+    np.maximum.at(merged_last, inverse, last)
+    return (merged, merged_last, np.bincount(inverse, weights=frequency, minlength=len(merged)).astype(np.int64),
+            np.bincount(inverse, weights=monetary, minlength=len(merged)))
+
+
+class RFMLog:
+    """증분 반영용 append-only RFM 누적 기록.
+
+    추가분마다 고객별 부분 집계(run)를 쌓고, 크기가 비슷한 최근 run끼리만 합칩니다. (LSM 방식)
+    기존 run은 고치지 않으므로 append가 이전 기록(스냅샷)을 바꾸지 않고, 고객 값이 다시 합쳐지는 횟수는 O(log n)입니다.
+    UID는 category여야 하며, 추가분의 카테고리는 기존 카테고리 뒤로 이어져야 합니다. (column_store.ColumnStore)
+    """
+
+    def __init__(self, uids, runs=()):
+        self.uids = uids
+        self.runs = tuple(runs)
+
+    @classmethod
+    def from_orders(cls, df):
+        return cls(df['UID'].cat.categories[:0]).append(df)
+
+    def append(self, df_new):
+        """새 주문을 누적한 새 기록."""
+        codes = df_new['UID'].cat.codes.to_numpy()
+        valid = codes >= 0
+        amounts = np.nan_to_num(df_new['실결제 금액'].to_numpy(dtype=np.float64, na_value=np.nan)[valid])
+        times = df_new['주문일'].to_numpy('datetime64[ns]').astype(np.int64)[valid]
+        runs = [*self.runs, _run(codes[valid], times, amounts)]
+        # 바로 앞 run이 새 run의 두 배 이하로 작으면 합침 -> run 크기가 뒤로 갈수록 절반 이하로 줄어 run 수는 O(log n)
+        while len(runs) > 1 and len(runs[-2][0]) <= 2 * len(runs[-1][0]):
+            runs[-2:] = [_merge_runs(runs[-2], runs[-1])]
+        return RFMLog(df_new['UID'].cat.categories, runs)
+
+    def store(self):
+        """run을 고객별로 합친 RFMStore. (UID 정렬 순서, RFMStore.from_orders와 같은 고객 순서)"""
+        n = len(self.uids)
+        last = np.full(n, np.iinfo(np.int64).min, dtype=np.int64)
+        frequency = np.zeros(n, dtype=np.int64)
+        monetary = np.zeros(n, dtype=np.float64)
+        for customers, run_last, run_frequency, run_monetary in self.runs:
+            last[customers] = np.maximum(last[customers], run_last)
+            frequency[customers] += run_frequency
+            monetary[customers] += run_monetary
+        order = self.uids.argsort()
+        return RFMStore.from_arrays(self.uids[order], last[order], frequency[order], monetary[order])
+
+    def scores(self):
+        """RFMStore.scores와 같은 고객별 RFM 지표/점수/세그먼트."""
+        return self.store().scores()
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+
+import repurchase
+from rfm_store import RFMStore
+from sketches import uid_hashes
+
+# 큰 필터 결과의 근사 계산용 결정적 표본
+# - 주문 표본: 일자 x 품종 층마다 약 rate 비율. 원본 행 번호의 해시가 작은 행을 고르므로
+#   같은 데이터/필터면 실행할 때마다 같은 표본이고, 층마다 최소 1행은 포함
+#   가중치(층 크기 / 층 표본 수)로 건수를 추정
+# - 고객 표본: UID 해시로 고객을 고르고 그 고객의 주문은 모두 포함 (주문 건수/금액 같은 고객 단위 지표용)
+
+_HASH_SCALE = float(2 ** 64)
+
+
+def row_keys(ids):
+    """원본 행 번호 -> [0, 1) 균등 분포 키 (결정적 해시)."""
+    return pd.util.hash_array(np.asarray(ids, dtype=np.int64)) / _HASH_SCALE
+
+
+def stratified_rows(df, ids, rate):
+    """일자 x 품종 층화 표본: (df 기준 표본 위치, 행별 가중치).
+
+    ids는 df 행의 원본 행 번호(FilterIndex.select 결과)입니다.
+    """
+    keys = row_keys(ids)
+    day = df['주문일'].to_numpy('datetime64[D]').astype(np.int64)
+    variety = df['품종'].cat.codes.to_numpy().astype(np.int64) if '품종' in df.columns else np.zeros(len(df), dtype=np.int64)
+    strata, _ = pd.factorize(day * (variety.max(initial=0) + 2) + variety + 1)
+    sizes = np.bincount(strata)
+    keep = keys < rate
+    picked = np.bincount(strata[keep], minlength=len(sizes))
+    # 표본이 없는 층은 키가 가장 작은 행 하나를 포함
+    empty = np.flatnonzero(picked[strata] == 0)
+    if len(empty):
+        order = empty[np.lexsort((keys[empty], strata[empty]))]
+        _, first = np.unique(strata[order], return_index=True)
+        keep[order[first]] = True
+        picked = np.bincount(strata[keep], minlength=len(sizes))
+    positions = np.flatnonzero(keep)
+    return positions, sizes[strata[positions]] / picked[strata[positions]]
+
+
+def customer_rows(df, rate):
+    """UID 해시로 고른 고객 표본의 모든 주문 위치 (df 기준)."""
+    hashes, valid = uid_hashes(df['UID'])
+    return np.flatnonzero(valid & (hashes / _HASH_SCALE < rate))
+
+
+def repurchase_rates(df, ids, rate):
+    """재구매율 근사 (analyses.repurchase_rates와 같은 표 형식, 신뢰구간은 표본 크기 기준)."""
+    positions, weights = stratified_rows(df, ids, rate)
+    return repurchase.repurchase_rates(df.iloc[positions], repurchase.REPURCHASE_DIMS,
+                                       min_orders={'셀러명': 10}, weights=weights)
+
+
+def rfm(df, rate):
+    """고객 표본의 RFM 점수 (analyses.calculate_rfm과 같은 표 형식, 분위 경계는 표본에서 계산)."""
+    return RFMStore.from_orders(df.iloc[customer_rows(df, rate)]).scores()
+
+
+def segment_means(rfm_data, columns=('Recency', 'Frequency', 'Monetary'), z=None):
+    """세그먼트별 평균. z가 주어지면 평균의 신뢰구간 반폭('<칼럼> ±')을 함께 계산합니다."""
+    grouped = rfm_data.groupby('Segment')[list(columns)]
+    means = grouped.mean()
+    if z is not None:
+        half = z * grouped.std() / np.sqrt(grouped.count())
+        for col in columns:
+            means[f'{col} ±'] = half[col]
+    return means.reset_index()
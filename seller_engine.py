@@ -0,0 +1,114 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+class SellerMonths:
+    """셀러 x 월 주문 건수 행렬.
+
+    첫 주문 월부터 마지막 주문 월까지 달력의 모든 월을 열로 두며(주문이 없는 월은 0건),
+    활동/유입/이탈, 코호트 잔존율, 최근 2개월 증감을 모두 이 행렬에 대한 벡터 연산으로 계산합니다.
+    따라서 이탈 lag와 코호트 경과 개월은 중간에 빈 월이 있어도 달력 개월 수입니다.
+    """
+
+    def __init__(self, df):
+        active = df[['셀러명', '주문일']].dropna()
+        seller_codes, sellers = pd.factorize(active['셀러명'], sort=True)
+        month_ordinals = (active['주문일'].dt.year * 12 + active['주문일'].dt.month - 1).to_numpy()
+        self._build(sellers, seller_codes, month_ordinals)
+
+    @classmethod
+    def from_counts(cls, sellers, seller_codes, month_ordinals, counts):
+        """(셀러 코드, 월 번호, 주문 건수) 집계 행으로 만듭니다. (SQL 백엔드용, 월 번호 = 연 * 12 + 월 - 1)"""
+        engine = cls.__new__(cls)
+        engine._build(sellers, np.asarray(seller_codes), np.asarray(month_ordinals), np.asarray(counts))
+        return engine
+
+    def _build(self, sellers, seller_codes, month_ordinals, weights=None):
+        self.sellers = pd.Index(sellers)
+        month_ordinals = np.asarray(month_ordinals, dtype=np.int64)
+        # 관측된 월만이 아니라 첫 월 ~ 마지막 월의 연속된 달력 월 (period_range와 같은 열)
+        first = month_ordinals.min() if len(month_ordinals) else 0
+        month_values = np.arange(first, month_ordinals.max() + 1) if len(month_ordinals) else month_ordinals
+        month_codes = month_ordinals - first
+        self.months = [f'{m // 12:04d}-{m % 12 + 1:02d}' for m in month_values]
+
+        n_sellers, n_months = len(self.sellers), len(self.months)
+        self.counts = np.bincount(
+            seller_codes * n_months + month_codes, weights=weights, minlength=n_sellers * n_months
+        ).astype(np.int64).reshape(n_sellers, n_months)
+        self.presence = self.counts > 0
+        # 셀러별 첫 활동 월 (열 번호)
+        self.first_month = self.presence.argmax(axis=1) if n_months else np.zeros(n_sellers, dtype=np.intp)
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + self.counts.nbytes + self.presence.nbytes + self.first_month.nbytes + sys.getsizeof(self.months)
+
+    @property
+    def empty(self):
+        return self.counts.size == 0
+
+    def activity(self, lag=1):
+        """월별 활동 셀러 수, 신규 유입, 유입율, 이탈율.
+
+        이탈율은 lag개월(달력 기준) 전에 활동했지만 이번 달에는 활동하지 않은 셀러의 비율입니다.
+        주문이 없는 월은 활동 셀러가 0이므로 유입율이, lag개월 전이 빈 월이면 이탈율이 NaN입니다.
+        """
+        active = self.presence.sum(axis=0)
+        new = np.bincount(self.first_month, minlength=len(self.months))
+
+        churn_rate = np.zeros(len(self.months))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if 0 < lag < len(self.months):
+                prev = self.presence[:, :-lag]
+                churned = (prev & ~self.presence[:, lag:]).sum(axis=0)
+                churn_rate[lag:] = churned / prev.sum(axis=0) * 100
+            inflow_rate = new / active * 100
+
+        return pd.DataFrame({
+            '연월': self.months,
+            '활동셀러수': active,
+            '신규모집셀러': new,
+            '유입율(%)': inflow_rate,
+            '이탈율(%)': churn_rate,
+        })
+
+    def cohort_retention(self):
+        """첫 활동 월 코호트 x 경과 개월 잔존율(%) 행렬. 관측 범위를 벗어난 칸은 NaN."""
+        n_months = len(self.months)
+        seller_idx, month_idx = np.nonzero(self.presence)
+        cohort = self.first_month[seller_idx]
+        counts = np.bincount(cohort * n_months + (month_idx - cohort), minlength=n_months * n_months)
+        counts = counts.reshape(n_months, n_months).astype(float)
+
+        # 주문이 없으면(빈 필터 결과) 0 x 0 행렬
+        cohort_size = counts[:, 0] if n_months else np.zeros(0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            retention = counts / cohort_size[:, None] * 100
+        # 관측 기간 밖(코호트 월 + 경과 개월 > 마지막 월)은 비움
+        retention[np.arange(n_months)[:, None] + np.arange(n_months)[None, :] >= n_months] = np.nan
+        has_cohort = cohort_size > 0
+        return pd.DataFrame(
+            retention[has_cohort],
+            index=pd.Index(np.array(self.months)[has_cohort], name='코호트'),
+            columns=pd.Index(range(n_months), name='경과 개월'),
+        )
+
+    def growth(self):
+        """최근 2개월 셀러별 주문 건수와 증감. 비교할 월이 부족하면 None."""
+        if len(self.months) < 2:
+            return None
+        prev_m, current_m = self.months[-2], self.months[-1]
+        prev, cur = self.counts[:, -2], self.counts[:, -1]
+        in_window = (prev + cur) > 0
+
+        seller_growth = pd.DataFrame(
+            {prev_m: prev[in_window], current_m: cur[in_window]},
+            index=pd.Index(self.sellers[in_window], name='셀러명'),
+        )
+        seller_growth.columns.name = '연월'
+        seller_growth['증감량'] = seller_growth[current_m] - seller_growth[prev_m]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            seller_growth['증감율(%)'] = (seller_growth['증감량'] / seller_growth[prev_m] * 100).replace([np.inf, -np.inf], 100).fillna(100)
+        return {'current_m': current_m, 'prev_m': prev_m, 'growth': seller_growth}
@@ -0,0 +1,70 @@
+import os
+
+# 대시보드 설정 (환경변수로 변경 가능)
+
+
+def _env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_float(name, default):
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_flag(name, default):
+    return os.environ.get(name, '1' if default else '0').strip().lower() not in ('0', 'false', 'no', 'off', '')
+
+
+# 원본 데이터 경로: CSV/Parquet 파일 하나 또는 월별 파티션 파일을 모아 둔 폴더
+DATA_PATH = os.environ.get('DASHBOARD_DATA_PATH', 'project1_5959.csv')
+# 기간별로 불러온 데이터셋(파티션 조합)을 메모리에 유지할 개수
+DATASET_CACHE_ENTRIES = _env_int('DASHBOARD_DATASET_CACHE_ENTRIES', 4)
+
+# 증분 반영: 뒤에 주문이 추가되기만 하는 CSV 파일이면 늘어난 줄만 읽어 반영 (파티션 폴더/Parquet 원본에는 미적용)
+INCREMENTAL = _env_flag('DASHBOARD_INCREMENTAL', False)
+# 증분 모드에서 원본 파일 변경을 확인하는 주기 (초, 0이면 화면을 다시 실행할 때만 확인)
+REFRESH_SECONDS = _env_int('DASHBOARD_REFRESH_SECONDS', 30)
+
+# 선택한 분석 화면만 계산 (False면 기존처럼 모든 탭을 매번 계산)
+LAZY_SECTIONS = _env_flag('DASHBOARD_LAZY_SECTIONS', True)
+
+# 필터별 분석 결과 캐시의 메모리 한도 (MB, 프로세스 전체 공유)
+RESULT_CACHE_MB = _env_int('DASHBOARD_RESULT_CACHE_MB', 256)
+
+# 분석 미리 계산 스레드 수 (0이면 끔)
+# 기본 필터 화면은 데이터 버전마다 한 번 모든 분석을, 필터를 바꾸면 보고 있는 화면의 분석만 백그라운드에서 계산
+WARMUP_WORKERS = _env_int('DASHBOARD_WARMUP_WORKERS', min(4, os.cpu_count() or 1))
+# 이 시간(초) 동안 필터 예약이 없던 세션은 닫힌 것으로 보고, 그 세션만 기다리던 미리 계산 작업을 취소
+WARMUP_SESSION_TTL = _env_int('DASHBOARD_WARMUP_SESSION_TTL', 600)
+
+# 근사 모드: 필터 결과가 이 행 수 이상이면 재구매율/RFM을 표본으로 먼저 그리고,
+# 정확한 값은 미리 계산 스레드가 계산하는 대로 바꿔 넣음 (0 또는 WARMUP_WORKERS=0이면 끔)
+APPROX_MIN_ROWS = _env_int('DASHBOARD_APPROX_MIN_ROWS', 5_000_000)
+# 근사 모드 표본 비율 (%, 재구매율은 일자 x 품종 층별, RFM은 고객 단위)
+SAMPLE_PERCENT = _env_float('DASHBOARD_SAMPLE_PERCENT', 1.0)
+
+# 구간별 성능 프로파일 (사이드바 토글의 기본값)
+PROFILE = _env_flag('DASHBOARD_PROFILE', False)
+# 프로파일 기록(JSONL) 경로, 실행(rerun)마다 한 줄씩 추가
+PROFILE_LOG = os.environ.get('DASHBOARD_PROFILE_LOG', os.path.join('.cache', 'profile.jsonl'))
+
+# 차트 데이터 축소: 시계열 차트 전체 최대 점 수 (계열 수로 나눠 배분, 계열이 너무 많으면 작은 계열을 '기타'로 합침),
+# 산점도 최대 점 수, 이 점 수 이상이면 WebGL로 그림
+CHART_MAX_POINTS = _env_int('DASHBOARD_CHART_MAX_POINTS', 400)
+SCATTER_MAX_POINTS = _env_int('DASHBOARD_SCATTER_MAX_POINTS', 1000)
+WEBGL_MIN_POINTS = _env_int('DASHBOARD_WEBGL_MIN_POINTS', 1000)
+# 히스토그램 구간 수 (서버에서 미리 집계)
+HISTOGRAM_BINS = _env_int('DASHBOARD_HISTOGRAM_BINS', 50)
+
+# 집계 백엔드: 'pandas'(기본, 메모리 내 계산) 또는 'duckdb'(Parquet 캐시에 SQL 실행)
+# 'duckdb'는 KPI/트렌드와 분석(재구매 패턴 제외)을 SQL로 실행하지만, 원본 데이터/필터 색인/큐브/스케치는 그대로 메모리에 올림
+# (재구매 패턴, 시즌/EDA 차트, 상세 데이터와 내려받기가 이를 사용하므로 메모리 사용량은 pandas 백엔드와 같음)
+BACKEND = os.environ.get('DASHBOARD_BACKEND', 'pandas').strip().lower()
+# DuckDB 스레드 수 (0이면 DuckDB 기본값 = CPU 수)
+DUCKDB_THREADS = _env_int('DASHBOARD_DUCKDB_THREADS', 0)
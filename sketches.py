@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+
+import order_cube
+from data_loader import PRICE_BINS, PRICE_LABELS, concat_frames
+
+# 일자 x 품종별 병합 가능한 요약(스케치): 필터(품종, 기간)마다 원본 행을 다시 훑지 않고 조각을 합쳐 계산
+# - 고객 수: HyperLogLog (레지스터 2^HLL_PRECISION개, 표준 오차 약 1.04 / sqrt(2^HLL_PRECISION) = 0.8%)
+#   일자 x 품종 조각마다 (레지스터, 최댓값)만 저장하고 조회 시 레지스터별 최댓값으로 합침
+# - 결제 금액 분위수: 로그 간격 구간 히스토그램 (DDSketch 방식)
+#   구간 대푯값이 실제 금액과 상대 오차 QUANTILE_ALPHA(1%) 이내, 조회 시 구간별 건수를 더해 합침
+# - 가격대 분포: data_loader.PRICE_BINS 구간별 건수 (정확한 값)
+# 세 표 모두 큐브처럼 일자 오름차순이므로 order_cube.slice_cube로 필터 조각을 고름
+
+SKETCH_DIMS = ['품종']
+HLL_PRECISION = 14
+QUANTILE_ALPHA = 0.01
+
+_GAMMA = (1 + QUANTILE_ALPHA) / (1 - QUANTILE_ALPHA)
+_LOG_GAMMA = np.log(_GAMMA)
+
+
+def uid_hashes(uids):
+    """UID별 64비트 해시. 파티션/증분마다 카테고리가 달라도 같은 UID는 같은 해시입니다."""
+    if isinstance(uids.dtype, pd.CategoricalDtype):
+        codes = uids.cat.codes.to_numpy()
+        hashes = pd.util.hash_array(uids.cat.categories.to_numpy(dtype=object))
+        return hashes[codes], codes >= 0
+    valid = uids.notna().to_numpy()
+    hashes = np.zeros(len(uids), dtype=np.uint64)
+    hashes[valid] = pd.util.hash_array(uids[valid].astype(str).to_numpy(dtype=object))
+    return hashes, valid
+
+
+def hll_registers(hashes, precision=HLL_PRECISION):
+    """해시 -> (레지스터 번호, 첫 1비트 위치). 상위 precision비트가 레지스터, 나머지 상위 32비트에서 위치를 셈."""
+    register = (hashes >> np.uint64(64 - precision)).astype(np.uint16)
+    rest = (hashes << np.uint64(precision)) >> np.uint64(32)
+    # frexp의 지수 = 비트 길이 (32비트 이하 정수는 float64로 정확히 표현됨, 0이면 0)
+    rho = (33 - np.frexp(rest.astype(np.float64))[1]).astype(np.uint8)
+    return register, rho
+
+
+def _sigma(x):
+    if x == 1:
+        return np.inf
+    y, z = 1.0, x
+    while True:
+        x *= x
+        z_old, z = z, z + x * y
+        y += y
+        if z == z_old:
+            return z
+
+
+def _tau(x):
+    if x == 0 or x == 1:
+        return 0.0
+    y, z = 1.0, 1 - x
+    while True:
+        x = np.sqrt(x)
+        y *= 0.5
+        z_old, z = z, z - (1 - x) ** 2 * y
+        if z == z_old:
+            return z / 3
+
+
+def hll_estimate(registers):
+    """합쳐진 레지스터 배열 -> 고유 개수 추정.
+
+    Ertl(2017)의 개선된 추정식: 작은 값/큰 값 구간 보정(선형 계수 전환) 없이 전 구간에서 편향이 거의 없음.
+    """
+    m = len(registers)
+    q = 32
+    counts = np.bincount(registers, minlength=q + 2).astype(np.float64)
+    z = m * _tau(1 - counts[q + 1] / m)
+    for k in range(q, 0, -1):
+        z = 0.5 * (z + counts[k])
+    z += m * _sigma(counts[0] / m)
+    return m * m / (2 * np.log(2) * z)
+
+
+def amount_buckets(values):
+    """금액 -> 로그 구간 번호 (부호 포함, 절댓값 1원 미만은 0). 구간 번호 순서 = 금액 순서."""
+    values = np.asarray(values, dtype=np.float64)
+    magnitude = np.abs(values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = np.ceil(np.log(np.maximum(magnitude, 1.0)) / _LOG_GAMMA)
+    return np.where(magnitude < 1, 0, np.sign(values) * (k + 1)).astype(np.int16)
+
+
+def bucket_values(buckets):
+    """구간 번호 -> 대푯값 (구간 안의 모든 금액과 상대 오차 QUANTILE_ALPHA 이내)."""
+    buckets = np.asarray(buckets, dtype=np.int64)
+    k = np.abs(buckets) - 1
+    return np.where(buckets == 0, 0.0, np.sign(buckets) * 2 * np.power(_GAMMA, k) / (_GAMMA + 1))
+
+
+def _group(base, keys, column, how):
+    return base.groupby(['주문일', *keys], observed=True, dropna=False, sort=True)[column].agg(how).reset_index()
+
+
+def merge_table(table, new_table, how):
+    """스케치 표에 새 조각을 합칩니다. merge_cube와 같은 방식: 새 조각의 첫 일자 이전은 그대로 두고 그 이후만 다시 합침."""
+    if new_table.empty:
+        return table
+    split = table['주문일'].to_numpy().searchsorted(new_table['주문일'].to_numpy().min(), 'left')
+    column = table.columns[-1]
+    keys = list(table.columns[1:-1])
+    merged = _group(concat_frames([table.iloc[split:], new_table]), keys, column, how)
+    return concat_frames([table.iloc[:split], merged])
+
+
+class OrderSketches:
+    """일자 x 품종별 고객 수 / 결제 금액 분위수 / 가격대 분포 스케치.
+
+    customers: 주문일, 품종, 레지스터, rho (조각별 레지스터 최댓값)
+    amounts: 주문일, 품종, 구간, 건수 (조각별 로그 구간 건수)
+    prices: 주문일, 품종, 가격대, 건수
+    """
+
+    def __init__(self, customers, amounts, prices):
+        self.customers = customers
+        self.amounts = amounts
+        self.prices = prices
+
+    @classmethod
+    def from_orders(cls, df):
+        """전처리된 주문 데이터로 스케치를 만듭니다. (로드 시 1회)"""
+        dims = [c for c in SKETCH_DIMS if c in df.columns]
+        day = df['주문일'].dt.normalize()
+        hashes, valid = uid_hashes(df['UID'])
+        register, rho = hll_registers(hashes[valid])
+        customers = _group(pd.DataFrame({
+            '주문일': day[valid], **{c: df[c][valid] for c in dims}, '레지스터': register, 'rho': rho,
+        }), dims + ['레지스터'], 'rho', 'max')
+
+        amount = df['실결제 금액']
+        paid = amount.notna().to_numpy()
+        amounts = _group(pd.DataFrame({
+            '주문일': day[paid], **{c: df[c][paid] for c in dims},
+            '구간': amount_buckets(amount[paid]), '건수': np.ones(int(paid.sum()), dtype=np.int64),
+        }), dims + ['구간'], '건수', 'sum')
+
+        prices = _group(pd.DataFrame({
+            '주문일': day, **{c: df[c] for c in dims},
+            '가격대': pd.cut(amount, PRICE_BINS, labels=PRICE_LABELS, right=False), '건수': 1,
+        }).dropna(subset=['가격대']), dims + ['가격대'], '건수', 'sum')
+        return cls(customers, amounts, prices)
+
+    def merge(self, other):
+        """다른 주문(예: 증분 추가분)으로 만든 스케치를 합친 새 스케치."""
+        return OrderSketches(
+            merge_table(self.customers, other.customers, 'max'),
+            merge_table(self.amounts, other.amounts, 'sum'),
+            merge_table(self.prices, other.prices, 'sum'),
+        )
+
+    def distinct_customers(self, varieties=None, start=None, end=None):
+        """필터 조건의 고유 고객(UID) 수 추정값."""
+        part = order_cube.slice_cube(self.customers, varieties, start, end)
+        if part.empty:
+            return 0
+        registers = np.zeros(1 << HLL_PRECISION, dtype=np.uint8)
+        np.maximum.at(registers, part['레지스터'].to_numpy(np.int64), part['rho'].to_numpy())
+        return int(round(hll_estimate(registers)))
+
+    def amount_quantiles(self, qs, varieties=None, start=None, end=None):
+        """필터 조건의 결제 금액 분위수 추정값 {q: 금액}. 결제 금액이 없으면 NaN.
+
+        q * (건수 - 1)번째(0부터, 소수점 버림) 금액과 상대 오차 QUANTILE_ALPHA 이내입니다.
+        """
+        part = order_cube.slice_cube(self.amounts, varieties, start, end)
+        if part.empty:
+            return {q: np.nan for q in qs}
+        buckets, inverse = np.unique(part['구간'].to_numpy(), return_inverse=True)
+        cumulative = np.bincount(inverse, weights=part['건수'].to_numpy(np.float64)).cumsum()
+        ranks = np.floor(np.asarray(qs, dtype=np.float64) * (cumulative[-1] - 1))
+        values = bucket_values(buckets[cumulative.searchsorted(ranks, 'right')])
+        return dict(zip(qs, values))
+
+    def price_ranges(self, varieties=None, start=None, end=None):
+        """필터 조건의 가격대별 주문 건수 (가격대, count)."""
+        part = order_cube.slice_cube(self.prices, varieties, start, end)
+        counts = part.groupby('가격대', observed=False)['건수'].sum()
+        return counts.reindex(PRICE_LABELS, fill_value=0).rename_axis('가격대').reset_index(name='count')
+
+    def summary(self, varieties=None, start=None, end=None):
+        """상단 KPI용 고객 수, 결제 금액 중앙값/90% 분위수."""
+        quantiles = self.amount_quantiles([0.5, 0.9], varieties, start, end)
+        return {
+            '고객수': self.distinct_customers(varieties, start, end),
+            '결제금액 중앙값': quantiles[0.5],
+            '결제금액 p90': quantiles[0.9],
+        }
@@ -0,0 +1,193 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+import analyses
+import keyword_engine
+import repurchase
+from rfm_store import RFMStore
+from seller_engine import SellerMonths
+
+# 집계를 임베디드 DuckDB에서 SQL로 실행하는 백엔드 (Parquet 캐시를 직접 조회)
+# - 필터 조건(품종, 기간)은 WHERE 절로 내려 Parquet 스캔 단계에서 걸러짐
+# - 집계는 SQL로, 점수/비율 등 후처리는 pandas 경로와 같은 함수를 사용해 결과가 동일함
+#   (범주형 칼럼의 카테고리는 값 순서로 정렬되어 있으므로 ORDER BY 순서 = pandas 그룹 순서)
+
+
+def _quote(path):
+    return "'" + str(path).replace("'", "''") + "'"
+
+
+def _source(paths):
+    # 파일 하나 또는 파티션 캐시 여러 개 (파티션마다 칼럼이 다를 수 있어 이름 기준으로 합침)
+    if isinstance(paths, (list, tuple)):
+        return f"read_parquet([{', '.join(_quote(p) for p in paths)}], union_by_name = true)"
+    return f'read_parquet({_quote(paths)})'
+
+
+class DuckDBBackend:
+    """Parquet 캐시 위의 SQL 집계. 분석 이름은 analyses.ANALYSES와 같습니다."""
+
+    # SQL로 실행하는 분석 (나머지는 pandas 경로 사용)
+    ANALYSES = ('repurchase_rates', 'rfm', 'seller_channel', 'seller_months', 'seller_keywords', 'keyword_share')
+
+    def __init__(self, parquet_path, threads=None):
+        """parquet_path: Parquet 캐시 경로 또는 경로 목록(파티션별 캐시)."""
+        import duckdb
+
+        self.path = parquet_path
+        self._con = duckdb.connect()
+        if threads:
+            self._con.execute(f'SET threads = {int(threads)}')
+        self._con.execute(f'CREATE VIEW orders AS SELECT * FROM {_source(parquet_path)}')
+        self._lock = threading.Lock()
+        self.columns = set(self.query('SELECT * FROM orders LIMIT 0').columns)
+
+    def query(self, sql, params=()):
+        # 연결 하나를 여러 세션(스레드)이 공유하므로 조회마다 커서(별도 연결)를 사용
+        with self._lock:
+            cursor = self._con.cursor()
+        try:
+            return cursor.execute(sql, list(params)).df()
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def where(varieties=None, start=None, end=None, extra=()):
+        """필터 조건 -> (WHERE 절, 파라미터). 품종 미선택이면 품종이 있는 행 전체, 기간은 일 단위 포함 범위."""
+        clauses, params = [], []
+        if varieties:
+            clauses.append(f'"품종" IN ({", ".join("?" * len(varieties))})')
+            params.extend(str(v) for v in varieties)
+        else:
+            clauses.append('"품종" IS NOT NULL')
+        if start is not None:
+            clauses.append('"주문일" >= ?')
+            params.append(pd.Timestamp(start).normalize().to_pydatetime())
+        if end is not None:
+            clauses.append('"주문일" < ?')
+            params.append((pd.Timestamp(end).normalize() + pd.Timedelta(days=1)).to_pydatetime())
+        clauses.extend(extra)
+        return ' WHERE ' + ' AND '.join(clauses), params
+
+    # --- 상단 KPI / 트렌드 (order_cube와 같은 정의) ---
+    def kpis(self, varieties=None, start=None, end=None):
+        where, params = self.where(varieties, start, end)
+        row = self.query(f'''
+            SELECT count(*) AS orders, coalesce(sum("실결제 금액"), 0) AS revenue, count("실결제 금액") AS paid,
+                   count(*) FILTER (WHERE "재구매 횟수" > 0) AS repeats
+            FROM orders{where}''', params).iloc[0]
+        orders, revenue, paid, repeats = int(row['orders']), float(row['revenue']), int(row['paid']), int(row['repeats'])
+        return {
+            '주문건수': orders,
+            '매출액': revenue,
+            '평균객단가': revenue / paid if paid > 0 else 0,
+            '재구매율': repeats / orders * 100 if orders > 0 else 0,
+        }
+
+    def trend(self, varieties=None, start=None, end=None):
+        """일자 x 품종별 주문건수/매출액."""
+        where, params = self.where(varieties, start, end)
+        out = self.query(f'''
+            SELECT date_trunc('day', "주문일") AS "주문일", "품종",
+                   count(*) AS "주문건수", coalesce(sum("실결제 금액"), 0) AS "매출액"
+            FROM orders{where}
+            GROUP BY ALL ORDER BY 1, 2''', params)
+        out['주문일'] = out['주문일'].astype('datetime64[ns]')
+        return out
+
+    # --- 분석 (analyses.ANALYSES와 같은 결과) ---
+    def repurchase_rates(self, varieties=None, start=None, end=None,
+                         dims=repurchase.REPURCHASE_DIMS, min_orders=None):
+        if min_orders is None:
+            min_orders = {'셀러명': 10}
+        results = {}
+        for dim in dims:
+            if dim not in self.columns:
+                continue
+            where, params = self.where(varieties, start, end, [f'"{dim}" IS NOT NULL'])
+            counts = self.query(f'''
+                SELECT "{dim}" AS value, count(*) AS orders, count(*) FILTER (WHERE "재구매 횟수" > 0) AS repeats
+                FROM orders{where}
+                GROUP BY 1 ORDER BY 1''', params)
+            results[dim] = repurchase.rate_table(
+                dim, counts['value'].to_numpy(dtype=object), counts['orders'].to_numpy(np.int64),
+                counts['repeats'].to_numpy(np.int64), min_orders)
+        return results
+
+    def rfm(self, varieties=None, start=None, end=None):
+        where, params = self.where(varieties, start, end, ['"UID" IS NOT NULL'])
+        per_customer = self.query(f'''
+            SELECT "UID" AS uid, max("주문일") AS last_order, count(*) AS frequency,
+                   coalesce(sum("실결제 금액"), 0) AS monetary
+            FROM orders{where}
+            GROUP BY 1 ORDER BY 1''', params)
+        last_order = per_customer['last_order'].astype('datetime64[ns]').to_numpy().astype(np.int64)
+        return RFMStore.from_arrays(
+            per_customer['uid'].to_numpy(dtype=object), last_order,
+            per_customer['frequency'].to_numpy(np.int64), per_customer['monetary'].to_numpy(np.float64),
+        ).scores()
+
+    def seller_counts(self, varieties=None, start=None, end=None):
+        """셀러명 순 셀러별 주문 건수 (analyses.seller_counts와 같음)."""
+        where, params = self.where(varieties, start, end, ['"셀러명" IS NOT NULL'])
+        counts = self.query(f'''
+            SELECT "셀러명" AS seller, count(*) AS orders
+            FROM orders{where}
+            GROUP BY 1 ORDER BY 1''', params)
+        return pd.Series(counts['orders'].to_numpy(np.int64), index=pd.Index(counts['seller'].to_numpy(dtype=object)))
+
+    def seller_channel(self, varieties=None, start=None, end=None):
+        where, params = self.where(varieties, start, end, ['"셀러명" IS NOT NULL', '"주문경로" IS NOT NULL'])
+        pairs = self.query(f'''
+            SELECT "셀러명", "주문경로", count(*) AS "주문건수", count("UID") AS "고객주문건수"
+            FROM orders{where}
+            GROUP BY 1, 2 ORDER BY 1, 2''', params)
+        pairs = pairs.astype({'주문건수': np.int64, '고객주문건수': np.int64})
+        return analyses.seller_channel_table(self.seller_counts(varieties, start, end), pairs)
+
+    def seller_keywords(self, varieties=None, start=None, end=None):
+        flag = keyword_engine.FLAG_COLUMN
+        categories = list(keyword_engine.KW_CATEGORIES)
+        sellers = analyses.top_sellers(self.seller_counts(varieties, start, end), 30)
+        if not sellers:
+            return analyses.seller_keywords_table(sellers, pd.Series(dtype=np.int64), pd.DataFrame(columns=categories, dtype=np.int64))
+        where, params = self.where(varieties, start, end, [f'"셀러명" IN ({", ".join("?" * len(sellers))})'])
+        hits = ', '.join(f'count(*) FILTER (WHERE ("{flag}" & {1 << i}) <> 0) AS c{i}' for i in range(len(categories)))
+        counts = self.query(f'''
+            SELECT "셀러명" AS seller, count(*) AS total, {hits}
+            FROM orders{where}
+            GROUP BY 1''', params + sellers).set_index('seller')
+        totals = counts['total'].astype(np.int64)
+        by_category = counts[[f'c{i}' for i in range(len(categories))]].astype(np.int64).set_axis(categories, axis=1)
+        return analyses.seller_keywords_table(sellers, totals, by_category)
+
+    def seller_months(self, varieties=None, start=None, end=None):
+        where, params = self.where(varieties, start, end, ['"셀러명" IS NOT NULL', '"주문일" IS NOT NULL'])
+        counts = self.query(f'''
+            SELECT "셀러명" AS seller, year("주문일") * 12 + month("주문일") - 1 AS month, count(*) AS orders
+            FROM orders{where}
+            GROUP BY 1, 2 ORDER BY 1, 2''', params)
+        seller_codes, sellers = pd.factorize(counts['seller'], sort=True)
+        return SellerMonths.from_counts(sellers, seller_codes, counts['month'].to_numpy(np.int64), counts['orders'].to_numpy(np.int64))
+
+    def keyword_share(self, varieties=None, start=None, end=None):
+        flag = keyword_engine.FLAG_COLUMN
+        categories = list(keyword_engine.KW_CATEGORIES)
+        where, params = self.where(varieties, start, end)
+        sums = ', '.join(
+            f'sum(CASE WHEN ("{flag}" & {1 << i}) <> 0 THEN coalesce("실결제 금액", 0) ELSE 0 END)::DOUBLE AS c{i}'
+            for i in range(len(categories))
+        )
+        monthly = self.query(f'''
+            SELECT coalesce(strftime("주문일", '%Y-%m'), 'NaT') AS month,
+                   sum(coalesce("실결제 금액", 0))::DOUBLE AS total, {sums}
+            FROM orders{where}
+            GROUP BY 1''', params).set_index('month').sort_index()
+        monthly.index.name = None
+        cat_monthly = monthly[[f'c{i}' for i in range(len(categories))]].set_axis(categories, axis=1)
+        return analyses.keyword_share_table(monthly['total'], cat_monthly)
+
+    def run(self, name, varieties=None, start=None, end=None):
+        return getattr(self, name)(varieties, start, end)
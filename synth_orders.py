@@ -0,0 +1,282 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+# 합성 주문 데이터 생성기 (주문 export와 같은 43개 칼럼)
+# - 대시보드/보고서가 읽는 18개 칼럼은 실제 export와 이름/형식이 같음
+# - 나머지 25개는 export의 미사용 칼럼 자리를 채우는 그럴듯한 값 (분석에는 쓰지 않음)
+
+# 품종 -> 비중
+VARIETIES = {
+    '감귤': 0.40, '황금향': 0.13, '한라봉': 0.12, '감귤, 황금향': 0.08, '레드향': 0.07,
+    '천혜향': 0.06, '고구마': 0.06, '딸기': 0.05, '단감': 0.03,
+}
+ORIGINS = ['제주', '제주', '서귀포', '해남', '']
+MODIFIERS = ['1+1', '사전예약', '과즙폭발', '꿀', '당도', '실속', '타이벡', '조생', '프리미엄', '가정용', '선물용', '못난이', '산지직송']
+WEIGHTS = ['2kg', '3kg', '4.5kg', '5kg', '10kg']
+
+CHANNELS = {'네이버': 0.38, '카카오톡': 0.30, '인스타그램': 0.20, 'TICTOK': 0.12}
+REGIONS = {
+    '경기도': 0.26, '서울특별시': 0.19, '부산광역시': 0.07, '경상남도': 0.06, '인천광역시': 0.06, '경상북도': 0.05,
+    '대구광역시': 0.05, '충청남도': 0.04, '전라남도': 0.04, '전라북도': 0.035, '충청북도': 0.03, '강원특별자치도': 0.03,
+    '대전광역시': 0.03, '광주광역시': 0.03, '울산광역시': 0.02, '제주특별자치도': 0.015, '세종특별자치시': 0.01,
+}
+# 광역지역 -> 시군구 (지역 안에서는 균등)
+DISTRICTS = {
+    '경기도': ['수원시 영통구', '성남시 분당구', '고양시 일산동구', '용인시 수지구', '부천시', '화성시', '남양주시', '안양시 동안구'],
+    '서울특별시': ['강남구', '송파구', '서초구', '마포구', '노원구', '강서구', '관악구', '성동구'],
+    '부산광역시': ['해운대구', '부산진구', '동래구', '수영구', '사하구'],
+    '경상남도': ['창원시 성산구', '김해시', '양산시', '진주시', '거제시'],
+    '인천광역시': ['연수구', '남동구', '부평구', '서구', '미추홀구'],
+    '경상북도': ['포항시 북구', '구미시', '경산시', '경주시', '안동시'],
+    '대구광역시': ['수성구', '달서구', '북구', '동구'],
+    '충청남도': ['천안시 서북구', '아산시', '당진시', '서산시'],
+    '전라남도': ['여수시', '순천시', '목포시', '해남군'],
+    '전라북도': ['전주시 완산구', '익산시', '군산시', '정읍시'],
+    '충청북도': ['청주시 흥덕구', '충주시', '제천시'],
+    '강원특별자치도': ['원주시', '춘천시', '강릉시', '속초시'],
+    '대전광역시': ['유성구', '서구', '중구'],
+    '광주광역시': ['광산구', '북구', '서구'],
+    '울산광역시': ['남구', '울주군', '중구'],
+    '제주특별자치도': ['제주시', '서귀포시'],
+    '세종특별자치시': ['세종특별자치시'],
+}
+# 고객 선택 옵션 (대부분 선택 안 함 = 빈 값)
+CUSTOMER_OPTIONS = {
+    None: 0.72, '선물 포장 (+2,000원)': 0.08, '로얄과 (대과)': 0.06, '중과': 0.05, '소과 (가정용)': 0.04,
+    '보자기 포장 (+3,000원)': 0.02, '카드 메시지 추가': 0.02, '수령일 지정': 0.01,
+}
+MEMBER_TYPES = {'회원': 0.62, '비회원': 0.38}
+PAYMENT_METHODS = {'카드': 0.55, '간편결제': 0.25, '무통장': 0.12, '가상계좌': 0.08}
+ORDER_STATUS = {'구매확정': 0.80, '배송완료': 0.12, '배송중': 0.04, '취소': 0.03, '반품': 0.01}
+COURIERS = ['CJ대한통운', '우체국택배', '롯데택배', '한진택배']
+# 월별 주문량 가중치 (감귤류 성수기인 겨울에 몰림)
+MONTH_WEIGHTS = np.array([1.6, 1.3, 0.9, 0.7, 0.6, 0.5, 0.5, 0.6, 0.8, 1.1, 1.5, 1.9])
+
+COLUMNS = [
+    'UID', '주문번호', '상품주문번호', '주문일', '주문상태', '품종', '상품코드', '상품명', '옵션명', '고객선택옵션',
+    '수량', '셀러명', '판매채널 ID', '주문경로', '회원구분', '주문자명', '주문자 연락처', '수령인', '수령인 연락처',
+    '우편번호', '광역지역(정식)', '시군구', '배송지 주소', '배송메모', '결제방법', '결제금액', '할인금액', '쿠폰 할인',
+    '적립금 사용', '배송비', '실결제 금액', '판매단가', '공급단가', '재구매 횟수', '입금일', '입금자명', '배송준비 처리일',
+    '택배사', '송장번호', '발송일', '구매확정일', '정산예정일', '정산금액',
+]
+
+SURNAMES = np.array(list('김이박최정강조윤장임한오서신권황안송류홍'))
+GIVEN = np.array(['민준', '서연', '지훈', '하은', '도윤', '지우', '예준', '수아', '현우', '지민', '영희', '철수', '미경', '성민'])
+MEMOS = np.array(['', '', '', '문 앞에 놓아주세요', '경비실에 맡겨주세요', '배송 전 연락주세요', '부재 시 문 앞'])
+
+
+def _choice(rng, table, size):
+    values = np.array(list(table), dtype=object)
+    p = np.array(list(table.values()), dtype=float)
+    return values[rng.choice(len(values), size, p=p / p.sum())]
+
+
+def _zipf_weights(rng, n, a):
+    """상위 소수가 대부분을 차지하는 (파레토) 가중치."""
+    w = rng.pareto(a, n) + 1
+    return w / w.sum()
+
+
+def _format_won(values):
+    """정수 금액 배열 -> '12,900' 형식 문자열. 고유값만 포맷합니다."""
+    uniques, inverse = np.unique(values, return_inverse=True)
+    return np.array([f'{v:,}' for v in uniques], dtype=object)[inverse]
+
+
+def _blank(values, rng, rate):
+    values = values.astype(object)
+    values[rng.random(len(values)) < rate] = None
+    return values
+
+
+class OrderSynthesizer:
+    """카탈로그/셀러/고객 분포를 고정해 두고, 주문일 순서대로 청크 단위로 주문을 생성합니다.
+
+    - 셀러 규모와 고객 주문 빈도, 상품 인기는 파레토 분포로 치우침
+    - 품종을 VARIETIES 비중대로 먼저 고른 뒤 그 품종의 상품 중에서 인기(파레토)대로 고름
+      (상품 인기가 품종 비중을 덮어쓰지 않음)
+    - 재구매 횟수는 같은 고객의 이전 주문 수 (청크를 넘어 누적)
+    - 상품명은 원산지/수식어(키워드)/품종/중량 조합
+    """
+
+    def __init__(self, n_rows, seed=0, start='2024-09-01', days=365):
+        self.n_rows = n_rows
+        self.rng = np.random.default_rng(seed)
+        rng = self.rng
+
+        # 상품 카탈로그 (품종마다 최소 한 개)
+        n_products = int(np.clip(n_rows // 40, 50, 20000))
+        variety_names = np.array(list(VARIETIES), dtype=object)
+        self.variety_p = np.array(list(VARIETIES.values())) / sum(VARIETIES.values())
+        self.product_variety = np.concatenate([
+            np.arange(len(variety_names)), rng.choice(len(variety_names), n_products - len(variety_names), p=self.variety_p)])
+        names = []
+        for variety in variety_names[self.product_variety]:
+            mods = rng.choice(MODIFIERS, rng.integers(0, 3), replace=False)
+            base = variety.split(',')[0]
+            parts = [rng.choice(ORIGINS), *mods, base, rng.choice(WEIGHTS)]
+            names.append(' '.join(p for p in parts if p))
+        self.product_names = np.array(names, dtype=object)
+        self.product_varieties = variety_names[self.product_variety]
+        self.product_price = (np.exp(rng.normal(np.log(28000), 0.45, n_products)) // 100 * 100).astype(np.int64)
+        # 품종별 (상품 번호, 품종 안 인기 누적 분포)
+        product_weights = _zipf_weights(rng, n_products, 1.2)
+        self.variety_products = []
+        for v in range(len(variety_names)):
+            products = np.flatnonzero(self.product_variety == v)
+            cumulative = np.cumsum(product_weights[products])
+            self.variety_products.append((products, cumulative / cumulative[-1]))
+
+        # 셀러 (규모가 크게 치우침)
+        n_sellers = int(np.clip(n_rows // 150, 20, 5000))
+        self.sellers = np.array([f'셀러{i:04d}' for i in range(n_sellers)], dtype=object)
+        self.seller_weights = _zipf_weights(rng, n_sellers, 1.1)
+
+        # 고객 (일부 고객이 반복 구매)
+        n_customers = max(1, int(n_rows / 2.4))
+        weights = rng.pareto(1.8, n_customers) + 1
+        # 한 고객이 전체를 휩쓸지 않도록 상한
+        weights = np.minimum(weights, np.median(weights) * 40)
+        self.customer_weights = weights / weights.sum()
+        self.uids = rng.choice(np.arange(100000, 100000 + n_customers * 3), n_customers, replace=False)
+        self.prior_orders = np.zeros(n_customers, dtype=np.int32)
+
+        # 일자별 주문 수 (월별 가중치) -> 주문일 오름차순
+        dates = pd.date_range(start, periods=days, freq='D')
+        day_weights = MONTH_WEIGHTS[dates.month - 1] * rng.uniform(0.7, 1.3, days)
+        day_counts = rng.multinomial(n_rows, day_weights / day_weights.sum())
+        # 일자/시각 문자열은 미리 만들어 두고 인덱싱 (strftime은 느림)
+        self.day_labels = pd.date_range(start, periods=days + 20, freq='D').strftime('%Y-%m-%d').to_numpy(dtype=object)
+        seconds = np.arange(86400)
+        self.time_labels = np.array([f' {h:02d}:{m:02d}:{s:02d}' for h, m, s in zip(seconds // 3600, seconds // 60 % 60, seconds % 60)], dtype=object)
+        self.row_days = np.repeat(np.arange(days, dtype=np.int32), day_counts)
+        self.row = 0
+
+    def chunks(self, chunk_rows=500_000):
+        while self.row < self.n_rows:
+            size = min(chunk_rows, self.n_rows - self.row)
+            yield self._chunk(self.row, size)
+            self.row += size
+
+    def _chunk(self, offset, n):
+        rng = self.rng
+        days = self.row_days[offset:offset + n]
+        order_dates = self.day_labels[days]
+
+        variety = rng.choice(len(self.variety_products), n, p=self.variety_p)
+        product = np.empty(n, dtype=np.int64)
+        for v, (products, cumulative) in enumerate(self.variety_products):
+            rows = np.flatnonzero(variety == v)
+            product[rows] = products[np.minimum(np.searchsorted(cumulative, rng.random(len(rows))), len(products) - 1)]
+        customer = rng.choice(len(self.uids), n, p=self.customer_weights)
+        # 재구매 횟수 = 이 고객의 이전 주문 수
+        within = pd.Series(customer).groupby(customer).cumcount().to_numpy()
+        repeat = self.prior_orders[customer] + within
+        self.prior_orders += np.bincount(customer, minlength=len(self.uids)).astype(np.int32)
+
+        quantity = rng.choice([1, 2, 3], n, p=[0.85, 0.12, 0.03])
+        unit_price = self.product_price[product]
+        amount = unit_price * quantity
+        shipping = np.where(amount >= 30000, 0, 3000)
+        discount = np.where(rng.random(n) < 0.25, amount // 10 // 100 * 100, 0)
+        coupon = np.where(rng.random(n) < 0.10, 2000, 0)
+        points = np.where(rng.random(n) < 0.15, rng.integers(1, 30, n) * 100, 0)
+        paid = np.maximum(amount + shipping - discount - coupon - points, 0)
+        supply = unit_price * 65 // 100 // 100 * 100
+
+        payment = _choice(rng, PAYMENT_METHODS, n)
+        bank = payment == '무통장'
+        names = SURNAMES[rng.integers(0, len(SURNAMES), n)].astype(object) + GIVEN[rng.integers(0, len(GIVEN), n)].astype(object)
+        seq = np.arange(offset, offset + n)
+        order_no = (days.astype(np.int64) * 10 ** 8 + seq % 10 ** 8 + 10 ** 11).astype(str).astype(object)
+        shipped = days + rng.integers(1, 4, n)
+        phone = '010-' + pd.Series(rng.integers(10 ** 7, 2 * 10 ** 7, n).astype(str)).str.slice(1, 5).to_numpy(dtype=object) + '-' + \
+            pd.Series(rng.integers(10 ** 4, 2 * 10 ** 4, n).astype(str)).str.slice(1).to_numpy(dtype=object)
+        region = _choice(rng, REGIONS, n)
+        district = np.empty(n, dtype=object)
+        for name, districts in DISTRICTS.items():
+            rows = np.flatnonzero(region == name)
+            district[rows] = np.array(districts, dtype=object)[rng.integers(0, len(districts), len(rows))]
+
+        frame = pd.DataFrame({
+            'UID': self.uids[customer].astype(str),
+            '주문번호': order_no,
+            '상품주문번호': order_no + '-1',
+            '주문일': order_dates + self.time_labels[rng.integers(0, 86400, n)],
+            '주문상태': _choice(rng, ORDER_STATUS, n),
+            '품종': self.product_varieties[product],
+            '상품코드': 'P' + (product + 10 ** 6).astype(str).astype(object),
+            '상품명': _blank(self.product_names[product], rng, 0.03),
+            '옵션명': np.where(quantity > 1, '묶음', '기본'),
+            '고객선택옵션': _choice(rng, CUSTOMER_OPTIONS, n),
+            '수량': quantity,
+            '셀러명': _blank(self.sellers[rng.choice(len(self.sellers), n, p=self.seller_weights)], rng, 0.015),
+            '판매채널 ID': 'CH01',
+            '주문경로': _choice(rng, CHANNELS, n),
+            '회원구분': _choice(rng, MEMBER_TYPES, n),
+            '주문자명': names,
+            '주문자 연락처': phone,
+            '수령인': names,
+            '수령인 연락처': phone,
+            '우편번호': rng.integers(1000, 64000, n),
+            '광역지역(정식)': region,
+            '시군구': district,
+            '배송지 주소': region + ' ' + district + ' 어딘가로 ' + (seq % 500 + 1).astype(str).astype(object),
+            '배송메모': MEMOS[rng.integers(0, len(MEMOS), n)],
+            '결제방법': payment,
+            '결제금액': _format_won(amount),
+            '할인금액': _format_won(discount),
+            '쿠폰 할인': _format_won(coupon),
+            '적립금 사용': _format_won(points),
+            '배송비': _format_won(shipping),
+            '실결제 금액': _blank(_format_won(paid), rng, 0.005),
+            '판매단가': _format_won(unit_price),
+            '공급단가': _format_won(supply),
+            '재구매 횟수': _blank(repeat, rng, 0.005),
+            '입금일': np.where(bank, order_dates, None),
+            '입금자명': np.where(bank, names, None),
+            '배송준비 처리일': self.day_labels[shipped],
+            '택배사': np.array(COURIERS, dtype=object)[rng.integers(0, len(COURIERS), n)],
+            '송장번호': rng.integers(10 ** 11, 10 ** 12, n),
+            '발송일': self.day_labels[shipped],
+            '구매확정일': self.day_labels[shipped + 7],
+            '정산예정일': self.day_labels[shipped + 10],
+            '정산금액': _format_won(paid * 9 // 10),
+        })
+        return frame[COLUMNS]
+
+
+def generate_orders(n_rows, seed=0, **kwargs):
+    """합성 주문 n_rows건을 하나의 데이터프레임으로 반환합니다."""
+    synth = OrderSynthesizer(n_rows, seed, **kwargs)
+    return pd.concat(list(synth.chunks()), ignore_index=True) if n_rows else pd.DataFrame(columns=COLUMNS)
+
+
+def write_orders(path, n_rows, seed=0, chunk_rows=500_000, **kwargs):
+    """합성 주문을 청크 단위로 CSV(utf-8-sig)에 씁니다. (대용량도 메모리 일정)"""
+    synth = OrderSynthesizer(n_rows, seed, **kwargs)
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        pd.DataFrame(columns=COLUMNS).to_csv(f, index=False)
+        for chunk in synth.chunks(chunk_rows):
+            chunk.to_csv(f, index=False, header=False)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='주문 export 형식의 합성 데이터(CSV)를 생성합니다.')
+    parser.add_argument('rows', type=int, help='생성할 주문 건수')
+    parser.add_argument('output', help='출력 CSV 경로')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--days', type=int, default=365, help='주문일 범위 (일)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    write_orders(args.output, args.rows, args.seed, days=args.days)
+    print(f"생성 완료: {args.output} ({args.rows:,}건, {time.perf_counter() - start:.2f}초)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import chart_data
+
+
+def _series(n_series, n_days, seed=0):
+    # 계열마다 크기가 다른 일자별 값 (긴 형식)
+    rng = np.random.default_rng(seed)
+    days = pd.date_range('2025-01-01', periods=n_days, freq='D')
+    return pd.DataFrame({
+        '주문일': np.tile(days, n_series),
+        '품종': np.repeat([f'품종{i:03d}' for i in range(n_series)], n_days),
+        '주문건수': rng.poisson(5, n_series * n_days) * np.repeat(np.arange(1, n_series + 1), n_days),
+    })
+
+
+@pytest.mark.parametrize('n, threshold', [(1000, 50), (1000, 3), (10, 10), (10, 2), (5, 100)])
+def test_lttb_keeps_endpoints_within_budget(n, threshold):
+    x = np.arange(n, dtype=np.float64)
+    y = np.sin(x / 7) + np.random.default_rng(1).normal(size=n)
+    picked = chart_data.lttb(x, y, threshold)
+    assert picked[0] == 0 and picked[-1] == n - 1
+    assert len(picked) == min(n, max(threshold, 2))
+    assert (np.diff(picked) > 0).all()
+
+
+def test_lttb_keeps_spike():
+    y = np.zeros(1000)
+    y[537] = 100
+    assert 537 in chart_data.lttb(np.arange(1000), y, 20)
+
+
+@pytest.mark.parametrize('n_series', [1, 5, 150])
+@pytest.mark.parametrize('shared', [False, True])
+def test_downsample_series_total_budget(n_series, shared):
+    df = _series(n_series, 365)
+    out = chart_data.downsample_series(df, '주문일', '주문건수', '품종', 400, shared=shared)
+    assert len(out) <= 400
+    assert out['품종'].nunique() == min(n_series, 400 // 3)
+    # 계열마다 첫 날과 마지막 날은 남음
+    for _, part in out.groupby('품종'):
+        assert part['주문일'].min() == df['주문일'].min() and part['주문일'].max() == df['주문일'].max()
+
+
+def test_merge_small_series_keeps_totals():
+    df = _series(10, 30)
+    merged = chart_data.merge_small_series(df, '주문일', '주문건수', '품종', 4)
+    assert merged['품종'].nunique() == 4
+    # 합계가 큰 3개 계열은 그대로, 나머지 7개는 일자별 합계 한 계열
+    assert set(merged['품종']) == {'품종009', '품종008', '품종007', '기타 (7개)'}
+    assert merged['주문건수'].sum() == df['주문건수'].sum()
+    other = merged[merged['품종'] == '기타 (7개)'].set_index('주문일')['주문건수']
+    expected = df[df['품종'] <= '품종006'].groupby('주문일')['주문건수'].sum()
+    pd.testing.assert_series_equal(other, expected, check_names=False)
+
+
+@pytest.mark.parametrize('integer', [False, True])
+def test_histogram_bins_count_all_rows(integer):
+    values = pd.Series(np.random.default_rng(2).integers(0, 365, 5000).astype(float))
+    values[::97] = np.nan
+    bins = chart_data.histogram_bins(values, 50, integer=integer)
+    assert bins['개수'].sum() == values.notna().sum()
+    assert len(bins) <= 50
+    np.testing.assert_allclose(bins['끝'] - bins['시작'], bins['폭'])
+    if integer:
+        assert (bins['폭'] == np.round(bins['폭'])).all()
+
+
+def test_histogram_bins_edge_cases():
+    assert chart_data.histogram_bins(pd.Series([np.nan, np.nan])).empty
+    single = chart_data.histogram_bins([7.0], 10, integer=True)
+    assert single['개수'].sum() == 1
+
+
+def test_stratified_sample_covers_groups():
+    rng = np.random.default_rng(3)
+    sizes = {'큰 그룹': 20000, '중간': 3000, '작은 그룹': 5}
+    df = pd.DataFrame({'Segment': np.repeat(list(sizes), list(sizes.values())), 'v': rng.random(sum(sizes.values()))})
+    sample = chart_data.stratified_sample(df, 'Segment', 1000)
+
+    counts = sample['Segment'].value_counts()
+    # 비례 배분 + 작은 그룹 최소 행 수 (min_per_group=20)
+    assert counts['작은 그룹'] == 5
+    assert counts['큰 그룹'] == pytest.approx(1000 * 20000 / 23005, abs=1)
+    assert len(sample) <= 1000 + 20 * len(sizes)
+    assert sample.index.isin(df.index).all()
+    # 같은 데이터면 같은 표본
+    pd.testing.assert_frame_equal(sample, chart_data.stratified_sample(df, 'Segment', 1000))
+
+
+def test_stratified_sample_small_input_unchanged():
+    df = pd.DataFrame({'Segment': ['a', 'b'], 'v': [1, 2]})
+    assert chart_data.stratified_sample(df, 'Segment', 10) is df
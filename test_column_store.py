@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from column_store import AppendBuffer, ColumnStore
+
+
+def _frame(uids, varieties, amounts, counts, names):
+    return pd.DataFrame({
+        'UID': pd.Categorical(uids),
+        '품종': pd.Categorical(varieties),
+        '실결제 금액': np.asarray(amounts, dtype=np.float64),
+        '재구매 횟수': pd.array(counts, dtype='Int32'),
+        '상품명': pd.array(names, dtype='string[python]'),
+    })
+
+
+@pytest.fixture
+def head():
+    return _frame(['u2', 'u1', None], ['감귤', '딸기', '감귤'], [1000, np.nan, 3000], [0, None, 2], ['a', None, 'c'])
+
+
+@pytest.fixture
+def tail():
+    return _frame(['u0', 'u2'], ['한라봉', '감귤'], [4000, 5000], [1, None], ['d', 'e'])
+
+
+def test_append_matches_concat(head, tail):
+    store = ColumnStore(head, unsorted_categories=['UID']).append(tail)
+    expected = pd.concat([head.astype({'UID': object}), tail.astype({'UID': object})], ignore_index=True)
+    result = store.frame.astype({'UID': object})
+    # 품종: 새 값(한라봉)이 기존 값 뒤에 정렬되므로 코드 그대로, 정렬된 카테고리 유지
+    assert store.frame['품종'].cat.categories.tolist() == ['감귤', '딸기', '한라봉']
+    expected['품종'] = expected['품종'].astype(store.frame['품종'].dtype)
+    pd.testing.assert_frame_equal(result, expected)
+    # UID: 처음 본 순서로 끝에 붙음
+    assert store.frame['UID'].cat.categories.tolist() == ['u1', 'u2', 'u0']
+
+
+def test_mid_sorted_category_recodes_column(head):
+    store = ColumnStore(head).append(_frame(['u3'], ['당근'], [1], [0], ['x']))
+    assert store.frame['품종'].cat.categories.tolist() == ['감귤', '당근', '딸기']
+    assert store.frame['품종'].tolist() == ['감귤', '딸기', '감귤', '당근']
+
+
+def test_append_keeps_previous_frame_and_shares_memory(head, tail):
+    first = ColumnStore(head).append(tail)
+    before = first.frame.copy()
+    second = first.append(tail).append(tail)
+    pd.testing.assert_frame_equal(first.frame, before)
+    assert len(second.frame) == len(head) + 3 * len(tail)
+    # 용량이 남아 있으면 다음 스냅샷은 같은 버퍼의 더 긴 뷰
+    third = second.append(tail.iloc[:1])
+    assert np.shares_memory(third.frame['실결제 금액'].to_numpy(), second.frame['실결제 금액'].to_numpy())
+
+
+def test_append_from_older_store_does_not_overwrite(head, tail):
+    base = ColumnStore(head).append(tail)
+    newer = base.append(tail)
+    other = base.append(head)
+    assert newer.frame['상품명'].tolist()[-2:] == ['d', 'e']
+    assert other.frame['상품명'].tolist()[-3:] == ['a', pd.NA, 'c']
+
+
+def test_codes_widen_past_int8(head):
+    many = [f'품종{i:03d}' for i in range(200)]
+    store = ColumnStore(head).append(_frame(['u1'] * 200, many, [1] * 200, [0] * 200, ['x'] * 200))
+    assert store.frame['품종'].cat.codes.dtype == np.int16
+    assert store.frame['품종'].tolist()[:3] == ['감귤', '딸기', '감귤']
+    assert store.frame['품종'].tolist()[3:] == many
+
+
+def test_empty_append(head):
+    store = ColumnStore(head).append(head.iloc[:0])
+    pd.testing.assert_frame_equal(store.frame, head)
+
+
+def test_append_buffer_grows_by_doubling():
+    buffer = AppendBuffer(np.arange(4))
+    grown = buffer.append(4, np.arange(4, 5))
+    assert len(grown._data) == 8
+    np.testing.assert_array_equal(grown.view(), np.arange(5))
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import analyses
+from customer_index import CustomerIndex
+from filter_index import FilterIndex
+
+
+def _sorted_orders(df):
+    # 고객, 주문 시각 순 (동시각은 행 순서)
+    return df.reset_index(drop=True).dropna(subset=['UID']).sort_values(['UID', '주문일'], kind='stable')
+
+
+def test_index_matches_sorted_groupby(orders):
+    index = CustomerIndex(orders)
+    ordered = _sorted_orders(orders)
+    np.testing.assert_array_equal(index.rows, ordered.index.to_numpy())
+    counts = orders.groupby('UID', observed=False).size()
+    np.testing.assert_array_equal(index.counts(), counts.to_numpy())
+
+    gaps = ordered.groupby('UID', observed=True)['주문일'].diff().dropna().dt.days
+    np.testing.assert_array_equal(index.intervals(), gaps.to_numpy())
+    by_customer = ordered.groupby('UID', observed=True)['주문일']
+    to_second = by_customer.apply(lambda s: (s.iloc[1] - s.iloc[0]).days if len(s) > 1 else np.nan).dropna()
+    np.testing.assert_array_equal(index.time_to_second(), to_second.to_numpy())
+
+
+@pytest.mark.parametrize('filters, start, end', [
+    ({'품종': ['감귤', '황금향']}, '2024-11-01', '2025-03-31'),
+    ({'주문경로': ['네이버']}, None, None),
+])
+def test_restrict_matches_rebuild(orders, filters, start, end):
+    ids = FilterIndex(orders).select(filters, start, end)
+    sub = orders.take(ids)
+    restricted = CustomerIndex(orders).restrict(ids)
+    rebuilt = CustomerIndex(sub)
+    np.testing.assert_array_equal(restricted.rows, rebuilt.rows)
+    np.testing.assert_array_equal(restricted.counts(), rebuilt.counts())
+
+    expected = analyses.repurchase_pattern(sub)
+    result = analyses.repurchase_pattern(sub, restricted)
+    for name in expected:
+        pd.testing.assert_frame_equal(pd.DataFrame(result[name]), pd.DataFrame(expected[name]))
+
+
+def test_empty_filter(orders):
+    index = CustomerIndex(orders).restrict(np.empty(0, dtype=np.int64))
+    assert index.counts().sum() == 0
+    assert len(index.intervals()) == 0 and len(index.time_to_second()) == 0
+    assert analyses.repurchase_pattern(orders.iloc[:0], index) is None
+    assert analyses.repurchase_pattern(orders.iloc[:0]) is None
+
+
+def test_missing_uids_single_orders_and_same_time(orders):
+    df = orders.iloc[:5].reset_index(drop=True)
+    df['UID'] = pd.Categorical(['a', None, 'b', 'a', 'a'])
+    df['주문일'] = pd.to_datetime(['2025-01-01 10:00', '2025-01-02 00:00', '2025-01-03 00:00', '2025-01-01 10:00',
+                                 '2025-01-11 09:00'])
+    index = CustomerIndex(df)
+    # UID 결측 행은 제외, 동시각 주문은 행 순서, 간격은 일 단위 버림
+    np.testing.assert_array_equal(index.rows, [0, 3, 4, 2])
+    np.testing.assert_array_equal(index.counts(), [3, 1])
+    np.testing.assert_array_equal(index.intervals(), [0, 9])
+    np.testing.assert_array_equal(index.time_to_second(), [0])
+    pattern = analyses.repurchase_pattern(df, index)
+    # 한 건뿐인 고객(b)은 재구매 고객이 아님
+    assert pattern['summary_stats']['수치'].iloc[0] == '1명'
+    assert analyses.repurchase_pattern(df[df['UID'] == 'b']) is None
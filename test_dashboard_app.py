@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import data_loader
+import settings
+
+app_test = pytest.importorskip('streamlit.testing.v1')
+
+
+@pytest.fixture
+def app(orders_csv, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'DATA_PATH', orders_csv)
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+    at = app_test.AppTest.from_file(str(Path(__file__).with_name('dashboard_app.py')), default_timeout=120)
+    at.run()
+    assert not at.exception
+    return at
+
+
+def _subheaders(at):
+    return {subheader.value for subheader in at.subheader}
+
+
+def test_lazy_sections_render_only_selected(app):
+    # 처음에는 첫 화면(트렌드)만 그림
+    assert '키워드 기반 주문/매출 트렌드' in _subheaders(app)
+    assert 'RFM 고객 세분화 분석' not in _subheaders(app)
+    assert len(app.tabs) == 0
+
+    app.radio(key='section').set_value('👥 RFM 고객 분석').run()
+    assert not app.exception
+    assert 'RFM 고객 세분화 분석' in _subheaders(app)
+    assert '키워드 기반 주문/매출 트렌드' not in _subheaders(app)
+
+
+def test_tabs_render_all_sections(app):
+    lazy = next(toggle for toggle in app.sidebar.toggle if toggle.label == '⚡ 선택한 화면만 계산')
+    lazy.set_value(False).run()
+    assert not app.exception
+    assert len(app.tabs) == 7
+    assert not any(radio.key == 'section' for radio in app.radio)
+    assert {'키워드 기반 주문/매출 트렌드', 'RFM 고객 세분화 분석', '데이터 필터 결과'} <= _subheaders(app)
+
+
+def test_sessions_share_one_read_only_dataset(orders_csv, tmp_path, monkeypatch):
+    import streamlit as st
+
+    # 다른 앱 테스트가 같은 파일을 이미 불러 두었을 수 있으므로 공유 자원을 비우고 시작
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    path = tmp_path / 'orders.csv'
+    path.write_bytes(open(orders_csv, 'rb').read())
+    monkeypatch.setattr(settings, 'DATA_PATH', str(path))
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+    loaded = []
+    load_dataset = data_loader.load_dataset
+
+    def record(*args, **kwargs):
+        loaded.append(load_dataset(*args, **kwargs))
+        return loaded[-1]
+
+    monkeypatch.setattr(data_loader, 'load_dataset', record)
+    sessions = [app_test.AppTest.from_file(str(Path(__file__).with_name('dashboard_app.py')), default_timeout=120)
+                for _ in range(2)]
+    sessions[0].run()
+    assert len(loaded) == 1
+    before = loaded[0].copy()
+
+    # 두 번째 세션은 같은 객체를 받고, 모든 화면을 계산해도 공유 데이터는 바뀌지 않음
+    second = sessions[1].run()
+    next(toggle for toggle in second.sidebar.toggle if toggle.label == '⚡ 선택한 화면만 계산').set_value(False).run()
+    second.sidebar.multiselect[0].set_value(['감귤']).run()
+    assert not second.exception
+    assert len(loaded) == 1
+    pd.testing.assert_frame_equal(loaded[0], before)
+
+    # 원본 파일이 바뀌면 새로 불러옴
+    with open(path, 'ab') as f:
+        f.write(open(orders_csv, 'rb').read().splitlines(keepends=True)[-1])
+    sessions[0].run()
+    assert not sessions[0].exception
+    assert len(loaded) == 2 and len(loaded[1]) == len(before) + 1
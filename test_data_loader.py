@@ -0,0 +1,131 @@
+import os
+
+import pandas as pd
+import pytest
+
+import data_loader
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def source(orders_csv, tmp_path):
+    # 테스트마다 고칠 수 있는 원본 사본과 캐시 폴더
+    path = tmp_path / 'orders.csv'
+    path.write_bytes(open(orders_csv, 'rb').read())
+    return str(path), str(tmp_path / 'cache')
+
+
+def _forbid_preprocess(monkeypatch):
+    def fail(df):
+        raise AssertionError('캐시가 있으면 원본을 다시 전처리하지 않아야 함')
+    monkeypatch.setattr(data_loader, 'preprocess', fail)
+
+
+def test_cache_round_trip(source, monkeypatch):
+    path, cache_dir = source
+    built = data_loader.load_dataset(path, cache_dir=cache_dir)
+    assert os.path.exists(data_loader.cache_path(path, cache_dir))
+    assert data_loader.cache_is_fresh(path, cache_dir=cache_dir)
+    _forbid_preprocess(monkeypatch)
+    cached = data_loader.load_dataset(path, cache_dir=cache_dir)
+    pd.testing.assert_frame_equal(cached, built.reset_index(drop=True))
+
+
+def test_changed_source_invalidates_cache(source):
+    path, cache_dir = source
+    before = data_loader.load_dataset(path, cache_dir=cache_dir)
+    lines = open(path, 'rb').read().splitlines(keepends=True)
+    # 마지막 줄을 바꾸면 (크기, 수정시각, 해시) 키가 달라짐
+    with open(path, 'wb') as f:
+        f.write(b''.join(lines[:-1]) + lines[-2])
+    assert not data_loader.cache_is_fresh(path, cache_dir=cache_dir)
+    after = data_loader.load_dataset(path, cache_dir=cache_dir)
+    assert len(after) == len(before)
+    assert data_loader.cache_is_fresh(path, cache_dir=cache_dir)
+
+
+def test_cache_version_invalidates_cache(source, monkeypatch):
+    path, cache_dir = source
+    data_loader.load_dataset(path, cache_dir=cache_dir)
+    monkeypatch.setattr(data_loader, 'CACHE_VERSION', data_loader.CACHE_VERSION + '-next')
+    assert not data_loader.cache_is_fresh(path, cache_dir=cache_dir)
+    assert data_loader.load_cached(path, cache_dir=cache_dir) is None
+
+
+def test_corrupt_cache_is_rebuilt(source):
+    path, cache_dir = source
+    expected = data_loader.load_dataset(path, cache_dir=cache_dir)
+    with open(data_loader.cache_path(path, cache_dir), 'wb') as f:
+        f.write(b'not parquet')
+    assert data_loader.load_cached(path, cache_dir=cache_dir) is None
+    pd.testing.assert_frame_equal(data_loader.load_dataset(path, cache_dir=cache_dir), expected)
+
+
+def test_column_sets_use_separate_caches(source):
+    path, cache_dir = source
+    columns = ['UID', '주문일', '실결제 금액']
+    assert data_loader.cache_path(path, cache_dir, columns) != data_loader.cache_path(path, cache_dir)
+    df = data_loader.load_dataset(path, cache_dir=cache_dir, columns=columns)
+    assert set(df.columns) == {*columns, '시즌'}
+    assert not data_loader.cache_is_fresh(path, cache_dir=cache_dir)
+    assert data_loader.cache_is_fresh(path, cache_dir=cache_dir, columns=columns)
+
+
+def test_missing_source(tmp_path):
+    assert data_loader.load_dataset(str(tmp_path / 'none.csv'), cache_dir=str(tmp_path)) is None
+
+
+HEADER = 'UID,주문일,품종,셀러명,주문경로,상품명,실결제 금액,재구매 횟수,주문자명\n'
+ROWS = ('u1,2025-01-02 10:00:00,감귤,셀러A,네이버,제주 감귤 5kg,"12,900",1,홍길동\n'
+        'u2,날짜아님,감귤,셀러A,네이버,꿀 한라봉,"1,000",,김철수\n'
+        'u1,2025-01-05 09:00:00,,셀러B,,실속 감귤,,,이영희\n')
+
+
+@pytest.mark.parametrize('encoding', ['utf-8-sig', 'cp949'])
+def test_schema_pruning_and_encoding(tmp_path, encoding):
+    path = tmp_path / 'orders.csv'
+    path.write_text(HEADER + ROWS, encoding=encoding)
+    assert data_loader.sniff_encoding(path) == encoding
+    df = data_loader.preprocess(data_loader.read_source(str(path)))
+    # 스키마 밖 칼럼(주문자명)은 읽지 않고, 날짜가 잘못된 행은 제외
+    assert '주문자명' not in df.columns
+    assert len(df) == 2
+    assert df['UID'].dtype == 'category' and df['상품명'].dtype == 'string'
+    assert df['실결제 금액'].tolist()[0] == 12900.0 and pd.isna(df['실결제 금액'].tolist()[1])
+    # 재구매 횟수 미기재는 0
+    assert df['재구매 횟수'].tolist() == [1, 0]
+    assert df['품종'].isna().tolist() == [False, True]
+    assert df['키워드'].tolist()[1] != 0
+
+
+def test_sniff_ignores_multibyte_char_cut_at_block_end(tmp_path, monkeypatch):
+    path = tmp_path / 'orders.csv'
+    text = HEADER + ROWS
+    path.write_text(text, encoding='utf-8-sig')
+    # 한글 한 글자(3바이트) 중간에서 잘리는 크기
+    cut = len('﻿'.encode()) + len(HEADER.encode()) + len('u1,2025-01-02 10:00:00,'.encode()) + 1
+    monkeypatch.setattr(data_loader, 'SNIFF_SIZE', cut)
+    assert data_loader.sniff_encoding(path) == 'utf-8-sig'
+
+
+def test_parquet_source_matches_csv(tmp_path):
+    csv_path = tmp_path / 'orders.csv'
+    csv_path.write_text(HEADER + ROWS, encoding='utf-8-sig')
+    parquet_path = tmp_path / 'orders.parquet'
+    pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str).to_parquet(parquet_path)
+    from_csv = data_loader.preprocess(data_loader.read_source(str(csv_path)))
+    from_parquet = data_loader.preprocess(data_loader.read_source(str(parquet_path)))
+    pd.testing.assert_frame_equal(from_parquet, from_csv)
+
+
+def test_read_tail_skips_partial_line(tmp_path):
+    path = tmp_path / 'orders.csv'
+    path.write_text(HEADER, encoding='utf-8-sig')
+    offset = path.stat().st_size
+    with open(path, 'ab') as f:
+        # 마지막 줄은 한글 글자 중간까지만 쓰인 상태
+        f.write(ROWS.encode()[:-5])
+    tail, next_offset = data_loader.read_tail(str(path), offset)
+    assert len(tail) == 2 and next_offset < path.stat().st_size
+    assert data_loader.read_tail(str(path), next_offset) == (None, next_offset)
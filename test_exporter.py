@@ -0,0 +1,77 @@
+import gzip
+import io
+
+import pandas as pd
+import pytest
+
+import exporter
+
+
+@pytest.fixture
+def frame(orders):
+    return orders.iloc[:250]
+
+
+def _read(fmt, data):
+    if fmt == 'Parquet':
+        return pd.read_parquet(io.BytesIO(data))
+    if fmt == 'CSV (gzip)':
+        data = gzip.decompress(data)
+    return pd.read_csv(io.BytesIO(data), encoding='utf-8-sig')
+
+
+@pytest.mark.parametrize('fmt', list(exporter.EXPORT_FORMATS))
+def test_export_round_trip_in_chunks(frame, fmt):
+    if fmt == 'Parquet':
+        pytest.importorskip('pyarrow')
+    columns = ['UID', '품종', '실결제 금액']
+    with exporter.export(frame, fmt, columns, chunk_rows=100) as f:
+        data = f.read()
+    result = _read(fmt, data)
+    assert result.columns.tolist() == columns
+    assert len(result) == len(frame)
+    pd.testing.assert_series_equal(result['실결제 금액'], frame['실결제 금액'].reset_index(drop=True), check_dtype=False)
+    if fmt == 'Parquet':
+        # 청크마다 행 그룹 하나
+        import pyarrow.parquet as pq
+        assert pq.ParquetFile(io.BytesIO(data)).num_row_groups == 3
+
+
+@pytest.mark.parametrize('fmt', list(exporter.EXPORT_FORMATS))
+def test_export_empty_keeps_header(frame, fmt):
+    if fmt == 'Parquet':
+        pytest.importorskip('pyarrow')
+    with exporter.export(frame.iloc[:0], fmt, ['UID', '주문일']) as f:
+        result = _read(fmt, f.read())
+    assert result.empty and result.columns.tolist() == ['UID', '주문일']
+
+
+def test_export_spools_to_disk(frame, monkeypatch):
+    monkeypatch.setattr(exporter, 'EXPORT_SPOOL_BYTES', 1024)
+    with exporter.export(frame, 'CSV') as f:
+        # 기준 크기를 넘으면 메모리 대신 임시 파일에 기록
+        assert f._rolled
+        assert len(f.read()) > 1024
+    with exporter.export(frame.iloc[:1], 'CSV', ['UID']) as f:
+        assert not f._rolled
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        exporter.export(pd.DataFrame({'a': [1]}), 'XLSX')
+
+
+def test_deferred_export_builds_on_call(frame, monkeypatch):
+    calls = []
+    export = exporter.export
+
+    def record(*args, **kwargs):
+        calls.append(args[1])
+        return export(*args, **kwargs)
+
+    monkeypatch.setattr(exporter, 'export', record)
+    build = exporter.deferred_export(frame, 'CSV', ['UID'])
+    # 버튼을 누르기 전에는 만들지 않음
+    assert calls == []
+    assert len(_read('CSV', build())) == len(frame)
+    assert calls == ['CSV']
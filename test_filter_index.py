@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from filter_index import FilterIndex
+
+FILTERS = [
+    ({}, None, None),
+    ({'품종': ['감귤', '황금향']}, '2024-11-01', '2025-03-31'),
+    ({'품종': ['한라봉'], '주문경로': ['네이버', '카카오톡']}, None, '2025-01-31'),
+    ({'셀러명': None, '주문경로': ['인스타그램']}, '2025-06-01', None),
+    ({'품종': ['없는품종']}, None, None),
+]
+
+
+def _reference(df, filters, start, end):
+    mask = np.ones(len(df), dtype=bool)
+    for col, values in filters.items():
+        if values is not None:
+            mask &= df[col].isin(values).to_numpy()
+    day = df['주문일'].dt.normalize()
+    if start is not None:
+        mask &= (day >= pd.Timestamp(start)).to_numpy()
+    if end is not None:
+        mask &= (day <= pd.Timestamp(end)).to_numpy()
+    return np.flatnonzero(mask)
+
+
+@pytest.mark.parametrize('filters, start, end', FILTERS)
+def test_select_matches_boolean_mask(orders, filters, start, end):
+    index = FilterIndex(orders)
+    np.testing.assert_array_equal(index.select(filters, start, end), _reference(orders, filters, start, end))
+    pd.testing.assert_frame_equal(index.filter(orders, filters, start, end),
+                                  orders.iloc[_reference(orders, filters, start, end)])
+
+
+@pytest.mark.parametrize('filters, start, end', FILTERS)
+def test_extend_matches_full_build(orders, filters, start, end):
+    # 증분 추가분은 기존 마지막 주문일 이후의 행
+    by_day = orders.sort_values('주문일', kind='stable').reset_index(drop=True)
+    split = int(by_day['주문일'].dt.normalize().searchsorted(pd.Timestamp('2025-06-01')))
+    extended = FilterIndex(by_day.iloc[:split]).extend(by_day.iloc[split:])
+    assert extended is not None
+    np.testing.assert_array_equal(extended.select(filters, start, end), FilterIndex(by_day).select(filters, start, end))
+
+
+def test_extend_rejects_earlier_rows(orders):
+    by_day = orders.sort_values('주문일', kind='stable').reset_index(drop=True)
+    assert FilterIndex(by_day.iloc[1000:]).extend(by_day.iloc[:1000]) is None
+
+
+def test_nan_values_and_empty_selection(orders):
+    df = orders.copy()
+    df.loc[df.index[::7], '셀러명'] = None
+    index = FilterIndex(df)
+    # 값이 비어 있는 행은 어떤 값 목록에도 걸리지 않고, 필터하지 않는 칼럼(None)에서는 남음
+    sellers = df['셀러명'].dropna().unique()[:3].tolist()
+    for filters in ({'셀러명': sellers}, {'셀러명': None}, {'셀러명': []}, {'품종': [], '셀러명': sellers}):
+        np.testing.assert_array_equal(index.select(filters), _reference(df, filters, None, None))
+    assert len(FilterIndex.take(df, index.select({'셀러명': []}))) == 0
+
+
+def test_date_gap_and_single_row(orders):
+    df = orders.iloc[[0, 1]].reset_index(drop=True)
+    df['주문일'] = pd.to_datetime(['2025-01-01 23:00', '2025-03-01 00:00'])
+    df['품종'] = '감귤'
+    index = FilterIndex(df)
+    assert len(index.select(None, '2025-01-02', '2025-02-28')) == 0
+    np.testing.assert_array_equal(index.select(None, '2025-01-01', '2025-01-01'), [0])
+    np.testing.assert_array_equal(index.select(None, '2025-03-01', None), [1])
+    single = FilterIndex(df.iloc[:1])
+    np.testing.assert_array_equal(single.select({'품종': ['감귤']}), [0])
+
+
+def test_extend_with_empty_rows_and_twice_from_same_index(orders):
+    by_day = orders.sort_values('주문일', kind='stable').reset_index(drop=True)
+    split = len(by_day) // 2
+    base = FilterIndex(by_day.iloc[:split])
+    assert len(base.extend(by_day.iloc[:0]).order) == split
+    # 같은 색인에서 두 번 확장해도 서로의 배열을 덮어쓰지 않음
+    first = base.extend(by_day.iloc[split:split + 100])
+    second = base.extend(by_day.iloc[split:])
+    filters = {'주문경로': ['네이버']}
+    np.testing.assert_array_equal(first.select(filters), FilterIndex(by_day.iloc[:split + 100]).select(filters))
+    np.testing.assert_array_equal(second.select(filters), FilterIndex(by_day).select(filters))
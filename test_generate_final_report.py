@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_loader
+import generate_final_report
+import partitions
+import repurchase
+from variety_labels import split_labels
+
+
+@pytest.fixture(scope='module')
+def raw_orders(orders_csv):
+    # 보고서는 모든 칼럼을 읽음
+    return partitions.load_path(orders_csv, columns=None)
+
+
+@pytest.fixture(scope='module')
+def report(raw_orders):
+    return generate_final_report.compute_report(raw_orders)
+
+
+def _exploded(df):
+    out = df.assign(품종=df['품종'].astype(object).map(lambda v: list(split_labels(v)))).explode('품종')
+    return out.dropna(subset=['품종'])
+
+
+def _chart(report, filename):
+    return next(chart.data for chart in report['charts'] if chart.spec.filename == filename)
+
+
+def test_overview_matches_pandas(raw_orders, report):
+    raw_columns = [c for c in raw_orders.columns if c not in data_loader.DERIVED_COLUMNS]
+    missing = raw_orders[raw_columns].isna().sum()
+    assert report['n_rows'] == len(raw_orders)
+    assert report['n_columns'] == len(raw_columns)
+    assert report['missing'] == [(name, int(count)) for name, count in missing.items() if count > 0]
+
+
+def test_rates_match_pandas(raw_orders, report):
+    rates = repurchase.repurchase_rates(raw_orders, min_orders={'셀러명': 10})
+    for key, dim, n in [('variety_rates', '품종', 5), ('seller_rates', '셀러명', 3),
+                        ('member_rates', '회원구분', None), ('channel_rates', '주문경로', None)]:
+        expected = rates[dim].sort_values(['재구매율(%)', '주문건수'], ascending=False)
+        expected = expected if n is None else expected.head(n)
+        pd.testing.assert_frame_equal(pd.DataFrame(report[key]), expected.reset_index(drop=True), check_dtype=False)
+
+
+def test_season_rfm_and_crosstab_match_pandas(raw_orders, report):
+    exploded = _exploded(raw_orders)
+    season = exploded.groupby(['시즌', '품종'], observed=True).size().rename('주문건수').reset_index()
+    season = season.sort_values(['시즌', '주문건수'], ascending=[True, False]).groupby('시즌', observed=True).head(2)
+    assert [(r['시즌'], r['품종'], r['주문건수']) for r in report['season_top']] == list(season.itertuples(index=False, name=None))
+
+    # 세그먼트별 평균 x 고객 수 = 전체 주문 건수/금액
+    uid = raw_orders.dropna(subset=['UID'])
+    segments = _chart(report, 'rfm_customer_segments.png').set_index('Segment')['고객수']
+    means = pd.DataFrame(report['rfm_means']).set_index('Segment')
+    assert segments.sum() == uid['UID'].nunique()
+    assert (means['Frequency'] * segments).sum() == pytest.approx(len(uid))
+    assert (means['Monetary'] * segments).sum() == pytest.approx(uid['실결제 금액'].sum())
+
+    regions = raw_orders['광역지역(정식)'].value_counts().nlargest(5).index
+    crosstab = pd.crosstab(exploded['광역지역(정식)'], exploded['품종'])
+    varieties = sorted(exploded['품종'].value_counts().nlargest(4).index)
+    expected = crosstab.reindex(index=regions, columns=varieties, fill_value=0)
+    np.testing.assert_array_equal(report['region_variety'].to_numpy(), expected.to_numpy())
+    assert list(report['region_variety'].columns) == varieties
+
+
+def test_chart_tables_match_pandas(raw_orders, report):
+    price = pd.cut(raw_orders['실결제 금액'], data_loader.PRICE_BINS, labels=data_loader.PRICE_LABELS, right=False)
+    np.testing.assert_array_equal(_chart(report, '05_price_range.png')['count'], price.value_counts(sort=False).to_numpy())
+
+    payment = raw_orders['결제방법'].value_counts()
+    chart = _chart(report, '03_payment_method.png')
+    assert dict(zip(chart['결제방법'], chart['count'])) == payment.to_dict()
+    assert chart['count'].is_monotonic_decreasing
+
+    regions = _chart(report, '01_region_counts.png')
+    assert dict(zip(regions['광역지역(정식)'], regions['주문건수'])) == raw_orders['광역지역(정식)'].value_counts()[lambda s: s > 0].to_dict()
+
+    varieties = _chart(report, '04_product_variety.png')
+    assert dict(zip(varieties['품종'], varieties['주문건수'])) == _exploded(raw_orders)['품종'].value_counts().to_dict()
+
+
+def test_generated_report_contains_numbers(orders_csv, raw_orders, tmp_path):
+    output, missing = generate_final_report.generate_report(orders_csv, str(tmp_path / 'report.md'), render_images=False)
+    assert missing == []
+    text = (tmp_path / 'report.md').read_text(encoding='utf-8-sig')
+    assert f"**전체 데이터 건수**: {len(raw_orders):,} 건" in text
+    assert '차트 이미지 누락' not in text
+    for name, count in raw_orders.isna().sum()[lambda s: s > 0].items():
+        assert f"| {name} | {count:,} |" in text
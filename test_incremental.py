@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import analyses
+import data_loader
+import order_cube
+import synth_orders
+from filter_index import FilterIndex
+from incremental import SKETCH_TABLES, IncrementalDataset
+from rfm_store import RFMStore
+from sketches import OrderSketches
+
+FILTERS = [
+    ({'품종': None}, None, None),
+    ({'품종': ['감귤', '황금향']}, '2025-03-01', '2025-06-30'),
+]
+
+
+@pytest.fixture(scope='module', params=['date_sorted', 'unsorted'])
+def lines(request, tmp_path_factory):
+    # date_sorted: 추가분이 기존 마지막 주문일 이후 (색인 확장), unsorted: 이전 일자 포함 (색인 재생성)
+    orders = synth_orders.generate_orders(2000, seed=3)
+    if request.param == 'date_sorted':
+        orders = orders.sort_values('주문일', kind='stable')
+    path = tmp_path_factory.mktemp('incremental') / 'source.csv'
+    orders.to_csv(path, index=False, encoding='utf-8-sig')
+    return path.read_bytes().splitlines(keepends=True)
+
+
+def _summed(table, measures, how):
+    # 증분 큐브/스케치는 경계 일자의 같은 키가 여러 행일 수 있으므로 키별로 합쳐 비교
+    keys = [c for c in table.columns if c not in measures]
+    return table.groupby(keys, observed=True, dropna=False)[measures].agg(how)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # 전체 로드가 만드는 Parquet 캐시를 테스트 폴더에 둠
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+
+
+def test_append_matches_full_reload(lines, tmp_path):
+    path = tmp_path / 'orders.csv'
+    cut1, cut2 = int(len(lines) * 0.7), int(len(lines) * 0.9)
+    path.write_bytes(b''.join(lines[:cut1]))
+    dataset = IncrementalDataset(str(path))
+    dataset.refresh()
+    assert dataset.last_refresh['mode'] == 'full'
+
+    # 쓰다 만 마지막 줄은 다음 refresh까지 반영하지 않음
+    with open(path, 'ab') as f:
+        f.write(b''.join(lines[cut1:cut2]) + lines[cut2][:10])
+    partial = dataset.refresh()
+    assert dataset.last_refresh['mode'] == 'append'
+    assert len(partial.df) == cut2 - 1
+
+    with open(path, 'ab') as f:
+        f.write(lines[cut2][10:] + b''.join(lines[cut2 + 1:]))
+    snapshot = dataset.refresh()
+    assert dataset.last_refresh['mode'] == 'append'
+
+    full = data_loader.load_dataset(str(path), use_cache=False)
+    # UID 카테고리는 처음 본 순서로 붙으므로 값으로 비교
+    pd.testing.assert_frame_equal(snapshot.df, full, check_categorical=False)
+    assert snapshot.df['UID'].astype(object).equals(full['UID'].astype(object))
+    pd.testing.assert_frame_equal(_summed(snapshot.cube, order_cube.CUBE_MEASURES, 'sum'),
+                                  _summed(order_cube.build_cube(full), order_cube.CUBE_MEASURES, 'sum'))
+    index = FilterIndex(full)
+    for filters, start, end in FILTERS:
+        np.testing.assert_array_equal(snapshot.index.select(filters, start, end), index.select(filters, start, end))
+    pd.testing.assert_frame_equal(snapshot.rfm.scores(), RFMStore.from_orders(full).scores())
+    sketches = OrderSketches.from_orders(full)
+    for name, how in SKETCH_TABLES.items():
+        measures = [getattr(sketches, name).columns[-1]]
+        pd.testing.assert_frame_equal(_summed(getattr(snapshot.sketches, name), measures, how),
+                                      _summed(getattr(sketches, name), measures, how), check_dtype=False)
+
+
+def test_replaced_file_reloads_fully(lines, tmp_path):
+    path = tmp_path / 'orders.csv'
+    path.write_bytes(b''.join(lines))
+    dataset = IncrementalDataset(str(path))
+    dataset.refresh()
+    path.write_bytes(b''.join(lines[:len(lines) // 2]))
+    snapshot = dataset.refresh()
+    assert dataset.last_refresh['mode'] == 'full'
+    assert len(snapshot.df) == len(lines) // 2 - 1
+
+
+@pytest.fixture(scope='module')
+def frame():
+    return synth_orders.generate_orders(600, seed=5).sort_values('주문일', kind='stable').reset_index(drop=True)
+
+
+def _append_csv(path, rows):
+    rows.to_csv(path, mode='a', header=False, index=False, encoding='utf-8')
+
+
+def test_append_new_values_and_missing_keys(frame, tmp_path):
+    path = tmp_path / 'orders.csv'
+    frame.iloc[:400].to_csv(path, index=False, encoding='utf-8-sig')
+    dataset = IncrementalDataset(str(path))
+    dataset.refresh()
+    before = dataset.refresh()
+    kept = before.df.copy()
+
+    tail = frame.iloc[400:].copy()
+    # 기존 셀러 사이에 정렬되는 새 셀러, 맨 뒤에 정렬되는 새 셀러, 키 결측, 날짜가 잘못된 행(전처리에서 제외)
+    tail.iloc[:5, tail.columns.get_loc('셀러명')] = '셀러0000가'
+    tail.iloc[5:10, tail.columns.get_loc('셀러명')] = '힣셀러'
+    tail.iloc[10:20, tail.columns.get_loc('주문경로')] = None
+    tail.iloc[20:30, tail.columns.get_loc('UID')] = None
+    tail.iloc[30, tail.columns.get_loc('주문일')] = 'x'
+    _append_csv(path, tail)
+    snapshot = dataset.refresh()
+    assert dataset.last_refresh['mode'] == 'append'
+
+    # 이전 스냅샷은 그대로
+    pd.testing.assert_frame_equal(before.df, kept)
+    full = data_loader.load_dataset(str(path), use_cache=False).reset_index(drop=True)
+    assert len(snapshot.df) == len(full) == len(frame) - 1
+    assert snapshot.df['셀러명'].cat.categories.equals(full['셀러명'].cat.categories)
+    pd.testing.assert_frame_equal(snapshot.df, full, check_categorical=False)
+    filters = {'셀러명': ['셀러0000가', '힣셀러'], '주문경로': None}
+    np.testing.assert_array_equal(snapshot.index.select(filters), FilterIndex(full).select(filters))
+    # UID 카테고리가 처음 본 순서여도 고객 순서 분석은 전체 로드와 같음
+    result, expected = analyses.repurchase_pattern(snapshot.df), analyses.repurchase_pattern(full)
+    for name in ('intervals', 'summary_stats', 'freq_summary'):
+        pd.testing.assert_frame_equal(pd.DataFrame(result[name]), pd.DataFrame(expected[name]))
+    pd.testing.assert_frame_equal(snapshot.rfm.scores(), RFMStore.from_orders(full).scores())
+
+
+def test_append_without_valid_rows(frame, tmp_path):
+    path = tmp_path / 'orders.csv'
+    frame.iloc[:100].to_csv(path, index=False, encoding='utf-8-sig')
+    dataset = IncrementalDataset(str(path))
+    before = dataset.refresh()
+    bad = frame.iloc[100:102].copy()
+    bad['주문일'] = 'x'
+    _append_csv(path, bad)
+    snapshot = dataset.refresh()
+    assert (dataset.last_refresh['mode'], dataset.last_refresh['rows']) == ('append', 0)
+    assert snapshot.version != before.version
+    pd.testing.assert_frame_equal(snapshot.df, before.df)
+    assert snapshot.rfm.scores().equals(before.rfm.scores())
+
+
+def test_missing_file(tmp_path):
+    dataset = IncrementalDataset(str(tmp_path / 'none.csv'))
+    assert dataset.refresh() is None and not dataset.has_new_data()
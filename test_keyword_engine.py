@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+import analyses
+import keyword_engine
+from keyword_engine import KW_CATEGORIES, KeywordMatcher
+
+
+def _reference_flags(names, categories=KW_CATEGORIES):
+    # 카테고리/키워드마다 대소문자 무시 부분 문자열 검색
+    flags = np.zeros(len(names), dtype=np.uint64)
+    text = names.fillna('').str.casefold()
+    for i, keywords in enumerate(categories.values()):
+        hit = np.zeros(len(names), dtype=bool)
+        for kw in keywords:
+            hit |= text.str.contains(kw.casefold(), regex=False).to_numpy(dtype=bool)
+        flags[hit] |= np.uint64(1 << i)
+    return flags
+
+
+def test_flags_match_per_keyword_search(orders):
+    names = orders['상품명']
+    np.testing.assert_array_equal(KeywordMatcher().flags(names).astype(np.uint64), _reference_flags(names))
+    # 전처리 때 저장한 칼럼도 같은 결과
+    np.testing.assert_array_equal(keyword_engine.get_flags(orders).astype(np.uint64), _reference_flags(names))
+
+
+def test_overlapping_and_prefix_keywords():
+    categories = {'a': ['꿀'], 'b': ['꿀사과'], 'c': ['사과'], 'd': ['ABC']}
+    names = pd.Series(['꿀사과 선물', '사과꿀', '꿀', 'abc 사과', '없음', None], dtype='string')
+    np.testing.assert_array_equal(KeywordMatcher(categories).flags(names).astype(np.uint64),
+                                  _reference_flags(names, categories))
+
+
+def test_empty_and_missing_names():
+    matcher = KeywordMatcher()
+    assert len(matcher.flags(pd.Series([], dtype='string'))) == 0
+    np.testing.assert_array_equal(matcher.flags(pd.Series([None, pd.NA], dtype='string')), [0, 0])
+    assert keyword_engine.flag_matrix(np.array([], dtype=np.uint8)).columns.tolist() == list(KW_CATEGORIES)
+
+
+def test_flag_dtype_widens_with_categories():
+    categories = {f'c{i}': [f'kw{i:02d}'] for i in range(12)}
+    flags = KeywordMatcher(categories).flags(pd.Series(['kw11', 'kw00 kw07'], dtype='string'))
+    assert flags.dtype == np.uint16
+    np.testing.assert_array_equal(flags, [1 << 11, (1 << 0) | (1 << 7)])
+
+
+def test_keyword_share_empty_filter_and_zero_sales_month(orders):
+    assert analyses.keyword_share(orders.iloc[:0]).empty
+    # 결제 금액이 모두 비어 있는 달은 비중 0 (0으로 나누지 않음), 한 행짜리 달도 그대로 계산
+    df = orders.iloc[:3].copy()
+    df['주문일'] = pd.to_datetime(['2025-01-05', '2025-03-10', '2025-03-11'])
+    df['실결제 금액'] = [np.nan, 1000.0, 3000.0]
+    df['상품명'] = pd.array(['제주 감귤', '꿀 한라봉', '제주 꿀 감귤'], dtype='string')
+    df = df.drop(columns=keyword_engine.FLAG_COLUMN)
+    share = analyses.keyword_share(df).set_index(['연월', '카테고리'])['비중(%)']
+    assert share[('2025-01', '원산지')] == 0
+    assert share[('2025-03', '맛강조')] == 100
+    assert share[('2025-03', '원산지')] == 75
+    assert '2025-02' not in share.index.get_level_values('연월')
@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+
+import order_cube
+
+FILTERS = [
+    (None, None, None),
+    (['감귤', '황금향'], '2024-11-01', '2025-03-31'),
+    (['딸기'], None, '2025-01-31'),
+    (['없는품종'], None, None),
+]
+
+
+def _mask(df, varieties, start, end):
+    mask = df['품종'].isin(varieties) if varieties else df['품종'].notna()
+    if start is not None:
+        mask &= df['주문일'] >= pd.Timestamp(start)
+    if end is not None:
+        mask &= df['주문일'] < pd.Timestamp(end) + pd.Timedelta(days=1)
+    return df[mask]
+
+
+@pytest.mark.parametrize('varieties, start, end', FILTERS)
+def test_cube_kpis_match_rows(orders, varieties, start, end):
+    part = order_cube.slice_cube(order_cube.build_cube(orders), varieties, start, end)
+    rows = _mask(orders, varieties, start, end)
+    kpis = order_cube.cube_kpis(part)
+
+    assert kpis['주문건수'] == len(rows)
+    assert kpis['매출액'] == pytest.approx(rows['실결제 금액'].sum())
+    paid = rows['실결제 금액'].count()
+    assert kpis['평균객단가'] == pytest.approx(rows['실결제 금액'].sum() / paid if paid else 0)
+    assert kpis['재구매율'] == pytest.approx((rows['재구매 횟수'] > 0).mean() * 100 if len(rows) else 0)
+
+
+def test_rollup_matches_groupby(orders):
+    cube = order_cube.build_cube(orders)
+    rolled = order_cube.rollup(cube, ['셀러명'], ['주문건수', '매출액']).set_index('셀러명').sort_index()
+    grouped = orders.groupby('셀러명', observed=True).agg(주문건수=('UID', 'size'), 매출액=('실결제 금액', 'sum'))
+    pd.testing.assert_frame_equal(rolled, grouped, check_dtype=False, check_categorical=False)
+
+
+def test_season_rollup_matches_groupby(orders):
+    counts = order_cube.season_rollup(order_cube.build_cube(orders), ['품종'])
+    expected = orders.groupby(['시즌', '품종'], observed=True).size()
+    expected = expected[expected > 0].reset_index(name='count')
+    pd.testing.assert_frame_equal(counts, expected, check_dtype=False, check_categorical=False)
+
+
+def test_merge_cube_matches_full_build(orders):
+    split = len(orders) * 2 // 3
+    merged = order_cube.merge_cube(order_cube.build_cube(orders.iloc[:split]), order_cube.build_cube(orders.iloc[split:]))
+    full = order_cube.build_cube(orders)
+    pd.testing.assert_frame_equal(merged.reset_index(drop=True), full, check_dtype=False)
+
+
+def test_nan_dimension_rows_are_kept(orders):
+    # 셀러명/주문경로가 비어 있어도 품종이 있으면 KPI에 포함
+    df = orders.copy()
+    df.loc[df.index[:50], '셀러명'] = None
+    df.loc[df.index[50:80], '주문경로'] = None
+    part = order_cube.slice_cube(order_cube.build_cube(df))
+    assert order_cube.cube_kpis(part)['주문건수'] == int(df['품종'].notna().sum())
+    rolled = order_cube.rollup(part, ['셀러명'])
+    assert rolled['주문건수'].sum() == int((df['품종'].notna() & df['셀러명'].notna()).sum())
+
+
+def test_single_row_and_date_gap(orders):
+    # 두 주문 사이 빈 기간만 고르면 빈 조각, 한 행짜리 그룹도 그대로 집계
+    df = orders.iloc[[0, 1]].copy()
+    df['주문일'] = pd.to_datetime(['2025-01-01 10:00', '2025-03-01 09:00'])
+    df['품종'] = '감귤'
+    cube = order_cube.build_cube(df)
+    gap = order_cube.slice_cube(cube, None, '2025-01-02', '2025-02-28')
+    assert gap.empty
+    assert order_cube.cube_kpis(gap) == {'주문건수': 0, '매출액': 0.0, '평균객단가': 0, '재구매율': 0}
+    assert order_cube.season_rollup(gap).empty
+    first = order_cube.slice_cube(cube, None, '2025-01-01', '2025-01-01')
+    assert order_cube.cube_kpis(first)['주문건수'] == 1
+    assert order_cube.rollup(cube, ['주문일'])['주문건수'].tolist() == [1, 1]
+
+
+def test_empty_filters(orders):
+    cube = order_cube.build_cube(orders)
+    # 선택 품종 없음(None/빈 목록)은 전체, 시작일이 종료일보다 늦으면 빈 조각
+    assert len(order_cube.slice_cube(cube, [])) == len(order_cube.slice_cube(cube, None))
+    assert order_cube.slice_cube(cube, None, '2025-03-01', '2025-02-01').empty
+    assert order_cube.build_cube(orders.iloc[:0]).empty
+    assert order_cube.rollup(cube.iloc[:0], ['품종']).empty
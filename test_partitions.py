@@ -0,0 +1,113 @@
+import os
+
+import pandas as pd
+import pytest
+
+import data_loader
+import partitions
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.fixture
+def folder(orders_csv, tmp_path, monkeypatch):
+    # 월별 파티션 폴더: 2025-02는 없고(기간 공백), 2025-03은 Parquet, 날짜가 모두 잘못된 파일 하나
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+    directory = tmp_path / 'exports'
+    directory.mkdir()
+    raw = pd.read_csv(orders_csv, encoding='utf-8-sig', dtype=str)
+    for month, part in raw.groupby(raw['주문일'].str[:7]):
+        if month == '2025-02':
+            continue
+        if month == '2025-03':
+            part.to_parquet(directory / f'{month}.parquet')
+        else:
+            part.to_csv(directory / f'{month}.csv', index=False, encoding='utf-8-sig')
+    raw.iloc[:3].assign(주문일='날짜아님').to_csv(directory / 'broken.csv', index=False, encoding='utf-8-sig')
+    return str(directory)
+
+
+def _forbid_scan(monkeypatch):
+    def fail(path):
+        raise AssertionError(f'바뀌지 않은 파티션을 다시 훑음: {path}')
+    monkeypatch.setattr(partitions, 'scan_partition', fail)
+
+
+def test_manifest_entries(folder, orders):
+    manifest = partitions.update_manifest(folder)
+    assert len(manifest) == 12 and '2025-02.csv' not in manifest
+    assert manifest['broken.csv']['rows'] == 0 and manifest['broken.csv']['start'] is None
+    march = orders[orders['주문일'].dt.strftime('%Y-%m') == '2025-03']
+    entry = manifest['2025-03.parquet']
+    assert entry['rows'] == len(march)
+    assert pd.Timestamp(entry['start']) == march['주문일'].min() and pd.Timestamp(entry['end']) == march['주문일'].max()
+    assert entry['varieties'] == sorted(march['품종'].dropna().astype(str).unique())
+
+
+def test_manifest_rescans_only_changed_partitions(folder, monkeypatch):
+    manifest = partitions.update_manifest(folder)
+    assert partitions.read_manifest(folder) == manifest
+    scanned = []
+    scan = partitions.scan_partition
+    monkeypatch.setattr(partitions, 'scan_partition', lambda path: scanned.append(os.path.basename(path)) or scan(path))
+
+    path = os.path.join(folder, '2024-09.csv')
+    lines = open(path, 'rb').read().splitlines(keepends=True)
+    with open(path, 'wb') as f:
+        f.write(b''.join(lines[:-1]))
+    os.remove(os.path.join(folder, 'broken.csv'))
+    updated = partitions.update_manifest(folder)
+    assert scanned == ['2024-09.csv']
+    assert updated['2024-09.csv']['rows'] == manifest['2024-09.csv']['rows'] - 1
+    assert 'broken.csv' not in updated
+
+    _forbid_scan(monkeypatch)
+    assert partitions.update_manifest(folder) == updated
+
+
+def test_manifest_version_change_rescans(folder, monkeypatch):
+    partitions.update_manifest(folder)
+    monkeypatch.setattr(data_loader, 'CACHE_VERSION', data_loader.CACHE_VERSION + '-next')
+    assert partitions.read_manifest(folder) == {}
+
+
+def test_summary(folder, orders):
+    catalog = partitions.summary(partitions.update_manifest(folder))
+    without_february = orders[orders['주문일'].dt.strftime('%Y-%m') != '2025-02']
+    assert catalog['rows'] == len(without_february)
+    assert (catalog['start'], catalog['end']) == (orders['주문일'].min(), orders['주문일'].max())
+    assert catalog['varieties'] == sorted(without_february['품종'].dropna().astype(str).unique())
+    assert partitions.summary({}) is None
+    assert partitions.summary({'broken.csv': {'rows': 0}}) is None
+
+
+def test_select_prunes_by_date(folder):
+    manifest = partitions.update_manifest(folder)
+    assert partitions.select(manifest) == tuple(sorted(set(manifest) - {'broken.csv'}))
+    # 경계 날짜는 포함 (일 단위)
+    assert partitions.select(manifest, '2024-10-31', '2024-11-01') == ('2024-10.csv', '2024-11.csv')
+    assert partitions.select(manifest, '2025-03-01 23:00', '2025-03-01') == ('2025-03.parquet',)
+    # 파티션이 없는 기간(공백)과 데이터 밖의 기간은 빈 선택
+    assert partitions.select(manifest, '2025-02-02', '2025-02-27') == ()
+    assert partitions.select(manifest, '2030-01-01', None) == ()
+    assert partitions.select(manifest, None, '2024-09-01') == ('2024-09.csv',)
+
+
+def test_load_path_reads_selected_partitions(folder, orders, monkeypatch):
+    assert partitions.cache_files(folder, ('2024-12.csv', '2025-03.parquet')) is None
+    loaded = partitions.load_path(folder, '2024-12-15', '2025-03-10')
+    months = orders['주문일'].dt.strftime('%Y-%m')
+    expected = orders[months.isin(['2024-12', '2025-01', '2025-03'])]
+    assert len(loaded) == len(expected)
+    assert loaded['UID'].dtype == 'category' and loaded['품종'].dtype == 'category'
+    assert sorted(loaded['주문일']) == sorted(expected['주문일'])
+    # 파티션별 캐시가 생긴 뒤에는 다시 전처리하지 않음
+    files = partitions.cache_files(folder, ('2024-12.csv', '2025-03.parquet'))
+    assert files is not None and all(os.path.exists(f) for f in files)
+    monkeypatch.setattr(data_loader, 'preprocess', lambda df: pytest.fail('캐시가 있으면 전처리하지 않아야 함'))
+    assert len(partitions.load_path(folder, '2024-12-15', '2025-03-10')) == len(expected)
+    assert partitions.load_path(folder, '2025-02-02', '2025-02-27') is None
+
+
+def test_cache_dir_differs_by_folder(tmp_path):
+    assert partitions.cache_dir(str(tmp_path / 'a' / 'exports')) != partitions.cache_dir(str(tmp_path / 'b' / 'exports'))
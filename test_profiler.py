@@ -0,0 +1,106 @@
+import json
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import profiler
+from profiler import RunProfiler, row_count
+
+
+def test_row_count():
+    assert row_count(None) is None
+    assert row_count(pd.DataFrame({'a': [1, 2, 3]})) == 3
+    assert row_count(np.float64(1.0)) == 1
+    assert row_count({'a': pd.Series([1, 2]), 'b': None, 'c': [1]}) == 3
+    assert row_count({'a': None}) is None
+    assert row_count(object()) is None
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    prof = RunProfiler(enabled=False)
+    with prof.span('구간') as record:
+        record.rows_out = 1
+    assert prof.call('호출', 'analysis', len, [1, 2]) == 2
+    prof.add('추가', 'load', 0.1)
+    prof.write_jsonl(str(tmp_path / 'profile.jsonl'))
+    assert prof.records() == []
+    assert not (tmp_path / 'profile.jsonl').exists()
+
+
+def test_nested_spans_and_memory():
+    prof = RunProfiler(enabled=True)
+    try:
+        with prof.span('바깥', rows_in=10) as outer:
+            result = prof.call('안쪽', 'analysis', np.ones, 1 << 20, rows_in=10)
+            outer.rows_out = len(result)
+    finally:
+        prof.close()
+    outer, inner = prof.records()
+    assert (outer['name'], outer['depth'], inner['name'], inner['depth']) == ('바깥', 0, '안쪽', 1)
+    assert inner['rows_out'] == outer['rows_out'] == 1 << 20
+    assert inner['seconds'] <= outer['seconds']
+    # 8MB 배열: 안쪽 최대 메모리가 바깥 구간에도 반영됨
+    assert inner['peak_mb'] >= 7.9 and outer['peak_mb'] >= inner['peak_mb']
+
+
+def test_span_records_on_error():
+    prof = RunProfiler(enabled=True, memory=False)
+    try:
+        with prof.span('실패'):
+            raise ValueError('x')
+    except ValueError:
+        pass
+    (record,) = prof.records()
+    assert record['seconds'] is not None and record['peak_mb'] is None
+    assert prof._stack == []
+
+
+def test_tracing_is_shared_between_profilers():
+    was_tracing = tracemalloc.is_tracing()
+    first, second = RunProfiler(enabled=True), RunProfiler(enabled=True)
+    first.close()
+    # 다른 실행이 아직 계측 중이면 추적을 멈추지 않음
+    assert tracemalloc.is_tracing()
+    second.close()
+    second.close()
+    assert tracemalloc.is_tracing() == was_tracing
+    assert profiler._tracing_users == 0
+
+
+def test_write_jsonl_appends(tmp_path):
+    path = tmp_path / 'logs' / 'profile.jsonl'
+    for run in range(2):
+        prof = RunProfiler(enabled=True, memory=False)
+        prof.add('로드', 'load', 0.5, rows_out=3)
+        prof.write_jsonl(str(path), run=run)
+    entries = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert [entry['run'] for entry in entries] == [0, 1]
+    assert entries[0]['spans'] == [{'name': '로드', 'kind': 'load', 'depth': 0, 'seconds': 0.5,
+                                    'rows_in': None, 'rows_out': 3, 'peak_mb': None}]
+
+
+def test_dashboard_profile_toggle_writes_log(orders_csv, tmp_path, monkeypatch):
+    app_test = pytest.importorskip('streamlit.testing.v1')
+    import data_loader
+    import settings
+
+    log = tmp_path / 'profile.jsonl'
+    monkeypatch.setattr(settings, 'DATA_PATH', orders_csv)
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(settings, 'PROFILE_LOG', str(log))
+    at = app_test.AppTest.from_file(str(Path(__file__).with_name('dashboard_app.py')), default_timeout=120)
+    at.run()
+    assert not at.exception and not log.exists()
+
+    # 토글을 켜면 그 실행부터 계측해 로그에 한 줄씩 추가
+    at.toggle(key='profile').set_value(True).run()
+    at.run()
+    assert not at.exception
+    entries = [json.loads(line) for line in log.read_text(encoding='utf-8').splitlines()]
+    assert len(entries) == 2
+    spans = {span['name']: span for span in entries[-1]['spans']}
+    assert 0 < spans['필터 적용']['rows_out'] <= spans['필터 적용']['rows_in']
+    assert entries[-1]['sections'] == ['📈 트렌드 비교']
@@ -0,0 +1,81 @@
+import sys
+
+import pytest
+
+import generate_final_report
+import report_charts
+
+pytest.importorskip('plotly')
+
+
+@pytest.fixture(scope='module')
+def charts(orders_csv):
+    import partitions
+
+    return generate_final_report.compute_report(partitions.load_path(orders_csv, columns=None))['charts']
+
+
+def test_chart_key_changes_with_data_only(charts):
+    chart = charts[0]
+    assert report_charts.chart_key(chart) == report_charts.chart_key(report_charts.Chart(chart.spec, chart.data.copy()))
+    changed = chart.data.copy()
+    changed.iloc[0, changed.columns.get_loc(chart.spec.x)] += 1
+    assert report_charts.chart_key(report_charts.Chart(chart.spec, changed)) != report_charts.chart_key(chart)
+    assert report_charts.chart_key(report_charts.Chart(chart.spec._replace(title='다른 제목'), chart.data)) != report_charts.chart_key(chart)
+
+
+def test_missing_chart_files(charts):
+    names = [chart.spec.filename for chart in charts]
+    assert generate_final_report.missing_chart_files(charts, None) == names
+    timings = {name: None for name in names[1:]}
+    assert generate_final_report.missing_chart_files(charts, timings) == names[:1]
+    assert generate_final_report.chart_notice([], True) is None
+    assert 'kaleido' in generate_final_report.chart_notice(names, True)
+    assert names[0] in generate_final_report.chart_notice(names[:1], False)
+
+
+def _run_main(monkeypatch, orders_csv, tmp_path, timings):
+    monkeypatch.setattr(report_charts, 'render_charts', lambda charts, *args, **kwargs: timings(charts))
+    output = tmp_path / 'report.md'
+    monkeypatch.setattr(sys, 'argv', ['generate_final_report.py', '--data', orders_csv, '--output', str(output),
+                                      '--images', str(tmp_path / 'images')])
+    with pytest.raises(SystemExit) as exit_info:
+        generate_final_report.main()
+    return exit_info.value.code, output.read_text(encoding='utf-8-sig')
+
+
+def test_no_chart_engine_flags_report_and_fails(monkeypatch, orders_csv, tmp_path):
+    # kaleido가 없으면 render_charts는 None
+    code, text = _run_main(monkeypatch, orders_csv, tmp_path, lambda charts: None)
+    assert code == 1
+    assert '차트 이미지 누락' in text and 'kaleido' in text
+
+
+def test_failed_chart_flags_report_and_fails(monkeypatch, orders_csv, tmp_path):
+    code, text = _run_main(monkeypatch, orders_csv, tmp_path,
+                           lambda charts: {chart.spec.filename: 0.1 for chart in charts[1:]})
+    assert code == 1
+    assert '차트 1개 생성 실패' in text
+
+
+def test_all_charts_rendered_succeeds(monkeypatch, orders_csv, tmp_path):
+    code, text = _run_main(monkeypatch, orders_csv, tmp_path, lambda charts: {chart.spec.filename: None for chart in charts})
+    assert code == 0
+    assert '차트 이미지 누락' not in text
+
+
+def test_missing_data_fails(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, 'argv', ['generate_final_report.py', '--data', str(tmp_path / 'none.csv'),
+                                      '--output', str(tmp_path / 'report.md')])
+    with pytest.raises(SystemExit) as exit_info:
+        generate_final_report.main()
+    assert exit_info.value.code == 1
+
+
+def test_unchanged_charts_are_skipped(charts, tmp_path):
+    pytest.importorskip('kaleido')
+    first = report_charts.render_charts(charts[:2], str(tmp_path), workers=2)
+    if first is None or len(first) < 2:
+        pytest.skip('차트 이미지를 생성할 수 없는 환경 (Chrome 없음)')
+    assert all(seconds is not None for seconds in first.values())
+    assert report_charts.render_charts(charts[:2], str(tmp_path)) == {chart.spec.filename: None for chart in charts[:2]}
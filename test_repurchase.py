@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import repurchase
+
+
+def _reference(df, dim, min_orders, z=1.96):
+    values = df[dim].astype(object)
+    if dim == '품종':
+        # 콤보 값('감귤, 황금향')은 포함된 품종마다 한 번씩
+        values = values.str.split(',').explode().str.strip()
+    repeat = (df['재구매 횟수'] > 0).reindex(values.index)
+    grouped = repeat.groupby(values).agg(['size', 'sum'])
+    grouped = grouped[grouped['size'] >= min_orders].sort_index()
+    n, k = grouped['size'].to_numpy(float), grouped['sum'].to_numpy(float)
+    p = k / n
+    center = (p + z ** 2 / (2 * n)) / (1 + z ** 2 / n)
+    half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / (1 + z ** 2 / n)
+    return pd.DataFrame({
+        dim: grouped.index.to_numpy(dtype=object),
+        '주문건수': grouped['size'].to_numpy(),
+        '재구매건수': grouped['sum'].to_numpy(),
+        '재구매율(%)': p * 100,
+        '하한(%)': (center - half) * 100,
+        '상한(%)': (center + half) * 100,
+    })
+
+
+@pytest.mark.parametrize('dim', repurchase.REPURCHASE_DIMS)
+def test_rates_match_groupby(orders, dim):
+    min_orders = {'셀러명': 10}
+    result = repurchase.repurchase_rates(orders, [dim], min_orders=min_orders)[dim]
+    expected = _reference(orders, dim, min_orders.get(dim, 1))
+    pd.testing.assert_frame_equal(result.astype({dim: object}), expected, check_dtype=False)
+
+
+def test_unit_weights_match_exact(orders):
+    exact = repurchase.repurchase_rates(orders)
+    weighted = repurchase.repurchase_rates(orders, weights=np.ones(len(orders)))
+    for dim, table in exact.items():
+        pd.testing.assert_frame_equal(weighted[dim], table)
+
+
+def test_empty_filter(orders):
+    result = repurchase.repurchase_rates(orders.iloc[:0])
+    assert set(result) == set(repurchase.REPURCHASE_DIMS)
+    for dim, table in result.items():
+        assert table.empty
+        assert table.columns.tolist() == [dim, *repurchase.RATE_COLUMNS]
+
+
+def test_missing_values_and_single_order_groups(orders):
+    df = orders.iloc[:4].copy()
+    df['회원구분'] = pd.Categorical(['일반', '일반', None, '신규'])
+    df['재구매 횟수'] = pd.array([1, None, 2, 0], dtype='Int32')
+    table = repurchase.repurchase_rates(df, ['회원구분'])['회원구분'].set_index('회원구분')
+    # 결측 차원 값은 제외, 재구매 횟수 결측은 재구매 아님
+    assert table.index.tolist() == ['신규', '일반']
+    assert table.loc['일반', ['주문건수', '재구매건수']].tolist() == [2, 1]
+    # 한 건짜리 그룹도 신뢰구간이 0~100% 안
+    single = table.loc['신규']
+    assert single['재구매율(%)'] == 0
+    assert 0 <= single['하한(%)'] <= single['상한(%)'] <= 100
+    assert repurchase.repurchase_rates(df, ['회원구분'], min_orders=2)['회원구분']['회원구분'].tolist() == ['일반']
+
+
+def test_wilson_interval_bounds():
+    low, high = repurchase.wilson_interval([0, 1, 5], [1, 1, 10])
+    assert np.all((0 <= low) & (low <= high) & (high <= 1))
+    assert low[0] == 0 and high[1] == pytest.approx(1)
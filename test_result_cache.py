@@ -0,0 +1,108 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from result_cache import ResultCache, estimate_size, filter_key
+
+
+def _array(n_bytes):
+    return np.zeros(n_bytes // 8, dtype=np.float64)
+
+
+def test_filter_key_ignores_variety_order():
+    assert filter_key(['감귤', '황금향'], '2025-01-01') == filter_key(['황금향', '감귤'], '2025-01-01')
+    assert filter_key(['감귤'], dataset_version=1) != filter_key(['감귤'], dataset_version=2)
+
+
+def test_lru_eviction_order_and_bytes():
+    cache = ResultCache(3000)
+    for key in 'abc':
+        cache.put('n', key, _array(1000))
+    assert cache.nbytes == 3000
+    # 'a'를 읽으면 가장 최근 사용이 되어 다음 추가 때 'b'가 먼저 제거됨
+    assert cache.get('n', 'a') is not None
+    cache.put('n', 'd', _array(1000))
+    assert cache.status('n', 'b') is None
+    assert [cache.status('n', k) for k in 'acd'] == ['cached'] * 3
+    assert cache.stats()['evictions'] == 1 and cache.nbytes == 3000
+
+    # 같은 키를 다시 넣으면 이전 크기를 빼고 계산
+    cache.put('n', 'a', _array(400))
+    assert cache.nbytes == 2400
+    # 한도보다 큰 결과는 저장하지 않음
+    cache.put('n', 'big', _array(4000))
+    assert cache.status('n', 'big') is None and cache.nbytes == 2400
+
+
+def test_estimate_size_counts_containers():
+    arr = _array(800)
+    assert estimate_size(arr) == 800
+    assert estimate_size({'a': arr, 'b': [arr, arr]}) > 3 * 800
+
+
+def test_hit_miss_counters():
+    cache = ResultCache(1 << 20)
+    calls = []
+    for _ in range(3):
+        cache.get_or_compute('n', 'k', lambda: calls.append(1) or 42)
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], len(calls)) == (2, 1, 1)
+    assert stats['hit_rate'] == pytest.approx(200 / 3)
+
+
+def test_concurrent_get_or_compute_runs_once():
+    cache = ResultCache(1 << 20)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('n', 'k', slow))) for _ in range(4)]
+    threads[0].start()
+    started.wait()
+    for t in threads[1:]:
+        t.start()
+    time.sleep(0.05)
+    assert cache.status('n', 'k') == 'running'
+    release.set()
+    for t in threads:
+        t.join()
+    assert results == ['value'] * 4 and len(calls) == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_failed_compute_is_not_cached():
+    cache = ResultCache(1 << 20)
+    with pytest.raises(ZeroDivisionError):
+        cache.get_or_compute('n', 'k', lambda: 1 / 0)
+    assert cache.status('n', 'k') is None
+    assert cache.get_or_compute('n', 'k', lambda: 1) == 1
+
+
+def test_clear_drops_result_of_running_compute():
+    cache = ResultCache(1 << 20)
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait()
+        return 'stale'
+
+    worker = threading.Thread(target=cache.get_or_compute, args=('n', 'k', slow))
+    worker.start()
+    started.wait()
+    cache.clear()
+    assert cache.status('n', 'k') is None
+    # 비운 뒤의 요청은 기다리지 않고 새로 계산
+    assert cache.get_or_compute('n', 'k', lambda: 'fresh') == 'fresh'
+    release.set()
+    worker.join()
+    assert cache.get('n', 'k') == 'fresh'
+    assert cache.stats()['entries'] == 1
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from column_store import ColumnStore
+from rfm_store import RFM_COLUMNS, RFMLog, RFMStore
+
+
+def _reference(df):
+    # pandas groupby + qcut(rank(method='first'))로 계산한 RFM 점수
+    # 기준일: 마지막 주문 시각 + 1일
+    snapshot = df['주문일'].max() + pd.Timedelta(days=1)
+    rfm = df.groupby('UID', observed=True).agg(
+        last=('주문일', 'max'), Frequency=('주문일', 'size'), Monetary=('실결제 금액', 'sum'))
+    rfm['Recency'] = (snapshot - rfm['last']).dt.days
+    rfm['R_Score'] = pd.qcut(rfm['Recency'].rank(method='first'), 5, labels=[5, 4, 3, 2, 1]).astype(int)
+    rfm['F_Score'] = pd.qcut(rfm['Frequency'].rank(method='first'), 5, labels=[1, 2, 3, 4, 5]).astype(int)
+    rfm['M_Score'] = pd.qcut(rfm['Monetary'].rank(method='first'), 5, labels=[1, 2, 3, 4, 5]).astype(int)
+    rfm['Total_Score'] = rfm['R_Score'] + rfm['F_Score'] + rfm['M_Score']
+    rfm['Segment'] = pd.cut(rfm['Total_Score'], [0, 6, 9, 12, 15],
+                            labels=['At-risk (이탈우려)', 'Regular (일반)', 'VIP (우수)', 'VVIP (최상위)']).astype(object)
+    return rfm.drop(columns='last')
+
+
+def _assert_scores_equal(scores, expected):
+    scores = scores.set_axis(scores.index.astype(str))
+    expected = expected.set_axis(expected.index.astype(str))[scores.columns]
+    pd.testing.assert_frame_equal(scores, expected, check_dtype=False, check_names=False)
+
+
+def test_scores_match_groupby(orders):
+    _assert_scores_equal(RFMStore.from_orders(orders).scores(), _reference(orders))
+
+
+def test_subset_matches_filtered_build(orders):
+    store = RFMStore.from_orders(orders)
+    part = orders[orders['품종'].isin(['감귤', '황금향'])]
+    _assert_scores_equal(store.subset(part).scores(), _reference(part))
+
+
+def test_append_matches_full_build(orders):
+    split = len(orders) // 2
+    head, tail = orders.iloc[:split], orders.iloc[split:]
+    store = RFMStore.from_orders(head, pd.Index(head['UID'].dropna().unique()).sort_values()).append(tail)
+    full = RFMStore.from_orders(orders)
+    # 합쳐진 UID 순서로 맞추면 동점 순위까지 같음
+    pd.testing.assert_frame_equal(store.reindex(full.uids).scores(), full.scores())
+    np.testing.assert_array_equal(store.frequency.sum(), len(orders))
+
+
+def test_log_matches_full_build(orders):
+    # 처음 본 순서로 UID 카테고리를 붙인 증분 데이터 (증분 반영과 같은 방식)
+    chunks = np.array_split(np.arange(len(orders)), 12)
+    store = ColumnStore(orders.iloc[chunks[0]], unsorted_categories=['UID'])
+    log = RFMLog.from_orders(store.frame)
+    for rows in chunks[1:]:
+        size = len(store.frame)
+        store = store.append(orders.iloc[rows])
+        log = log.append(store.frame.iloc[size:])
+    # 비슷한 크기의 run끼리만 합치므로 run 수는 로그 규모
+    assert len(log.runs) <= 1 + np.log2(len(log.uids))
+    pd.testing.assert_frame_equal(log.scores(), RFMStore.from_orders(orders).scores())
+
+
+def test_empty_filter(orders):
+    store = RFMStore.from_orders(orders)
+    for scores in (store.subset(orders.iloc[:0]).scores(), RFMStore.from_orders(orders.iloc[:0]).scores()):
+        assert scores.empty
+        assert scores.columns.tolist() == RFM_COLUMNS
+
+
+def test_single_customer_and_missing_values(orders):
+    df = orders.iloc[:3].copy()
+    df['UID'] = pd.Categorical(['u1', None, 'u1'])
+    df['실결제 금액'] = [1000.0, 2000.0, np.nan]
+    scores = RFMStore.from_orders(df).scores()
+    # UID 결측 주문은 제외, 결제 금액 결측은 0원, 고객이 한 명이면 모든 점수 3 (중간)
+    assert scores.index.tolist() == ['u1']
+    row = scores.loc['u1']
+    assert (row['Frequency'], row['Monetary']) == (2, 1000.0)
+    assert (row['R_Score'], row['F_Score'], row['M_Score'], row['Segment']) == (3, 3, 3, 'Regular (일반)')
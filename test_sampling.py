@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import analyses
+import sampling
+from sketches import uid_hashes
+
+
+def _strata(df):
+    return df['주문일'].dt.normalize().astype(str) + '|' + df['품종'].astype(str)
+
+
+@pytest.mark.parametrize('rate', [0.001, 0.05, 0.5])
+def test_every_stratum_sampled_and_weights_sum_to_population(orders, rate):
+    ids = np.arange(len(orders))
+    positions, weights = sampling.stratified_rows(orders, ids, rate)
+    strata = _strata(orders)
+    assert set(strata.iloc[positions]) == set(strata)
+    assert weights.sum() == pytest.approx(len(orders))
+    # 층별로도 가중치 합계 = 층 크기
+    by_stratum = pd.Series(weights, index=strata.iloc[positions].to_numpy()).groupby(level=0).sum()
+    pd.testing.assert_series_equal(by_stratum, strata.value_counts().sort_index().astype(float), check_names=False)
+
+
+def test_stratified_rows_deterministic_by_original_row(orders):
+    # 같은 원본 행 번호면 필터 결과가 달라도 같은 행이 뽑힘
+    ids = np.arange(len(orders))
+    positions, _ = sampling.stratified_rows(orders, ids, 0.1)
+    again, _ = sampling.stratified_rows(orders, ids, 0.1)
+    np.testing.assert_array_equal(positions, again)
+
+
+def test_customer_rows_keep_whole_customers(orders):
+    positions = sampling.customer_rows(orders, 0.2)
+    picked = orders['UID'].iloc[positions].unique()
+    assert 0 < len(picked) < orders['UID'].nunique()
+    assert len(positions) == orders['UID'].isin(picked).sum()
+
+
+def test_repurchase_intervals_cover_exact_rates(orders):
+    exact = analyses.repurchase_rates(orders)
+    approx = sampling.repurchase_rates(orders, np.arange(len(orders)), 0.2)
+    covered = []
+    for dim, table in exact.items():
+        merged = table.merge(approx[dim], on=dim, suffixes=('', ' 표본'))
+        covered.extend((merged['재구매율(%)'] >= merged['하한(%) 표본']) & (merged['재구매율(%)'] <= merged['상한(%) 표본']))
+    # 95% 신뢰구간이므로 대부분의 값에서 정확한 비율을 포함
+    assert np.mean(covered) >= 0.9
+
+
+def test_segment_mean_intervals_cover_exact_means(orders):
+    rfm = analyses.calculate_rfm(orders)
+    hashes, _ = uid_hashes(rfm.index.to_series())
+    sample = rfm[hashes / 2 ** 64 < 0.2]
+    approx = sampling.segment_means(sample, z=1.96).set_index('Segment')
+    exact = sampling.segment_means(rfm).set_index('Segment').loc[approx.index]
+    covered = [(exact[col] - approx[col]).abs() <= approx[f'{col} ±'] for col in ('Recency', 'Frequency', 'Monetary')]
+    assert pd.concat(covered).mean() >= 0.8
+    # z를 주지 않으면 반폭 칼럼 없음
+    assert 'Recency ±' not in sampling.segment_means(sample).columns
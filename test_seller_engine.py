@@ -0,0 +1,116 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from seller_engine import SellerMonths
+
+
+def _pivot(df):
+    # 셀러 x 달력 월 주문 건수 (주문이 없는 월도 열로 포함)
+    active = df.dropna(subset=['셀러명', '주문일'])
+    month = active['주문일'].dt.to_period('M')
+    counts = active.groupby([active['셀러명'].astype(str), month]).size().unstack(fill_value=0)
+    return counts.reindex(columns=pd.period_range(month.min(), month.max(), freq='M'), fill_value=0).sort_index()
+
+
+@pytest.fixture(scope='module')
+def gapped(orders):
+    # 중간에 주문이 없는 달(2025-02)이 있는 데이터
+    return orders[orders['주문일'].dt.to_period('M') != pd.Period('2025-02', 'M')]
+
+
+@pytest.mark.parametrize('lag', [1, 3])
+def test_activity_matches_pivot(gapped, lag):
+    pivot = _pivot(gapped)
+    presence = pivot > 0
+    first = presence.idxmax(axis=1)
+    active = presence.sum()
+    new = first.value_counts().reindex(pivot.columns, fill_value=0)
+    churn = pd.Series(0.0, index=pivot.columns)
+    for i in range(lag, len(pivot.columns)):
+        prev = presence.iloc[:, i - lag]
+        churn.iloc[i] = (prev & ~presence.iloc[:, i]).sum() / prev.sum() * 100 if prev.sum() else np.nan
+
+    result = SellerMonths(gapped).activity(lag)
+    assert result['연월'].tolist() == [str(p) for p in pivot.columns]
+    np.testing.assert_array_equal(result['활동셀러수'], active.to_numpy())
+    np.testing.assert_array_equal(result['신규모집셀러'], new.to_numpy())
+    np.testing.assert_allclose(result['유입율(%)'], (new / active * 100).to_numpy())
+    np.testing.assert_allclose(result['이탈율(%)'], churn.to_numpy())
+
+
+def test_cohort_retention_uses_calendar_months(gapped):
+    pivot = _pivot(gapped)
+    presence = (pivot > 0).to_numpy()
+    first = presence.argmax(axis=1)
+    n = len(pivot.columns)
+    expected = np.full((n, n), np.nan)
+    for cohort in range(n):
+        members = presence[first == cohort]
+        for age in range(n - cohort):
+            expected[cohort, age] = members[:, cohort + age].sum() / len(members) * 100 if len(members) else np.nan
+    has_cohort = np.bincount(first, minlength=n) > 0
+
+    result = SellerMonths(gapped).cohort_retention()
+    assert result.index.tolist() == [str(p) for p in pivot.columns[has_cohort]]
+    np.testing.assert_allclose(result.to_numpy(), expected[has_cohort])
+
+
+def test_growth_matches_last_two_months(orders):
+    pivot = _pivot(orders)
+    prev, cur = pivot.iloc[:, -2], pivot.iloc[:, -1]
+    in_window = (prev + cur) > 0
+
+    growth = SellerMonths(orders).growth()
+    assert (growth['prev_m'], growth['current_m']) == (str(pivot.columns[-2]), str(pivot.columns[-1]))
+    table = growth['growth']
+    assert table.index.astype(str).tolist() == pivot.index[in_window].tolist()
+    np.testing.assert_array_equal(table['증감량'], (cur - prev)[in_window].to_numpy())
+
+
+def test_from_counts_matches_rows(gapped):
+    # SQL 백엔드처럼 (셀러, 월) 집계 행으로 만든 엔진
+    active = gapped.dropna(subset=['셀러명'])
+    month = (active['주문일'].dt.year * 12 + active['주문일'].dt.month - 1).rename('month')
+    counts = active.groupby([active['셀러명'].astype(str), month]).size().reset_index(name='orders')
+    seller_codes, sellers = pd.factorize(counts['셀러명'], sort=True)
+    from_counts = SellerMonths.from_counts(sellers, seller_codes, counts['month'].to_numpy(), counts['orders'].to_numpy())
+    engine = SellerMonths(gapped)
+
+    assert from_counts.months == engine.months
+    np.testing.assert_array_equal(from_counts.counts, engine.counts)
+
+
+def test_empty_filter(orders):
+    engine = SellerMonths(orders.iloc[:0])
+    assert engine.empty
+    assert engine.activity().empty
+    assert engine.cohort_retention().empty
+    assert engine.growth() is None
+
+
+def test_single_row_and_large_lag(orders):
+    engine = SellerMonths(orders.iloc[:1])
+    activity = engine.activity(lag=3)
+    assert activity[['활동셀러수', '신규모집셀러', '유입율(%)', '이탈율(%)']].to_numpy().tolist() == [[1, 1, 100.0, 0.0]]
+    assert engine.cohort_retention().to_numpy().tolist() == [[100.0]]
+    # 한 달뿐이면 증감 비교 불가
+    assert engine.growth() is None
+
+
+def test_missing_sellers_are_ignored(orders):
+    df = orders.copy()
+    df.loc[df.index[::5], '셀러명'] = None
+    engine = SellerMonths(df)
+    assert engine.counts.sum() == int(df['셀러명'].notna().sum())
+    np.testing.assert_array_equal(engine.counts, _pivot(df).to_numpy())
+
+
+def test_growth_for_seller_new_in_last_month(orders):
+    df = orders.iloc[:3].copy()
+    df['주문일'] = pd.to_datetime(['2025-01-10', '2025-02-10', '2025-02-11'])
+    df['셀러명'] = pd.Categorical(['가', '가', '나'])
+    table = SellerMonths(df).growth()['growth']
+    # 전월 0건인 셀러는 증감율 100%
+    assert table.loc['나', '증감율(%)'] == 100
+    assert table.loc['가', '증감량'] == 0
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import sketches
+from data_loader import PRICE_BINS, PRICE_LABELS
+from sketches import OrderSketches
+
+FILTERS = [
+    (None, None, None),
+    (['감귤', '황금향'], '2024-11-01', '2025-03-31'),
+    (['딸기'], None, None),
+]
+
+
+def _rows(df, varieties, start, end):
+    mask = df['품종'].isin(varieties) if varieties else df['품종'].notna()
+    if start is not None:
+        mask &= df['주문일'] >= pd.Timestamp(start)
+    if end is not None:
+        mask &= df['주문일'] < pd.Timestamp(end) + pd.Timedelta(days=1)
+    return df[mask]
+
+
+@pytest.mark.parametrize('varieties, start, end', FILTERS)
+def test_price_ranges_are_exact(orders, varieties, start, end):
+    rows = _rows(orders, varieties, start, end)
+    expected = pd.cut(rows['실결제 금액'], PRICE_BINS, labels=PRICE_LABELS, right=False).value_counts()
+    result = OrderSketches.from_orders(orders).price_ranges(varieties, start, end)
+    assert result['가격대'].tolist() == PRICE_LABELS
+    np.testing.assert_array_equal(result['count'], expected.reindex(PRICE_LABELS).to_numpy())
+
+
+@pytest.mark.parametrize('varieties, start, end', FILTERS)
+def test_estimates_within_error_bounds(orders, varieties, start, end):
+    rows = _rows(orders, varieties, start, end)
+    summary = OrderSketches.from_orders(orders).summary(varieties, start, end)
+
+    # HLL 표준 오차 약 0.8%, 3시그마 + 작은 값 여유
+    customers = rows['UID'].nunique()
+    assert abs(summary['고객수'] - customers) <= 0.025 * customers + 2
+
+    # 분위수는 q * (건수 - 1)번째 금액과 상대 오차 QUANTILE_ALPHA 이내
+    amounts = np.sort(rows['실결제 금액'].dropna().to_numpy())
+    for q, key in [(0.5, '결제금액 중앙값'), (0.9, '결제금액 p90')]:
+        exact = amounts[int(np.floor(q * (len(amounts) - 1)))]
+        assert summary[key] == pytest.approx(exact, rel=sketches.QUANTILE_ALPHA)
+
+
+def test_hll_estimate_large_cardinality():
+    hashes = pd.util.hash_array(np.arange(200_000, dtype=np.int64))
+    register, rho = sketches.hll_registers(hashes)
+    registers = np.zeros(1 << sketches.HLL_PRECISION, dtype=np.uint8)
+    np.maximum.at(registers, register.astype(np.int64), rho)
+    assert sketches.hll_estimate(registers) == pytest.approx(200_000, rel=0.025)
+
+
+def test_merge_matches_single_build(orders):
+    split = len(orders) // 2
+    merged = OrderSketches.from_orders(orders.iloc[:split]).merge(OrderSketches.from_orders(orders.iloc[split:]))
+    full = OrderSketches.from_orders(orders)
+    for name in ('customers', 'amounts', 'prices'):
+        pd.testing.assert_frame_equal(getattr(merged, name).reset_index(drop=True), getattr(full, name), check_dtype=False)
+
+
+def test_empty_filter_and_date_gap(orders):
+    df = orders.copy()
+    df = df[df['주문일'].dt.to_period('M') != pd.Period('2025-02', 'M')]
+    sketch = OrderSketches.from_orders(df)
+    for varieties, start, end in [(['없는품종'], None, None), (None, '2025-02-01', '2025-02-28')]:
+        summary = sketch.summary(varieties, start, end)
+        assert summary['고객수'] == 0
+        assert np.isnan(summary['결제금액 중앙값']) and np.isnan(summary['결제금액 p90'])
+        assert sketch.price_ranges(varieties, start, end)['count'].sum() == 0
+
+
+def test_single_row_and_missing_values(orders):
+    df = orders.iloc[:3].copy()
+    df['품종'] = '감귤'
+    df['UID'] = pd.Categorical(['u1', None, 'u1'])
+    df['실결제 금액'] = [12_345.0, np.nan, np.nan]
+    summary = OrderSketches.from_orders(df).summary()
+    # UID 결측은 고객 수에서, 결제 금액 결측은 분위수에서 제외
+    assert summary['고객수'] == 1
+    assert summary['결제금액 중앙값'] == pytest.approx(12_345, rel=sketches.QUANTILE_ALPHA)
+    assert summary['결제금액 p90'] == summary['결제금액 중앙값']
+
+
+def test_amount_buckets_keep_order_for_zero_and_negative():
+    values = np.array([-5000.0, -1.0, 0.0, 0.5, 1.0, 990.0, 1000.0, 1e7])
+    buckets = sketches.amount_buckets(values)
+    assert np.all(np.diff(buckets) >= 0)
+    represented = sketches.bucket_values(buckets)
+    big = np.abs(values) >= 1
+    np.testing.assert_allclose(represented[big], values[big], rtol=sketches.QUANTILE_ALPHA)
+    assert np.all(represented[~big] == 0)
@@ -0,0 +1,99 @@
+import pandas as pd
+import pytest
+
+import analyses
+import data_loader
+import order_cube
+from filter_index import FilterIndex
+
+pytest.importorskip('duckdb')
+pytest.importorskip('pyarrow')
+
+import sql_backend  # noqa: E402
+
+FILTERS = [
+    ([], None, None),
+    (['감귤', '황금향'], '2024-11-01', '2025-03-31'),
+    (['딸기'], '2025-01-01', '2025-01-31'),
+    (['없는품종'], None, None),
+    # sparse 데이터에서는 주문이 없는 기간
+    ([], '2025-02-01', '2025-02-28'),
+    ([], '2025-03-01', '2025-03-01'),
+]
+
+
+def _sparse_csv(orders_csv, path):
+    # 키 칼럼 결측과 주문이 없는 달(2025-02)이 있는 원본
+    raw = pd.read_csv(orders_csv, encoding='utf-8-sig')
+    raw = raw[~raw['주문일'].astype(str).str.startswith('2025-02')].reset_index(drop=True)
+    for col, step in [('셀러명', 9), ('주문경로', 11), ('UID', 13), ('실결제 금액', 7), ('회원구분', 17)]:
+        raw[col] = raw[col].astype(object)
+        raw.loc[raw.index[::step], col] = None
+    raw.to_csv(path, index=False, encoding='utf-8-sig')
+    return str(path)
+
+
+@pytest.fixture(scope='module', params=['synth', 'sparse'])
+def dataset(request, orders_csv, tmp_path_factory):
+    # DuckDB 백엔드는 Parquet 캐시를 읽으므로 캐시를 만든 뒤 같은 캐시로 pandas 결과도 계산
+    folder = tmp_path_factory.mktemp('sql_cache')
+    path = orders_csv if request.param == 'synth' else _sparse_csv(orders_csv, folder / 'sparse.csv')
+    cache_dir = str(folder / 'cache')
+    df = data_loader.load_dataset(path, cache_dir=cache_dir)
+    backend = sql_backend.DuckDBBackend(data_loader.cache_path(path, cache_dir), threads=1)
+    return df, FilterIndex(df), order_cube.build_cube(df), backend
+
+
+def _filtered(df, index, varieties, start, end):
+    return index.filter(df, {'품종': varieties or sorted(df['품종'].dropna().unique())}, start, end)
+
+
+@pytest.mark.parametrize('varieties, start, end', FILTERS)
+def test_kpis_and_trend_match_cube(dataset, varieties, start, end):
+    _, _, cube, backend = dataset
+    part = order_cube.slice_cube(cube, varieties, start, end)
+    assert backend.kpis(varieties, start, end) == order_cube.cube_kpis(part)
+
+    trend = order_cube.rollup(part, ['주문일', '품종'], ['주문건수', '매출액']).sort_values(['주문일', '품종'])
+    trend['품종'] = trend['품종'].astype(object)
+    pd.testing.assert_frame_equal(backend.trend(varieties, start, end), trend.reset_index(drop=True), check_dtype=False)
+
+
+@pytest.mark.parametrize('varieties, start, end', FILTERS)
+def test_analyses_match_pandas(dataset, varieties, start, end):
+    df, index, _, backend = dataset
+    sub = _filtered(df, index, varieties, start, end)
+
+    expected = analyses.repurchase_rates(sub)
+    result = backend.repurchase_rates(varieties, start, end)
+    assert result.keys() == expected.keys()
+    for dim in expected:
+        pd.testing.assert_frame_equal(result[dim], expected[dim])
+
+    pd.testing.assert_frame_equal(backend.rfm(varieties, start, end), analyses.calculate_rfm(sub), check_index_type=False)
+    pd.testing.assert_frame_equal(backend.keyword_share(varieties, start, end), analyses.keyword_share(sub))
+
+    months, expected_months = backend.seller_months(varieties, start, end), analyses.seller_months(sub)
+    assert list(months.sellers) == list(expected_months.sellers) and months.months == expected_months.months
+    assert (months.counts == expected_months.counts).all()
+    if not months.empty:
+        pd.testing.assert_frame_equal(months.activity(2), expected_months.activity(2))
+        pd.testing.assert_frame_equal(months.cohort_retention(), expected_months.cohort_retention())
+
+
+@pytest.mark.parametrize('varieties, start, end', FILTERS)
+def test_seller_analyses_match_pandas(dataset, varieties, start, end):
+    df, index, _, backend = dataset
+    sub = _filtered(df, index, varieties, start, end)
+
+    expected, result = analyses.seller_channel(sub), backend.seller_channel(varieties, start, end)
+    assert result['top_sellers'] == expected['top_sellers']
+    pd.testing.assert_frame_equal(result['seller_channel'], expected['seller_channel'])
+    pd.testing.assert_frame_equal(result['pivot'], expected['pivot'])
+
+    pd.testing.assert_frame_equal(backend.seller_keywords(varieties, start, end), analyses.seller_keywords(sub))
+
+
+def test_top_sellers_ties_by_name():
+    counts = pd.Series([3, 5, 3, 5], index=['가', '나', '다', '라'])
+    assert analyses.top_sellers(counts, 3) == ['나', '라', '가']
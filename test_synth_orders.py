@@ -0,0 +1,41 @@
+import pytest
+
+import synth_orders
+
+
+@pytest.fixture(scope='module')
+def synth():
+    return synth_orders.generate_orders(60_000, seed=11)
+
+
+def test_variety_shares_follow_varieties(synth):
+    shares = synth['품종'].value_counts(normalize=True)
+    total = sum(synth_orders.VARIETIES.values())
+    for variety, weight in synth_orders.VARIETIES.items():
+        assert shares[variety] == pytest.approx(weight / total, abs=0.01)
+
+
+def test_products_belong_to_their_variety(synth):
+    # 상품 하나는 한 품종에만 속하고, 상품명에 품종 이름이 들어감
+    assert (synth.groupby('상품코드')['품종'].nunique() == 1).all()
+    named = synth.dropna(subset=['상품명'])
+    assert all(v.split(',')[0] in name for v, name in zip(named['품종'], named['상품명']))
+
+
+def test_options_and_districts_filled(synth):
+    options = synth['고객선택옵션'].value_counts(normalize=True, dropna=False)
+    assert options[None] == pytest.approx(synth_orders.CUSTOMER_OPTIONS[None], abs=0.02)
+    assert set(synth['고객선택옵션'].dropna()) <= set(synth_orders.CUSTOMER_OPTIONS)
+
+    assert synth['시군구'].notna().all() and (synth['시군구'] != '').all()
+    for region, districts in synth.groupby('광역지역(정식)')['시군구'].unique().items():
+        assert set(districts) <= set(synth_orders.DISTRICTS[region])
+    prefixes = synth['광역지역(정식)'] + ' ' + synth['시군구']
+    assert all(address.startswith(prefix) for address, prefix in zip(synth['배송지 주소'], prefixes))
+
+
+def test_repeat_count_is_prior_orders(synth):
+    expected = synth.groupby('UID').cumcount()
+    repeat = synth['재구매 횟수']
+    known = repeat.notna()
+    assert (repeat[known].astype(int) == expected[known]).all()
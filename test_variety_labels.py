@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+from variety_labels import VarietyLabels, by_label, split_labels
+
+
+def _exploded(df):
+    # 콤보 값을 품종마다 한 행으로 펼친 참조 데이터 (주문 행 복제)
+    out = df.assign(품종=df['품종'].astype(object).map(lambda v: list(split_labels(v)))).explode('품종')
+    return out.dropna(subset=['품종'])
+
+
+def test_split_labels():
+    assert split_labels('감귤, 황금향') == ('감귤', '황금향')
+    assert split_labels(' 감귤 ,, 감귤 ') == ('감귤',)
+    assert split_labels(np.nan) == ()
+
+
+def test_values_with_matches_split_labels(orders):
+    incidence = VarietyLabels.from_series(orders['품종'])
+    values = orders['품종'].dropna().astype(object).unique()
+    for labels in (['황금향'], ['감귤', '딸기'], ['없는품종']):
+        expected = sorted(v for v in values if set(split_labels(v)) & set(labels))
+        assert incidence.values_with(labels) == expected
+
+
+def test_by_label_matches_exploded_groupby(orders):
+    table = orders.groupby([orders['주문일'].dt.normalize(), '품종'], observed=True).agg(
+        주문건수=('UID', 'size'), 매출액=('실결제 금액', 'sum')).reset_index()
+    result = by_label(table, ['주문건수', '매출액'])
+
+    exploded = _exploded(orders).assign(주문일=lambda d: d['주문일'].dt.normalize())
+    expected = exploded.groupby(['주문일', '품종']).agg(주문건수=('UID', 'size'), 매출액=('실결제 금액', 'sum'))
+    result = result.assign(품종=result['품종'].astype(object)).set_index(['주문일', '품종']).sort_index()
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_by_label_keeps_selected_labels(orders):
+    table = orders.groupby('품종', observed=True).size().reset_index(name='주문건수')
+    result = by_label(table, ['주문건수'], labels=['황금향'])
+    exploded = _exploded(orders)
+    assert result['품종'].tolist() == ['황금향']
+    assert result['주문건수'].tolist() == [int((exploded['품종'] == '황금향').sum())]
+
+
+def test_empty_table_and_selection(orders):
+    table = orders.groupby('품종', observed=True).size().reset_index(name='주문건수')
+    empty = by_label(table.iloc[:0], ['주문건수'])
+    assert empty.empty and empty.columns.tolist() == ['품종', '주문건수']
+    incidence = VarietyLabels.from_series(orders['품종'])
+    assert incidence.values_with([]) == []
+    assert VarietyLabels([]).sum_by_label([]).tolist() == []
+
+
+def test_missing_and_blank_values():
+    table = pd.DataFrame({
+        '품종': pd.Categorical(['감귤, 황금향', None, ' , ', '황금향', '감귤,감귤']),
+        '주문건수': [1, 2, 4, 8, 16],
+    })
+    result = by_label(table, ['주문건수']).set_index('품종')['주문건수']
+    # 결측/빈 항목뿐인 값은 빠지고, 한 값 안의 중복 품종은 한 번만
+    assert result.to_dict() == {'감귤': 17, '황금향': 9}
+    incidence = VarietyLabels.from_series(table['품종'])
+    assert incidence.values_with(['감귤']) == ['감귤, 황금향', '감귤,감귤']
+    np.testing.assert_array_equal(incidence.value_codes(table['품종'].astype(object)), [1, -1, 0, 3, 2])
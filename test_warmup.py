@@ -0,0 +1,140 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from result_cache import ResultCache
+from warmup import WarmupScheduler
+
+
+@pytest.fixture
+def scheduler():
+    # 작업자 1개를 막아 두어 이후 작업이 대기(queued) 상태로 남게 함
+    gate = threading.Event()
+    warmup = WarmupScheduler(ResultCache(1 << 20), workers=1)
+    warmup.submit('blocker', 'block', {'wait': (gate.wait, ())})
+    yield warmup
+    gate.set()
+    warmup._pool.shutdown(wait=True)
+
+
+def test_other_session_does_not_cancel(scheduler):
+    scheduler.submit('a', 'k1', {'n': (lambda: 1, ())})
+    scheduler.submit('b', 'k2', {'n': (lambda: 2, ())})
+    assert scheduler.status('k1', ['n']) == {'n': 'queued'}
+    assert scheduler.status('k2', ['n']) == {'n': 'queued'}
+
+
+def test_same_session_cancels_previous_key(scheduler):
+    scheduler.submit('a', 'k1', {'n': (lambda: 1, ())})
+    scheduler.submit('a', 'k2', {'n': (lambda: 2, ())})
+    assert scheduler.status('k1', ['n']) == {'n': None}
+    assert scheduler.status('k2', ['n']) == {'n': 'queued'}
+
+
+def test_key_still_wanted_by_another_session_is_kept(scheduler):
+    scheduler.submit('a', 'k1', {'n': (lambda: 1, ())})
+    scheduler.submit('b', 'k1', {'n': (lambda: 1, ())})
+    scheduler.submit('a', 'k2', {'n': (lambda: 2, ())})
+    assert scheduler.status('k1', ['n']) == {'n': 'queued'}
+
+
+def test_expired_session_releases_queued_jobs(scheduler):
+    scheduler.session_ttl = 0
+    scheduler.submit('a', 'k1', {'n': (lambda: 1, ())})
+    # 다른 세션이 예약하는 시점에 'a'는 만료되어 잊히고, 'a'만 기다리던 대기 작업은 취소됨
+    scheduler.submit('b', 'k2', {'n': (lambda: 2, ())})
+    assert 'a' not in scheduler._sessions
+    assert scheduler.status('k1', ['n']) == {'n': None}
+
+
+def test_end_session_cancels_queued_jobs(scheduler):
+    scheduler.submit('a', 'k1', {'n': (lambda: 1, ())})
+    scheduler.end_session('a')
+    assert scheduler._sessions.keys() == {'blocker'}
+    assert scheduler.status('k1', ['n']) == {'n': None}
+
+
+def test_warm_once_and_not_cancelled_by_sessions(scheduler):
+    assert scheduler.warm('default', {'n': (lambda: 1, ()), 'm': (lambda: 2, ())})
+    assert not scheduler.warm('default', {'n': (lambda: 1, ())})
+    scheduler.submit('a', 'default', {})
+    scheduler.submit('a', 'k2', {})
+    scheduler.end_session('a')
+    assert scheduler.status('default', ['n', 'm']) == {'n': 'queued', 'm': 'queued'}
+
+
+def test_empty_tasks_and_unknown_key(scheduler):
+    scheduler.submit('a', 'k1', {})
+    assert scheduler.status('k1', ['n']) == {'n': None}
+    assert scheduler.status('none', []) == {}
+
+
+def test_failed_and_finished_jobs():
+    warmup = WarmupScheduler(ResultCache(1 << 20), workers=1)
+
+    def fail():
+        raise ValueError('x')
+
+    warmup.submit('a', 'k', {'ok': (lambda: 1, ()), 'bad': (fail, ())})
+    warmup._pool.shutdown(wait=True)
+    assert warmup.status('k', ['ok', 'bad']) == {'ok': 'done', 'bad': 'failed'}
+    # 이미 계산된 분석은 다시 예약하지 않음
+    warmup.cache.clear()
+    warmup.cache.put('ok', 'k', 1)
+    warmup._jobs.clear()
+    warmup._schedule('k', {'ok': (lambda: 2, ())})
+    assert warmup._jobs == {}
+
+
+def test_pinned_keys_are_bounded(scheduler):
+    for i in range(6):
+        scheduler.warm(f'v{i}', {'n': (lambda: 1, ())})
+    # 가장 오래된 기본 키부터 잊고, 잊힌 키의 대기 작업은 다음 정리 때 취소
+    assert list(scheduler._pinned) == ['v2', 'v3', 'v4', 'v5']
+    scheduler.end_session('nobody')
+    assert scheduler.status('v0', ['n']) == {'n': None}
+    assert scheduler.status('v5', ['n']) == {'n': 'queued'}
+    # 잊힌 키는 다시 warm할 수 있음
+    assert scheduler.warm('v0', {'n': (lambda: 1, ())})
+
+
+def test_filter_change_queues_only_visible_section(orders_csv, tmp_path, monkeypatch):
+    app_test = pytest.importorskip('streamlit.testing.v1')
+    import streamlit as st
+
+    import data_loader
+    import settings
+
+    # 같은 프로세스의 다른 앱 테스트가 기본 필터를 이미 미리 계산했을 수 있으므로 공유 자원을 비우고 시작
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    monkeypatch.setattr(settings, 'DATA_PATH', orders_csv)
+    monkeypatch.setattr(data_loader, 'CACHE_DIR', str(tmp_path / 'cache'))
+    submitted, warmed = [], []
+    submit, warm = WarmupScheduler.submit, WarmupScheduler.warm
+
+    def record_submit(self, session, key, tasks):
+        submitted.append(set(tasks))
+        return submit(self, session, key, tasks)
+
+    def record_warm(self, key, tasks):
+        scheduled = warm(self, key, tasks)
+        if scheduled:
+            warmed.append(set(tasks))
+        return scheduled
+
+    monkeypatch.setattr(WarmupScheduler, 'submit', record_submit)
+    monkeypatch.setattr(WarmupScheduler, 'warm', record_warm)
+
+    at = app_test.AppTest.from_file(str(Path(__file__).with_name('dashboard_app.py')), default_timeout=120)
+    at.run()
+    assert not at.exception
+    # 기본 필터 화면만 모든 분석을 한 번 미리 계산
+    assert len(warmed) == 1 and len(warmed[0]) == 7
+
+    at.radio(key='section').set_value('🔍 키워드 매출 분석').run()
+    at.sidebar.multiselect[0].set_value(['감귤']).run()
+    assert not at.exception
+    assert len(warmed) == 1
+    assert submitted[-1] == {'keyword_share'}
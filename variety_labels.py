@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+# 품종 칼럼의 다중 라벨 해석: '감귤, 황금향' 같은 값은 감귤과 황금향 두 품종의 주문
+# 주문 x 단일 품종 소속 행렬을 (주문 -> 품종 값 코드) x (품종 값 -> 단일 품종, CSR) 두 단계로 표현
+# - 주문 -> 품종 값 코드는 전처리 결과의 category 코드를 그대로 사용 (행을 품종 수만큼 복제하지 않음)
+# - 품종 값 x 단일 품종 행렬은 품종 값(카테고리) 수만큼만 있으므로 콤보가 수백 개여도 작음
+# 필터는 "선택한 품종을 포함하는 품종 값" 목록으로 바꿔 기존 역색인/큐브/SQL 조건에 그대로 넘기고,
+# 품종별 집계는 품종 값별 집계표에 소속 행렬을 곱해(희소 행렬 곱) 단일 품종별로 바꿉니다.
+
+SEPARATOR = ','
+# 다중 라벨로 해석하는 칼럼
+MULTI_LABEL_DIMS = ['품종']
+
+
+def split_labels(value):
+    """품종 값 -> 단일 품종 tuple (앞뒤 공백 제거, 빈 항목/중복 제외, 등장 순서 유지)."""
+    if pd.isna(value):
+        return ()
+    return tuple(dict.fromkeys(part.strip() for part in str(value).split(SEPARATOR) if part.strip()))
+
+
+class VarietyLabels:
+    """품종 값(콤보 포함) x 단일 품종 소속 행렬 (CSR).
+
+    품종 값 values[i]에 속한 단일 품종 코드가 indices[indptr[i]:indptr[i + 1]]에 있고, labels[코드]가 품종 이름입니다.
+    """
+
+    def __init__(self, values):
+        self.values = pd.Index(values)
+        parsed = [split_labels(v) for v in self.values]
+        self.labels = pd.Index(sorted({label for labels in parsed for label in labels}))
+        self.indptr = np.zeros(len(parsed) + 1, dtype=np.int64)
+        np.cumsum([len(labels) for labels in parsed], out=self.indptr[1:])
+        self.indices = self.labels.get_indexer([label for labels in parsed for label in labels]).astype(np.int64)
+
+    @classmethod
+    def from_series(cls, series):
+        """품종 칼럼 -> 소속 행렬. category이면 카테고리를 그대로 품종 값으로 사용합니다."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return cls(series.cat.categories)
+        return cls(pd.Index(series.dropna().unique()).sort_values())
+
+    def _value_of_entry(self):
+        # 소속 행렬의 0이 아닌 원소별 품종 값 번호
+        return np.repeat(np.arange(len(self.values)), np.diff(self.indptr))
+
+    def values_with(self, labels):
+        """labels(단일 품종) 중 하나라도 포함하는 품종 값 목록 (품종 값 순서)."""
+        codes = self.labels.get_indexer(list(labels))
+        wanted = np.zeros(len(self.labels), dtype=bool)
+        wanted[codes[codes >= 0]] = True
+        hit = np.zeros(len(self.values), dtype=bool)
+        hit[self._value_of_entry()[wanted[self.indices]]] = True
+        return self.values[hit].tolist()
+
+    def sum_by_label(self, weights):
+        """품종 값별 값(배열) -> 단일 품종별 합계 (콤보 값은 포함된 품종마다 더함)."""
+        weights = np.asarray(weights, dtype=np.float64)
+        return np.bincount(self.indices, weights=weights[self._value_of_entry()], minlength=len(self.labels))
+
+    def value_codes(self, series):
+        """품종 칼럼 -> 품종 값 번호 배열 (결측/없는 값은 -1)."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            mapped = self.values.get_indexer(series.cat.categories)
+            return np.where(codes >= 0, mapped[codes], -1)
+        return self.values.get_indexer(series)
+
+
+def by_label(table, measures, column='품종', labels=None):
+    """품종 값별 집계표 -> 단일 품종별 집계표.
+
+    measures를 제외한 나머지 칼럼(예: 주문일, 시즌)은 그대로 묶음 키로 쓰고, 콤보 값의 행은 포함된 품종마다 더합니다.
+    집계된 표의 행만 품종 수만큼 펼치므로 주문 행은 복제하지 않습니다. labels가 주어지면 그 품종만 남깁니다.
+    """
+    measures = list(measures)
+    keys = [c for c in table.columns if c != column and c not in measures]
+    incidence = VarietyLabels.from_series(table[column])
+    codes = incidence.value_codes(table[column])
+    valid = np.flatnonzero(codes >= 0)
+    lengths = np.diff(incidence.indptr)[codes[valid]]
+    starts = incidence.indptr[codes[valid]]
+    # 행별 [start, start + length) 구간을 이어 붙인 소속 행렬 위치
+    positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+    rows = np.repeat(valid, lengths)
+    label_codes = incidence.indices[positions]
+    if labels:
+        keep = np.isin(label_codes, incidence.labels.get_indexer(list(labels)))
+        rows, label_codes = rows[keep], label_codes[keep]
+    out = table.iloc[rows][keys + measures].reset_index(drop=True)
+    out.insert(len(keys), column, pd.Categorical.from_codes(label_codes, incidence.labels))
+    out = out.groupby(keys + [column], observed=True, sort=False)[measures].sum().reset_index()
+    # 품종 칼럼이 원래 위치에 오도록 칼럼 순서를 맞춤
+    return out[[c for c in table.columns if c in out.columns]]
@@ -0,0 +1,103 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# 필터 결과별 분석을 백그라운드 스레드 풀에서 미리 계산해 ResultCache에 넣는 스케줄러
+# - 분석마다 별도 작업이므로 느린 분석이 다른 분석(화면)을 막지 않음
+# - 화면이 같은 (분석, 필터 키)를 요청하면 ResultCache가 계산 중인 결과를 기다리므로 중복 계산하지 않음
+# - 프로세스 풀 대신 스레드를 쓰는 이유: 공유 데이터셋을 복사/직렬화하지 않고 그대로 읽음
+#   (pandas/numpy 집계는 대부분 GIL을 놓고 실행됨)
+
+
+class WarmupScheduler:
+    """분석 작업을 (분석 이름, 필터 키) 단위로 예약하고 진행 상태를 알려줍니다.
+
+    session_ttl: 이 시간(초) 동안 예약이 없던 세션은 끝난 것으로 보고 잊음 (대기 작업도 취소)
+    pinned_keys: warm()으로 예약한 기본 필터 키를 기억하는 개수 (데이터 버전마다 한 번만 예약)
+    """
+
+    def __init__(self, cache, workers, session_ttl=600, pinned_keys=4):
+        self.cache = cache
+        self.session_ttl = session_ttl
+        self.pinned_keys = pinned_keys
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='warmup')
+        self._lock = threading.Lock()
+        # (name, key) -> Future
+        self._jobs = {}
+        # 세션 id -> (그 세션이 마지막으로 예약한 필터 키, 예약 시각)
+        self._sessions = {}
+        # warm()으로 예약한 필터 키 (세션과 무관하게 끝까지 계산, 오래된 것부터 잊음)
+        self._pinned = OrderedDict()
+
+    def warm(self, key, tasks):
+        """세션과 무관하게 tasks를 한 번만 예약합니다. (기본 필터 화면 준비용) 이미 예약한 키면 False."""
+        with self._lock:
+            if key in self._pinned:
+                return False
+            self._pinned[key] = True
+            while len(self._pinned) > self.pinned_keys:
+                self._pinned.popitem(last=False)
+            self._schedule(key, tasks)
+        return True
+
+    def submit(self, session, key, tasks):
+        """tasks: {분석 이름: (함수, 인자 tuple)}. 캐시에 없고 아직 예약되지 않은 분석만 예약합니다.
+
+        같은 세션이 이전에 예약한 필터 키의 작업 중 아직 시작하지 않은 것은 취소합니다.
+        다른 세션이 지금 보고 있는 필터 키와 warm()으로 예약한 키의 작업은 취소하지 않습니다.
+        """
+        with self._lock:
+            self._sessions[session] = (key, time.monotonic())
+            self._release()
+            self._schedule(key, tasks)
+
+    def end_session(self, session):
+        """세션을 잊고, 그 세션만 기다리던 대기 작업을 취소합니다."""
+        with self._lock:
+            self._sessions.pop(session, None)
+            self._release()
+
+    def _release(self):
+        # 만료된 세션을 지우고, 어느 세션도 보고 있지 않은 필터 키의 대기 작업을 취소 (lock 안에서 호출)
+        expired = time.monotonic() - self.session_ttl
+        for session, (_, seen) in list(self._sessions.items()):
+            if seen < expired:
+                del self._sessions[session]
+        wanted = {key for key, _ in self._sessions.values()} | set(self._pinned)
+        for job_key, job in list(self._jobs.items()):
+            if job.done() or (job_key[1] not in wanted and job.cancel()):
+                del self._jobs[job_key]
+
+    def _schedule(self, key, tasks):
+        for name, (func, args) in tasks.items():
+            if (name, key) in self._jobs or self.cache.status(name, key) is not None:
+                continue
+            self._jobs[(name, key)] = self._pool.submit(self._run, name, key, func, args)
+
+    def _run(self, name, key, func, args):
+        try:
+            self.cache.get_or_compute(name, key, func, *args)
+        except Exception:
+            # 실패한 분석은 화면에서 다시 계산할 때 오류가 표시됨
+            logger.warning('미리 계산 실패: %s', name, exc_info=True)
+            raise
+
+    def status(self, key, names):
+        """분석 이름별 상태: 'done', 'running', 'queued', 'failed' 또는 None(예약되지 않음)."""
+        out = {}
+        with self._lock:
+            for name in names:
+                job = self._jobs.get((name, key))
+                if self.cache.status(name, key) == 'cached':
+                    out[name] = 'done'
+                elif job is None:
+                    out[name] = 'running' if self.cache.status(name, key) == 'running' else None
+                elif job.done():
+                    out[name] = 'failed' if not job.cancelled() and job.exception() is not None else None
+                else:
+                    out[name] = 'running' if job.running() else 'queued'
+        return out